@@ -0,0 +1,28 @@
+"""add metrics_daily (entity_type, date) index for trending window scans
+
+Revision ID: 202610170001
+Revises: 202410150001
+Create Date: 2026-10-17 00:01:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "202610170001"
+down_revision: Union[str, None] = "202410150001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_metrics_daily_type_date",
+        "metrics_daily",
+        ["entity_type", "date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_metrics_daily_type_date", table_name="metrics_daily")
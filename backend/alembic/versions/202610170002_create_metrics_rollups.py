@@ -0,0 +1,108 @@
+"""create weekly, monthly and lifetime metrics rollups
+
+Revision ID: 202610170002
+Revises: 202610170001
+Create Date: 2026-10-17 00:02:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "202610170002"
+down_revision: Union[str, None] = "202610170001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+WEEKLY_TABLE = "metrics_weekly"
+MONTHLY_TABLE = "metrics_monthly"
+LIFETIME_TABLE = "metrics_lifetime"
+
+
+def _period_table(name: str, period_column: str, constraint: str) -> None:
+    metric_entity_type = postgresql.ENUM(name="metric_entity_type", create_type=False)
+    op.create_table(
+        name,
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("entity_type", metric_entity_type, nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column(period_column, sa.Date(), nullable=False),
+        sa.Column("views", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("clicks", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+            server_onupdate=sa.func.now(),
+        ),
+        sa.UniqueConstraint("entity_type", "entity_id", period_column, name=constraint),
+    )
+    op.create_index(f"ix_{name}_id", name, ["id"])
+
+
+def upgrade() -> None:
+    _period_table(WEEKLY_TABLE, "week_start", "uq_metric_weekly_entity_week")
+    op.create_index("ix_metrics_weekly_type_week", WEEKLY_TABLE, ["entity_type", "week_start"])
+    _period_table(MONTHLY_TABLE, "month_start", "uq_metric_monthly_entity_month")
+    op.create_index("ix_metrics_monthly_type_month", MONTHLY_TABLE, ["entity_type", "month_start"])
+
+    op.create_table(
+        LIFETIME_TABLE,
+        sa.Column(
+            "entity_type",
+            postgresql.ENUM(name="metric_entity_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("views", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("clicks", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+            server_onupdate=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("entity_type", "entity_id"),
+    )
+
+    # Backfill the rollups from existing daily rows; date_trunc('week') starts on Monday.
+    op.execute(
+        """
+        INSERT INTO metrics_weekly (entity_type, entity_id, week_start, views, clicks)
+        SELECT entity_type, entity_id, date_trunc('week', date)::date, sum(views), sum(clicks)
+        FROM metrics_daily
+        GROUP BY entity_type, entity_id, date_trunc('week', date)::date
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO metrics_monthly (entity_type, entity_id, month_start, views, clicks)
+        SELECT entity_type, entity_id, date_trunc('month', date)::date, sum(views), sum(clicks)
+        FROM metrics_daily
+        GROUP BY entity_type, entity_id, date_trunc('month', date)::date
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO metrics_lifetime (entity_type, entity_id, views, clicks)
+        SELECT entity_type, entity_id, sum(views), sum(clicks)
+        FROM metrics_daily
+        GROUP BY entity_type, entity_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(LIFETIME_TABLE)
+    op.drop_index("ix_metrics_monthly_type_month", table_name=MONTHLY_TABLE)
+    op.drop_index(f"ix_{MONTHLY_TABLE}_id", table_name=MONTHLY_TABLE)
+    op.drop_table(MONTHLY_TABLE)
+    op.drop_index("ix_metrics_weekly_type_week", table_name=WEEKLY_TABLE)
+    op.drop_index(f"ix_{WEEKLY_TABLE}_id", table_name=WEEKLY_TABLE)
+    op.drop_table(WEEKLY_TABLE)
@@ -0,0 +1,40 @@
+"""add denormalised view/click counters to collections and platforms
+
+Revision ID: 202610170003
+Revises: 202610170002
+Create Date: 2026-10-17 00:03:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "202610170003"
+down_revision: Union[str, None] = "202610170002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTER_TABLES = {"collections": "collection", "platforms": "platform"}
+
+
+def upgrade() -> None:
+    for table, entity_type in COUNTER_TABLES.items():
+        op.add_column(table, sa.Column("view_count", sa.Integer(), nullable=False, server_default=sa.text("0")))
+        op.add_column(table, sa.Column("click_count", sa.Integer(), nullable=False, server_default=sa.text("0")))
+        op.execute(
+            f"""
+            UPDATE {table} AS target
+            SET view_count = lifetime.views, click_count = lifetime.clicks
+            FROM metrics_lifetime AS lifetime
+            WHERE lifetime.entity_type = '{entity_type}' AND lifetime.entity_id = target.id
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in COUNTER_TABLES:
+        op.drop_column(table, "click_count")
+        op.drop_column(table, "view_count")
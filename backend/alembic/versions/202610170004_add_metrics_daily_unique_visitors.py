@@ -0,0 +1,28 @@
+"""add unique_visitors to metrics_daily
+
+Revision ID: 202610170004
+Revises: 202610170003
+Create Date: 2026-10-17 00:04:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "202610170004"
+down_revision: Union[str, None] = "202610170003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "metrics_daily",
+        sa.Column("unique_visitors", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("metrics_daily", "unique_visitors")
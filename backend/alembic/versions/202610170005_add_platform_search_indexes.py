@@ -0,0 +1,92 @@
+"""add platform full-text search document and trigram index
+
+Revision ID: 202610170005
+Revises: 202610170004
+Create Date: 2026-10-17 00:05:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "202610170005"
+down_revision: Union[str, None] = "202610170004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce({row}name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}description, '')), 'B')"
+)
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    # Kept online: a nullable column without a default is a catalog-only change,
+    # and the trigger plus batched backfill replace a generated column, whose
+    # ADD COLUMN would rewrite platforms under an ACCESS EXCLUSIVE lock. The
+    # trigger only fires on name/description changes, so counter updates skip it.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("platforms", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION platforms_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+          NEW.search_vector := {SEARCH_DOCUMENT.format(row="NEW.")};
+          RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER platforms_search_vector_update
+        BEFORE INSERT OR UPDATE OF name, description ON platforms
+        FOR EACH ROW EXECUTE FUNCTION platforms_search_vector_update()
+        """
+    )
+
+    # Backfill and build the indexes without blocking writes; this needs to run
+    # outside the migration transaction, one short transaction per batch.
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        last_id = 0
+        max_id = connection.execute(sa.text("SELECT coalesce(max(id), 0) FROM platforms")).scalar_one()
+        while last_id < max_id:
+            connection.execute(
+                sa.text(
+                    f"UPDATE platforms SET search_vector = {SEARCH_DOCUMENT.format(row='')} "
+                    "WHERE id > :start AND id <= :stop AND search_vector IS NULL"
+                ),
+                {"start": last_id, "stop": last_id + BACKFILL_BATCH_SIZE},
+            )
+            last_id += BACKFILL_BATCH_SIZE
+
+        op.create_index(
+            "ix_platforms_search_vector",
+            "platforms",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_platforms_name_trgm",
+            "platforms",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_platforms_name_trgm", table_name="platforms", postgresql_concurrently=True)
+        op.drop_index("ix_platforms_search_vector", table_name="platforms", postgresql_concurrently=True)
+    op.execute("DROP TRIGGER IF EXISTS platforms_search_vector_update ON platforms")
+    op.execute("DROP FUNCTION IF EXISTS platforms_search_vector_update()")
+    op.drop_column("platforms", "search_vector")
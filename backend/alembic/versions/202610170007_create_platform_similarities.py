@@ -0,0 +1,47 @@
+"""create platform_similarities
+
+Revision ID: 202610170007
+Revises: 202610170006
+Create Date: 2026-10-17 00:07:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "202610170007"
+down_revision: Union[str, None] = "202610170006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "platform_similarities",
+        sa.Column(
+            "platform_id",
+            sa.Integer(),
+            sa.ForeignKey("platforms.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "similar_platform_id",
+            sa.Integer(),
+            sa.ForeignKey("platforms.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("rank", sa.SmallInteger(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+    )
+    op.create_index(
+        "ix_platform_similarities_platform_rank",
+        "platform_similarities",
+        ["platform_id", "rank"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_platform_similarities_platform_rank", table_name="platform_similarities")
+    op.drop_table("platform_similarities")
@@ -4,7 +4,7 @@ from typing import Optional
 from fastapi import Header, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
-from app.core.security import decode_admin_token
+from app.core.security import decode_admin_token, is_partner_token
 from app.db.session import SessionLocal
 
 
@@ -32,3 +32,13 @@ def get_current_admin(
         )
 
     return decode_admin_token(token)
+
+
+def get_export_client(
+    request: Request, authorization: Optional[str] = Header(default=None)
+) -> str:
+    """Catalog exports accept a partner token (``PARTNER_API_TOKENS``) or an admin session."""
+    if authorization and authorization.lower().startswith("bearer "):
+        if is_partner_token(authorization.split(" ", maxsplit=1)[1]):
+            return "partner"
+    return get_current_admin(request, authorization)
@@ -1,10 +1,12 @@
 from fastapi import APIRouter
 
-from app.api.v1 import admin, analytics, collections, platforms, submissions
+from app.api.v1 import admin, analytics, collections, platforms, search, submissions, taxonomy
 
 api_router = APIRouter()
 api_router.include_router(collections.router)
 api_router.include_router(platforms.router)
+api_router.include_router(taxonomy.router)
+api_router.include_router(search.router)
 api_router.include_router(submissions.router)
 api_router.include_router(admin.router)
 api_router.include_router(analytics.router)
@@ -5,8 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException, Response, status
 from app.api.dependencies import get_current_admin
 from app.core.config import get_settings
 from app.core.security import create_admin_token
-from app.schemas.admin import AdminLoginRequest, AdminSession
+from app.schemas.admin import AdminLoginRequest, AdminSession, ResponseCacheStats, SchedulerStatus
 from app.schemas.common import ApiResponse
+from app.services.analytics import analytics
+from app.services.response_cache import response_cache
 
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -50,3 +52,22 @@ def admin_logout(response: Response) -> ApiResponse[None]:
 @router.get("/me", response_model=ApiResponse[AdminSession])
 def admin_me(current_admin: str = Depends(get_current_admin)) -> ApiResponse[AdminSession]:
     return ApiResponse(data=AdminSession(username=current_admin))
+
+
+@router.get(
+    "/scheduler",
+    response_model=ApiResponse[SchedulerStatus],
+    dependencies=[Depends(get_current_admin)],
+)
+async def scheduler_status() -> ApiResponse[SchedulerStatus]:
+    status_payload = await analytics.scheduler.status()
+    return ApiResponse(data=SchedulerStatus(**status_payload))
+
+
+@router.get(
+    "/cache",
+    response_model=ApiResponse[ResponseCacheStats],
+    dependencies=[Depends(get_current_admin)],
+)
+def response_cache_stats() -> ApiResponse[ResponseCacheStats]:
+    return ApiResponse(data=ResponseCacheStats(**response_cache.stats()))
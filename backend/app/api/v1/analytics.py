@@ -1,9 +1,20 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from typing import Any, Dict, List, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import ValidationError
 
 from app.api.dependencies import get_current_admin
-from app.schemas.analytics import AnalyticsDashboard, AnalyticsEvent
+from app.core.config import get_settings
+from app.schemas.analytics import (
+    AnalyticsConsumerStats,
+    AnalyticsDashboard,
+    AnalyticsEvent,
+    AnalyticsEventBatchResult,
+    AnalyticsEventRejection,
+    TrendingEntity,
+)
 from app.schemas.common import ApiResponse
 from app.services.analytics import analytics
 
@@ -16,6 +27,47 @@ async def log_event(payload: AnalyticsEvent) -> ApiResponse[None]:
     return ApiResponse(message="이벤트가 큐에 저장되었습니다.")
 
 
+@router.post(
+    "/events:batch",
+    response_model=ApiResponse[AnalyticsEventBatchResult],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def log_events_batch(payload: List[Any]) -> ApiResponse[AnalyticsEventBatchResult]:
+    max_events = get_settings().analytics_batch_max_events
+    if len(payload) > max_events:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 최대 {max_events}개의 이벤트만 전송할 수 있습니다.",
+        )
+
+    accepted: List[Dict[str, Any]] = []
+    rejected: List[AnalyticsEventRejection] = []
+    for index, item in enumerate(payload):
+        try:
+            event = AnalyticsEvent.model_validate(item)
+        except ValidationError as exc:
+            rejected.append(AnalyticsEventRejection(index=index, message=_format_validation_error(exc)))
+            continue
+        accepted.append(event.model_dump())
+
+    await analytics.enqueue_events(accepted)
+    result = AnalyticsEventBatchResult(accepted=len(accepted), rejected=rejected)
+    return ApiResponse(message=f"{len(accepted)}개의 이벤트가 큐에 저장되었습니다.", data=result)
+
+
+@router.get("/trending", response_model=ApiResponse[List[TrendingEntity]])
+async def get_trending(
+    entity_type: Literal["collection", "platform"] = Query(default="collection"),
+    limit: int = Query(default=10, ge=1, le=100),
+) -> ApiResponse[List[TrendingEntity]]:
+    ranking = await analytics.get_trending(entity_type, limit)
+    items = [
+        TrendingEntity(entity_type=entity_type, entity_id=entity_id, score=score)
+        for entity_id, score in ranking
+    ]
+    return ApiResponse(data=items)
+
+
 @router.get(
     "/dashboard",
     response_model=ApiResponse[AnalyticsDashboard],
@@ -24,3 +76,20 @@ async def log_event(payload: AnalyticsEvent) -> ApiResponse[None]:
 async def get_dashboard(days: int = 14, top_limit: int = 5) -> ApiResponse[AnalyticsDashboard]:
     dashboard = await analytics.get_dashboard(days=days, top_limit=top_limit)
     return ApiResponse(data=dashboard)
+
+
+@router.get(
+    "/consumer",
+    response_model=ApiResponse[AnalyticsConsumerStats],
+    dependencies=[Depends(get_current_admin)],
+)
+async def get_consumer_stats() -> ApiResponse[AnalyticsConsumerStats]:
+    stats = AnalyticsConsumerStats(**await analytics.get_consumer_stats())
+    return ApiResponse(data=stats)
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'event'}: {error['msg']}"
+        for error in exc.errors()
+    )
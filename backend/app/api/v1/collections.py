@@ -1,61 +1,95 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import hashlib
+from typing import Dict, List, Optional, Sequence, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import Row, Select, func, select
+from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_current_admin, get_db
+from app.api.dependencies import get_current_admin, get_db, get_export_client
+from app.core.http import (
+    is_not_modified,
+    json_response,
+    ndjson_response,
+    not_modified_response,
+    validator_headers,
+)
+from app.db.loaders import LoaderProfile, collection_options
 from app.db.models import Collection, CollectionPlatform, Platform
 from app.schemas.collection import (
+    CollectionCard,
     CollectionCreate,
-    CollectionMetrics,
     CollectionRead,
+    CollectionSummary,
     CollectionUpdate,
+    CollectionView,
 )
 from app.schemas.common import ApiResponse
-from app.services.analytics import fetch_collection_metrics
-from app.services.collections import generate_unique_slug
+from app.schemas.serializers import COLLECTION_VIEWS, collection_full
+from app.services.autocomplete import autocomplete_index
+from app.services.catalog import bump_catalog_version, get_catalog_version
+from app.services.catalog_export import export_collections
+from app.services.facets import facet_index
+from app.services.search_index import search_index
+from app.services.slugs import assign_unique_slug
 
 router = APIRouter(prefix="/collections", tags=["collections"])
 
 
-@router.get("/", response_model=ApiResponse[List[CollectionRead]])
+@router.get("/", response_model=ApiResponse[List[Union[CollectionRead, CollectionCard, CollectionSummary]]])
 def list_collections(
+    request: Request,
     only_public: bool = Query(default=True, description="공개된 컬렉션만 조회"),
     featured: Optional[bool] = Query(default=None, description="추천 컬렉션 필터"),
     limit: Optional[int] = Query(default=12, ge=1, le=50, description="가져올 개수"),
+    view: CollectionView = Query(default="full", description="summary: id/slug/title, card: 플랫폼 목록 제외, full: 전체"),
     db: Session = Depends(get_db),
-) -> ApiResponse[List[CollectionRead]]:
-    stmt = (
-        select(Collection)
-        .options(
-            selectinload(Collection.platforms),
-            selectinload(Collection.platform_links).joinedload(CollectionPlatform.platform),
+) -> Response:
+    def scoped(stmt: Select) -> Select:
+        stmt = stmt.order_by(
+            Collection.display_order.asc(), Collection.trending_score.desc(), Collection.id.asc()
         )
-        .order_by(Collection.display_order.asc(), Collection.trending_score.desc())
-    )
-    if only_public:
-        stmt = stmt.where(Collection.is_public.is_(True))
-    if featured is not None:
-        stmt = stmt.where(Collection.is_featured.is_(featured))
-    if limit:
-        stmt = stmt.limit(limit)
+        if only_public:
+            stmt = stmt.where(Collection.is_public.is_(True))
+        if featured is not None:
+            stmt = stmt.where(Collection.is_featured.is_(featured))
+        if limit:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    headers = _collection_validators(db, db.execute(scoped(select(*COLLECTION_VALIDATOR_COLUMNS))).all())
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+
+    result = db.execute(scoped(_collection_view_query(view)))
+    rows = result.scalars().all() if view == "full" else result.all()
+    serialize = COLLECTION_VIEWS[view]
+    return json_response([serialize(row) for row in rows], headers=headers)
+
 
-    collections = db.execute(stmt).scalars().unique().all()
-    metrics_map = fetch_collection_metrics(db, [collection.id for collection in collections])
-    for collection in collections:
-        setattr(collection, "__metrics__", metrics_map.get(collection.id, CollectionMetrics()))
-    return ApiResponse(data=collections)
+@router.get(":export", dependencies=[Depends(get_export_client)])
+def export_collection_catalog(
+    after_id: int = Query(default=0, ge=0, description="마지막으로 받은 id 이후부터 이어받기"),
+    only_public: bool = Query(default=True, description="공개된 컬렉션만 내보내기"),
+    gzip: bool = Query(default=False, description="gzip 압축 여부"),
+) -> Response:
+    return ndjson_response(
+        export_collections(after_id, only_public), filename="collections.ndjson", gzip=gzip
+    )
 
 
 @router.get("/{slug}", response_model=ApiResponse[CollectionRead])
-def get_collection(slug: str, db: Session = Depends(get_db)) -> ApiResponse[CollectionRead]:
+def get_collection(slug: str, request: Request, db: Session = Depends(get_db)) -> Response:
+    state = db.execute(select(*COLLECTION_VALIDATOR_COLUMNS).where(Collection.slug == slug)).first()
+    if state is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="컬렉션을 찾을 수 없습니다.")
+    headers = _collection_validators(db, [state])
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+
     collection = _get_collection_by_slug_or_404(db, slug)
-    metrics_map = fetch_collection_metrics(db, [collection.id])
-    setattr(collection, "__metrics__", metrics_map.get(collection.id, CollectionMetrics()))
-    return ApiResponse(data=collection)
+    return json_response(collection_full(collection), headers=headers)
 
 
 @router.post(
@@ -66,10 +100,7 @@ def get_collection(slug: str, db: Session = Depends(get_db)) -> ApiResponse[Coll
 )
 def create_collection(payload: CollectionCreate, db: Session = Depends(get_db)) -> ApiResponse[CollectionRead]:
     platform_links = _build_platform_links(db, payload.platform_ids)
-    slug = generate_unique_slug(db, payload.title)
     collection = Collection(
-        title=payload.title,
-        slug=slug,
         description=payload.description,
         highlight=payload.highlight,
         cover_image_url=payload.cover_image_url,
@@ -79,10 +110,13 @@ def create_collection(payload: CollectionCreate, db: Session = Depends(get_db))
         published_at=payload.published_at,
         platform_links=platform_links,
     )
-    db.add(collection)
+    assign_unique_slug(db, collection, "title", payload.title)
+    version = bump_catalog_version(db)
     db.commit()
-    db.refresh(collection)
-    setattr(collection, "__metrics__", CollectionMetrics())
+    facet_index.advance(version)
+    autocomplete_index.advance(version)
+    collection = _get_collection_or_404(db, collection.id, "detail")
+    _index_collection(collection, version)
     return ApiResponse(message="컬렉션이 생성되었습니다.", data=collection)
 
 
@@ -98,10 +132,8 @@ def update_collection(
 ) -> ApiResponse[CollectionRead]:
     collection = _get_collection_or_404(db, collection_id)
 
-    if payload.title is not None:
-        if payload.title != collection.title:
-            collection.slug = generate_unique_slug(db, payload.title, current_id=collection.id)
-        collection.title = payload.title
+    if payload.title is not None and payload.title != collection.title:
+        assign_unique_slug(db, collection, "title", payload.title)
     if payload.description is not None:
         collection.description = payload.description
     if payload.highlight is not None:
@@ -121,10 +153,12 @@ def update_collection(
         collection.platform_links = _build_platform_links(db, payload.platform_ids)
 
     db.add(collection)
+    version = bump_catalog_version(db)
     db.commit()
-    db.refresh(collection)
-    metrics_map = fetch_collection_metrics(db, [collection.id])
-    setattr(collection, "__metrics__", metrics_map.get(collection.id, CollectionMetrics()))
+    facet_index.advance(version)
+    autocomplete_index.advance(version)
+    collection = _get_collection_or_404(db, collection_id, "detail")
+    _index_collection(collection, version)
     return ApiResponse(message="컬렉션이 수정되었습니다.", data=collection)
 
 
@@ -138,17 +172,70 @@ def delete_collection(collection_id: int, db: Session = Depends(get_db)) -> ApiR
     payload = CollectionRead.model_validate(collection)
 
     db.delete(collection)
+    version = bump_catalog_version(db)
     db.commit()
+    facet_index.advance(version)
+    autocomplete_index.advance(version)
+    search_index.remove("collection", collection_id, version)
     return ApiResponse(message="컬렉션이 삭제되었습니다.", data=payload)
 
 
-def _get_collection_or_404(db: Session, collection_id: int) -> Collection:
+# Counters move with analytics traffic without touching updated_at, so they are
+# part of the validator alongside the catalog version.
+COLLECTION_VALIDATOR_COLUMNS = (
+    Collection.id,
+    Collection.updated_at,
+    Collection.view_count,
+    Collection.click_count,
+    Collection.trending_score,
+)
+
+
+def _collection_validators(db: Session, rows: Sequence[Row]) -> Dict[str, str]:
+    digest = hashlib.sha1(repr([tuple(row) for row in rows]).encode("utf-8")).hexdigest()[:16]
+    return validator_headers(f'"collections-{get_catalog_version(db)}-{digest}"')
+
+
+def _index_collection(collection: Collection, version: int) -> None:
+    # Only public collections are suggested.
+    if collection.is_public:
+        search_index.upsert("collection", collection.id, collection.slug, collection.title, version)
+    else:
+        search_index.remove("collection", collection.id, version)
+
+
+def _collection_view_query(view: CollectionView) -> Select:
+    if view == "summary":
+        return select(Collection.id, Collection.slug, Collection.title)
+    if view == "card":
+        platform_count = (
+            select(func.count())
+            .select_from(CollectionPlatform)
+            .where(CollectionPlatform.collection_id == Collection.id)
+            .correlate(Collection)
+            .scalar_subquery()
+            .label("platform_count")
+        )
+        return select(
+            Collection.id,
+            Collection.slug,
+            Collection.title,
+            Collection.description,
+            Collection.highlight,
+            Collection.cover_image_url,
+            Collection.is_featured,
+            Collection.trending_score,
+            Collection.view_count,
+            Collection.click_count,
+            platform_count,
+        )
+    return select(Collection).options(*collection_options("detail"))
+
+
+def _get_collection_or_404(db: Session, collection_id: int, profile: LoaderProfile = "admin") -> Collection:
     collection = db.execute(
         select(Collection)
-        .options(
-            selectinload(Collection.platforms),
-            selectinload(Collection.platform_links).joinedload(CollectionPlatform.platform),
-        )
+        .options(*collection_options(profile))
         .where(Collection.id == collection_id)
     ).scalar_one_or_none()
     if not collection:
@@ -156,13 +243,10 @@ def _get_collection_or_404(db: Session, collection_id: int) -> Collection:
     return collection
 
 
-def _get_collection_by_slug_or_404(db: Session, slug: str) -> Collection:
+def _get_collection_by_slug_or_404(db: Session, slug: str, profile: LoaderProfile = "detail") -> Collection:
     collection = db.execute(
         select(Collection)
-        .options(
-            selectinload(Collection.platforms),
-            selectinload(Collection.platform_links).joinedload(CollectionPlatform.platform),
-        )
+        .options(*collection_options(profile))
         .where(Collection.slug == slug)
     ).scalar_one_or_none()
     if not collection:
@@ -1,98 +1,292 @@
 from __future__ import annotations
 
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import Select, func, or_, select
-from sqlalchemy.orm import Session, selectinload
-
-from app.api.dependencies import get_db
-from app.db.models import Category, Platform, Tag, platform_categories, platform_tags
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import ColumnElement, Select, select, tuple_
+from sqlalchemy.orm import Session, load_only
+
+from app.api.dependencies import get_current_admin, get_db, get_export_client
+from app.core.cursors import decode_cursor, encode_cursor
+from app.core.http import (
+    is_not_modified,
+    json_response,
+    ndjson_response,
+    not_modified_response,
+    validator_headers,
+)
+from app.db.loaders import LoaderProfile, platform_options
+from app.db.models import (
+    Category,
+    Platform,
+    PlatformSimilarity,
+    Tag,
+    platform_categories,
+    platform_tags,
+)
 from app.schemas.common import ApiResponse
 from app.schemas.platform import (
-    CategoryRef,
+    ImportReport,
+    PlatformCard,
     PlatformCreate,
     PlatformLinks,
     PlatformRead,
     PlatformSummary,
     PlatformUpdate,
-    TagRef,
+    PlatformView,
+    SimilarPlatform,
+)
+from app.schemas.serializers import PLATFORM_VIEWS, platform_card, platform_full
+from app.services.autocomplete import autocomplete_index
+from app.services.catalog import bump_catalog_version, get_catalog_state, taxonomy_cache
+from app.services.catalog_export import export_platforms
+from app.services.facets import bits_to_ids, facet_index, ids_to_bits
+from app.services.platform_import import ImportFormat, PlatformImporter, iter_records
+from app.services.platforms import build_search_filter
+from app.services.response_cache import (
+    SEARCH_TAG,
+    TAXONOMY_TAG,
+    UNFILTERED_TAG,
+    CachedResponse,
+    platform_cache_tags,
+    platform_write_tags,
+    response_cache,
+    taxonomy_write_tags,
 )
-from app.services.platforms import generate_unique_slug
+from app.services.search_index import search_index
+from app.services.slugs import assign_unique_slug
 
 router = APIRouter(prefix="/platforms", tags=["platforms"])
 
 
-@router.get("/", response_model=ApiResponse[List[PlatformRead]])
+@router.get("/", response_model=ApiResponse[List[Union[PlatformRead, PlatformCard, PlatformSummary]]])
 def list_platforms(
+    request: Request,
     search: Optional[str] = Query(default=None, description="Search platforms by name or description"),
     category_ids: List[int] = Query(default_factory=list, description="Filter by category ids"),
     tag_ids: List[int] = Query(default_factory=list, description="Filter by tag ids"),
+    sort: Literal["name", "relevance"] = Query(
+        default="name", description="Order by name, or by search relevance when searching"
+    ),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=12, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        default=None, description="Opaque next_cursor from a previous page; replaces page when given"
+    ),
+    include_total: bool = Query(default=True, description="Compute the total and per-facet counts"),
+    include_taxonomy: bool = Query(
+        default=True, description="Embed category/tag names in meta.filters; otherwise only facet counts"
+    ),
+    view: PlatformView = Query(default="full", description="summary: id/slug/name, card: grid cards, full: everything"),
     db: Session = Depends(get_db),
-) -> ApiResponse[List[PlatformRead]]:
-    base_query: Select[int] = select(Platform.id).select_from(Platform)
-
-    if search:
-        term = f"%{search.strip()}%"
-        base_query = base_query.where(
-            or_(Platform.name.ilike(term), Platform.description.ilike(term))
+) -> Response:
+    cache_key = response_cache.key(
+        "platforms",
+        {
+            "search": (search or "").strip().lower(),
+            "category_ids": sorted(set(category_ids)),
+            "tag_ids": sorted(set(tag_ids)),
+            "sort": sort,
+            "page": page,
+            "page_size": page_size,
+            "cursor": cursor,
+            "include_total": include_total,
+            "include_taxonomy": include_taxonomy,
+            "view": view,
+        },
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return _cached_response(request, cached, "platforms")
+
+    # Read before the body so a write racing this request leaves the stored entry
+    # tagged with an older version, which the cache then refuses to keep.
+    version, modified_at = get_catalog_state(db)
+    headers = validator_headers(f'"platforms-{version}"', modified_at)
+    if is_not_modified(request, headers["ETag"], modified_at):
+        return not_modified_response(headers)
+
+    facet_index.ensure(db, version)
+    selection = facet_index.match(category_ids, tag_ids)
+    faceted = bool(category_ids or tag_ids)
+
+    conditions: List[ColumnElement[bool]] = []
+    order_by = [Platform.name.asc(), Platform.id.asc()]
+    searching = bool(search and search.strip())
+    if searching:
+        condition, rank = build_search_filter(search or "")
+        conditions.append(condition)
+        if sort == "relevance":
+            order_by = [rank.desc(), *order_by]
+    keyset = not (searching and sort == "relevance")
+    if cursor is not None and not keyset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor pagination requires sort=name"
         )
 
-    if category_ids:
-        unique_category_ids = set(category_ids)
-        category_subquery = (
-            select(platform_categories.c.platform_id)
-            .where(platform_categories.c.category_id.in_(unique_category_ids))
-            .group_by(platform_categories.c.platform_id)
-            .having(func.count(func.distinct(platform_categories.c.category_id)) == len(unique_category_ids))
-        )
-        base_query = base_query.where(Platform.id.in_(category_subquery))
-
-    if tag_ids:
-        unique_tag_ids = set(tag_ids)
-        tag_subquery = (
-            select(platform_tags.c.platform_id)
-            .where(platform_tags.c.tag_id.in_(unique_tag_ids))
-            .group_by(platform_tags.c.platform_id)
-            .having(func.count(func.distinct(platform_tags.c.tag_id)) == len(unique_tag_ids))
+    total: Optional[int] = None
+    facet_counts: Optional[Dict[str, Dict[int, int]]] = None
+    if include_total:
+        if searching:
+            selection &= ids_to_bits(db.execute(select(Platform.id).where(*conditions)).scalars())
+        total = selection.bit_count()
+        facet_counts = facet_index.counts(selection)
+    if faceted:
+        conditions.append(Platform.id.in_(bits_to_ids(selection)))
+
+    items: List[dict] = []
+    next_cursor: Optional[str] = None
+    if total != 0:
+        stmt = _platform_view_query(view).where(*conditions).order_by(*order_by)
+        if cursor is not None:
+            last_name, last_id = _decode_platform_cursor(cursor)
+            stmt = stmt.where(tuple_(Platform.name, Platform.id) > tuple_(last_name, last_id))
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        # One extra row tells us whether another page exists without counting.
+        result = db.execute(stmt.limit(page_size + 1))
+        rows = result.all() if view == "summary" else result.scalars().all()
+        page_rows = rows[:page_size]
+        if len(rows) > page_size and keyset:
+            next_cursor = encode_cursor(page_rows[-1].name, page_rows[-1].id)
+        serialize = PLATFORM_VIEWS[view]
+        items = [serialize(row) for row in page_rows]
+
+    meta = _build_meta(
+        db,
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
+        facet_counts=facet_counts,
+        version=version if include_taxonomy else None,
+    )
+    response = json_response(items, meta=meta, headers=headers)
+
+    dependencies = platform_cache_tags(_item_platform_ids(items), category_ids, tag_ids)
+    if not faceted:
+        dependencies.append(UNFILTERED_TAG)
+    if searching:
+        dependencies.append(SEARCH_TAG)
+    if include_taxonomy:
+        dependencies.append(TAXONOMY_TAG)
+    response_cache.set(cache_key, CachedResponse(response.body, version, modified_at), tags=dependencies)
+    return response
+
+
+IMPORT_CONTENT_TYPES: Dict[str, ImportFormat] = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv",
+}
+
+
+@router.post(
+    ":import",
+    response_model=ApiResponse[ImportReport],
+    dependencies=[Depends(get_current_admin)],
+)
+async def import_platforms(
+    request: Request,
+    format: Optional[ImportFormat] = Query(
+        default=None, description="ndjson or csv; defaults to the request Content-Type"
+    ),
+    db: Session = Depends(get_db),
+) -> ApiResponse[ImportReport]:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    content = format or IMPORT_CONTENT_TYPES.get(content_type)
+    if content is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send NDJSON or CSV, or pass format=ndjson|csv",
         )
-        base_query = base_query.where(Platform.id.in_(tag_subquery))
 
-    filtered_query = base_query.distinct()
-    subquery = filtered_query.subquery()
-    total = db.execute(select(func.count()).select_from(subquery)).scalar_one()
+    importer = PlatformImporter(db)
+    try:
+        async for line, record in iter_records(request.stream(), content):
+            if importer.add(line, record):
+                await run_in_threadpool(importer.flush)
+        await run_in_threadpool(importer.finish)
+    finally:
+        # Chunks are committed as they go, so an aborted upload still has to
+        # publish the ones that made it in.
+        if importer.version is not None:
+            facet_index.invalidate()
+            search_index.invalidate()
+            autocomplete_index.invalidate()
+            tags = platform_write_tags(importer.related_ids, importer.category_ids, importer.tag_ids)
+            if importer.created_taxonomy:
+                tags.extend(taxonomy_write_tags())
+            response_cache.invalidate(tags, version=importer.version)
+    report = importer.report()
+    return ApiResponse(message=f"Imported {report.imported} platforms", data=report)
+
+
+@router.get(":export", dependencies=[Depends(get_export_client)])
+def export_platform_catalog(
+    after_id: int = Query(default=0, ge=0, description="Resume after the last exported id"),
+    gzip: bool = Query(default=False, description="Compress the stream with gzip"),
+) -> Response:
+    return ndjson_response(export_platforms(after_id), filename="platforms.ndjson", gzip=gzip)
+
+
+@router.get("/autocomplete", response_model=ApiResponse[List[PlatformSummary]])
+def autocomplete_platforms(
+    q: str = Query(..., min_length=1, max_length=100, description="Name or slug prefix"),
+    limit: int = Query(default=8, ge=1, le=20),
+    db: Session = Depends(get_db),
+) -> Response:
+    autocomplete_index.ensure_fresh(db)
+    return json_response(autocomplete_index.lookup(q, limit))
 
-    offset = (page - 1) * page_size
-    paginated_ids = db.execute(
-        filtered_query.order_by(Platform.name.asc()).offset(offset).limit(page_size)
-    ).scalars().all()
 
-    if not paginated_ids:
-        meta = _build_meta(db, total=total, page=page, page_size=page_size)
-        return ApiResponse(data=[], meta=meta)
+@router.get("/{slug}", response_model=ApiResponse[PlatformRead])
+def get_platform(slug: str, request: Request, db: Session = Depends(get_db)) -> Response:
+    cache_key = response_cache.key("platform", {"slug": slug})
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return _cached_response(request, cached, "platform")
+
+    version, modified_at = get_catalog_state(db)
+    headers = validator_headers(f'"platform-{version}"', modified_at)
+    if is_not_modified(request, headers["ETag"], modified_at):
+        return not_modified_response(headers)
+
+    payload = platform_full(_get_platform_by_slug_or_404(db, slug))
+    response = json_response(payload, headers=headers)
+    dependencies = platform_cache_tags(_item_platform_ids([payload]))
+    response_cache.set(cache_key, CachedResponse(response.body, version, modified_at), tags=dependencies)
+    return response
+
+
+@router.get("/{slug}/similar", response_model=ApiResponse[List[SimilarPlatform]])
+def list_similar_platforms(
+    slug: str,
+    request: Request,
+    limit: int = Query(default=6, ge=1, le=50),
+    db: Session = Depends(get_db),
+) -> Response:
+    version, modified_at = get_catalog_state(db)
+    headers = validator_headers(f'"similar-{version}"', modified_at)
+    if is_not_modified(request, headers["ETag"], modified_at):
+        return not_modified_response(headers)
+
+    platform_id = db.execute(select(Platform.id).where(Platform.slug == slug)).scalar_one_or_none()
+    if platform_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Platform not found")
 
-    platforms_query = (
-        select(Platform)
-        .options(
-            selectinload(Platform.categories),
-            selectinload(Platform.tags),
-            selectinload(Platform.related_platforms),
-            selectinload(Platform.related_to),
-        )
-        .where(Platform.id.in_(paginated_ids))
-        .order_by(Platform.name.asc())
+    stmt = (
+        select(Platform, PlatformSimilarity.score)
+        .join(PlatformSimilarity, PlatformSimilarity.similar_platform_id == Platform.id)
+        .options(*platform_options("card"))
+        .where(PlatformSimilarity.platform_id == platform_id)
+        .order_by(PlatformSimilarity.rank)
+        .limit(limit)
     )
-    platforms = db.execute(platforms_query).scalars().unique().all()
-    meta = _build_meta(db, total=total, page=page, page_size=page_size)
-    return ApiResponse(data=platforms, meta=meta)
-
-
-@router.get("/{slug}", response_model=ApiResponse[PlatformRead])
-def get_platform(slug: str, db: Session = Depends(get_db)) -> ApiResponse[PlatformRead]:
-    platform = _get_platform_by_slug_or_404(db, slug)
-    return ApiResponse(data=platform)
+    items = [{**platform_card(platform), "score": score} for platform, score in db.execute(stmt)]
+    return json_response(items, headers=headers)
 
 
 @router.post("/", response_model=ApiResponse[PlatformRead], status_code=status.HTTP_201_CREATED)
@@ -100,13 +294,10 @@ def create_platform(payload: PlatformCreate, db: Session = Depends(get_db)) -> A
     categories = _load_categories(db, payload.category_ids)
     tags = _load_tags(db, payload.tag_ids)
     related_platforms = _load_related_platforms(db, payload.related_platform_ids)
-    slug = generate_unique_slug(db, payload.name)
 
     links = payload.links or PlatformLinks()
 
     platform = Platform(
-        name=payload.name,
-        slug=slug,
         description=payload.description,
         url=payload.url,
         ios_url=links.ios,
@@ -116,9 +307,19 @@ def create_platform(payload: PlatformCreate, db: Session = Depends(get_db)) -> A
         tags=tags,
         related_platforms=related_platforms,
     )
-    db.add(platform)
+    assign_unique_slug(db, platform, "name", payload.name)
+    version = bump_catalog_version(db)
     db.commit()
-    db.refresh(platform)
+    category_ids = [category.id for category in categories]
+    tag_ids = [tag.id for tag in tags]
+    facet_index.upsert(platform.id, category_ids, tag_ids, version)
+    response_cache.invalidate(
+        platform_write_tags([platform.id, *(item.id for item in related_platforms)], category_ids, tag_ids),
+        version=version,
+    )
+    platform = _get_platform_or_404(db, platform.id, "detail")
+    search_index.upsert("platform", platform.id, platform.slug, platform.name, version)
+    autocomplete_index.upsert(platform.id, platform.slug, platform.name, version)
     return ApiResponse(message="Platform created", data=platform)
 
 
@@ -129,11 +330,12 @@ def update_platform(
     db: Session = Depends(get_db),
 ) -> ApiResponse[PlatformRead]:
     platform = _get_platform_or_404(db, platform_id)
+    previous_category_ids = [category.id for category in platform.categories]
+    previous_tag_ids = [tag.id for tag in platform.tags]
+    previous_related_ids = [item.id for item in platform.related_platforms]
 
-    if payload.name is not None:
-        if payload.name != platform.name:
-            platform.slug = generate_unique_slug(db, payload.name, current_id=platform.id)
-        platform.name = payload.name
+    if payload.name is not None and payload.name != platform.name:
+        assign_unique_slug(db, platform, "name", payload.name)
     if payload.description is not None:
         platform.description = payload.description
     if payload.url is not None:
@@ -154,9 +356,25 @@ def update_platform(
             db, payload.related_platform_ids, current_platform_id=platform.id
         )
 
+    category_ids = [category.id for category in platform.categories]
+    tag_ids = [tag.id for tag in platform.tags]
+    related_ids = [item.id for item in platform.related_platforms]
     db.add(platform)
+    db.flush()
+    version = bump_catalog_version(db)
     db.commit()
-    db.refresh(platform)
+    facet_index.upsert(platform_id, category_ids, tag_ids, version)
+    response_cache.invalidate(
+        platform_write_tags(
+            [platform_id, *previous_related_ids, *related_ids],
+            [*previous_category_ids, *category_ids],
+            [*previous_tag_ids, *tag_ids],
+        ),
+        version=version,
+    )
+    platform = _get_platform_or_404(db, platform_id, "detail")
+    search_index.upsert("platform", platform.id, platform.slug, platform.name, version)
+    autocomplete_index.upsert(platform.id, platform.slug, platform.name, version)
     return ApiResponse(message="Platform updated", data=platform)
 
 
@@ -164,31 +382,109 @@ def update_platform(
 def delete_platform(platform_id: int, db: Session = Depends(get_db)) -> ApiResponse[PlatformRead]:
     platform = _get_platform_or_404(db, platform_id)
     payload = PlatformRead.model_validate(platform)
+    dependencies = platform_write_tags(
+        [platform_id, *(item.id for item in platform.all_related_platforms)],
+        [category.id for category in platform.categories],
+        [tag.id for tag in platform.tags],
+    )
 
     db.delete(platform)
+    version = bump_catalog_version(db)
     db.commit()
+    facet_index.remove(platform_id, version)
+    search_index.remove("platform", platform_id, version)
+    autocomplete_index.remove(platform_id, version)
+    response_cache.invalidate(dependencies, version=version)
     return ApiResponse(message="Platform deleted", data=payload)
 
 
-def _build_meta(db: Session, *, total: int, page: int, page_size: int) -> dict:
+def _cached_response(request: Request, cached: CachedResponse, etag_prefix: str) -> Response:
+    # Validators come from the catalog state the body was rendered at, so a
+    # regenerated body never reuses the ETag of the one it replaced.
+    headers = validator_headers(f'"{etag_prefix}-{cached.version}"', cached.last_modified)
+    if is_not_modified(request, headers["ETag"], cached.last_modified):
+        return not_modified_response(headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _item_platform_ids(items: List[dict]) -> List[int]:
+    """Every platform whose data appears in the serialized items, including related summaries."""
+    ids: List[int] = []
+    for item in items:
+        ids.append(item["id"])
+        ids.extend(related["id"] for related in item.get("related_platforms", ()))
+    return ids
+
+
+def _platform_view_query(view: PlatformView) -> Select:
+    if view == "summary":
+        return select(Platform.id, Platform.slug, Platform.name)
+    if view == "card":
+        return select(Platform).options(
+            load_only(Platform.id, Platform.slug, Platform.name, Platform.description, Platform.url),
+            *platform_options("card"),
+        )
+    return select(Platform).options(*platform_options("detail"))
+
+
+def _build_meta(
+    db: Session,
+    *,
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    next_cursor: Optional[str],
+    facet_counts: Optional[Dict[str, Dict[int, int]]],
+    version: Optional[int],
+) -> dict:
+    """Pagination plus facets; category/tag names are embedded only when ``version`` is given."""
     total_pages = (total + page_size - 1) // page_size if total else 0
-    categories = db.execute(select(Category).order_by(Category.name.asc())).scalars().all()
-    tags = db.execute(select(Tag).order_by(Tag.name.asc())).scalars().all()
+    counts = facet_counts or {"categories": {}, "tags": {}}
+    if version is None:
+        filters = {
+            kind: [{"id": key, "count": count} for key, count in kind_counts.items()]
+            for kind, kind_counts in counts.items()
+        }
+    else:
+        taxonomy = taxonomy_cache.get(db, version)
+        filters = {
+            "categories": [
+                _facet_entry(category.model_dump(), counts["categories"], facet_counts is not None)
+                for category in taxonomy.categories
+            ],
+            "tags": [
+                _facet_entry(tag.model_dump(), counts["tags"], facet_counts is not None) for tag in taxonomy.tags
+            ],
+        }
 
     return {
         "pagination": {
             "page": page,
             "page_size": page_size,
             "total": total,
-            "pages": total_pages,
-        },
-        "filters": {
-            "categories": [CategoryRef.model_validate(cat).model_dump() for cat in categories],
-            "tags": [TagRef.model_validate(tag).model_dump() for tag in tags],
+            "pages": total_pages if total is not None else None,
+            "next_cursor": next_cursor,
         },
+        "filters": filters,
     }
 
 
+def _facet_entry(item: dict, counts: Dict[int, int], with_count: bool) -> dict:
+    if with_count:
+        item["count"] = counts.get(item["id"], 0)
+    return item
+
+
+def _decode_platform_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        last_name, last_id = decode_cursor(cursor)
+    except (TypeError, ValueError):
+        last_name, last_id = None, None
+    if not isinstance(last_name, str) or not isinstance(last_id, int):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return last_name, last_id
+
+
 def _load_categories(db: Session, category_ids: List[int]) -> List[Category]:
     if not category_ids:
         return []
@@ -230,15 +526,10 @@ def _load_related_platforms(
     return platforms
 
 
-def _get_platform_or_404(db: Session, platform_id: int) -> Platform:
+def _get_platform_or_404(db: Session, platform_id: int, profile: LoaderProfile = "admin") -> Platform:
     stmt = (
         select(Platform)
-        .options(
-            selectinload(Platform.categories),
-            selectinload(Platform.tags),
-            selectinload(Platform.related_platforms),
-            selectinload(Platform.related_to),
-        )
+        .options(*platform_options(profile))
         .where(Platform.id == platform_id)
     )
     platform = db.execute(stmt).scalars().first()
@@ -247,15 +538,10 @@ def _get_platform_or_404(db: Session, platform_id: int) -> Platform:
     return platform
 
 
-def _get_platform_by_slug_or_404(db: Session, slug: str) -> Platform:
+def _get_platform_by_slug_or_404(db: Session, slug: str, profile: LoaderProfile = "detail") -> Platform:
     stmt = (
         select(Platform)
-        .options(
-            selectinload(Platform.categories),
-            selectinload(Platform.tags),
-            selectinload(Platform.related_platforms),
-            selectinload(Platform.related_to),
-        )
+        .options(*platform_options(profile))
         .where(Platform.slug == slug)
     )
     platform = db.execute(stmt).scalars().first()
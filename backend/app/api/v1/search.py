@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_db
+from app.core.http import json_response
+from app.schemas.common import ApiResponse
+from app.schemas.search import SearchSuggestion
+from app.services.search_index import search_index
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("/suggest", response_model=ApiResponse[List[SearchSuggestion]])
+def suggest(
+    q: str = Query(
+        ..., min_length=1, max_length=100, description="Name fragment, half-typed syllables or initials (ㅋㅋㅇ)"
+    ),
+    limit: int = Query(default=8, ge=1, le=20),
+    db: Session = Depends(get_db),
+) -> Response:
+    search_index.ensure_fresh(db)
+    items = [
+        {"type": document.kind, "id": document.id, "slug": document.slug, "title": document.title}
+        for document in search_index.suggest(q, limit)
+    ]
+    return json_response(items)
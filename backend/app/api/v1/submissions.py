@@ -25,7 +25,12 @@ from app.schemas.submission import (
     SubmissionRead,
     SubmissionRejectRequest,
 )
-from app.services.platforms import generate_unique_slug
+from app.services.autocomplete import autocomplete_index
+from app.services.catalog import bump_catalog_version
+from app.services.facets import facet_index
+from app.services.response_cache import platform_write_tags, response_cache
+from app.services.search_index import search_index
+from app.services.slugs import assign_unique_slug
 
 
 router = APIRouter(prefix="/submissions", tags=["submissions"])
@@ -109,10 +114,15 @@ def approve_submission(submission_id: int, db: Session = Depends(get_db)) -> Api
     submission.approved_at = datetime.now(timezone.utc)
 
     db.add(submission)
+    version = bump_catalog_version(db)
     db.commit()
     db.refresh(platform)
     db.refresh(submission)
     db.refresh(submission, attribute_names=["platform"])
+    facet_index.upsert(platform.id, [], [], version)
+    search_index.upsert("platform", platform.id, platform.slug, platform.name, version)
+    autocomplete_index.upsert(platform.id, platform.slug, platform.name, version)
+    response_cache.invalidate(platform_write_tags([platform.id]), version=version)
 
     notify_submission_approved(submission)
 
@@ -231,17 +241,13 @@ def _get_submission_or_404(db: Session, submission_id: int) -> Submission:
 
 
 def _convert_submission_to_platform(db: Session, submission: Submission) -> Platform:
-    slug = generate_unique_slug(db, submission.platform_name)
     platform = Platform(
-        name=submission.platform_name,
-        slug=slug,
         description=submission.description,
         url=submission.website_url,
         ios_url=submission.ios_url,
         android_url=submission.android_url,
         web_url=submission.web_url,
     )
-    db.add(platform)
-    db.flush()
+    assign_unique_slug(db, platform, "name", submission.platform_name)
     submission.platform_id = platform.id
     return platform
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_db
+from app.core.http import etag_matches
+from app.schemas.common import ApiResponse
+from app.schemas.taxonomy import Taxonomy
+from app.services.catalog import taxonomy_cache
+
+router = APIRouter(prefix="/taxonomy", tags=["taxonomy"])
+
+
+@router.get("/", response_model=ApiResponse[Taxonomy])
+def get_taxonomy(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+) -> ApiResponse[Taxonomy] | Response:
+    taxonomy = taxonomy_cache.get(db)
+    etag = taxonomy_cache.etag(taxonomy.version)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return ApiResponse(data=taxonomy)
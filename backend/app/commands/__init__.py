@@ -0,0 +1 @@
+"""Operational commands runnable with ``python -m app.commands.<name>``."""
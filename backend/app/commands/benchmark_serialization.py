@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, List
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.http import json_response
+from app.db.models import Category, Collection, Platform, Tag
+from app.schemas.collection import CollectionRead
+from app.schemas.common import ApiResponse
+from app.schemas.platform import PlatformRead
+from app.schemas.serializers import collection_full, platform_full
+
+logger = logging.getLogger(__name__)
+
+
+def _build_platforms(count: int) -> List[Platform]:
+    categories = [Category(id=index, name=f"category-{index}") for index in range(1, 9)]
+    tags = [Tag(id=index, name=f"tag-{index}") for index in range(1, 17)]
+    platforms = [
+        Platform(
+            id=index,
+            slug=f"platform-{index}",
+            name=f"Platform {index}",
+            description="설명 " * 40,
+            url=f"https://example.com/{index}",
+            web_url=f"https://example.com/{index}/app",
+        )
+        for index in range(1, count + 1)
+    ]
+    for index, platform in enumerate(platforms):
+        platform.categories = categories[index % 3 : index % 3 + 2]
+        platform.tags = tags[index % 5 : index % 5 + 4]
+        platform.related_platforms = [platforms[(index + offset) % count] for offset in (1, 2, 3)]
+    return platforms
+
+
+def _build_collections(count: int, platforms: List[Platform]) -> List[Collection]:
+    now = datetime.now(timezone.utc)
+    collections = []
+    for index in range(1, count + 1):
+        collection = Collection(
+            id=index,
+            slug=f"collection-{index}",
+            title=f"Collection {index}",
+            description="컬렉션 " * 20,
+            is_public=True,
+            is_featured=index % 4 == 0,
+            display_order=index,
+            trending_score=float(index),
+            view_count=index * 10,
+            click_count=index,
+            created_at=now,
+            updated_at=now,
+        )
+        collection.platforms = platforms[index % 10 : index % 10 + 8]
+        collections.append(collection)
+    return collections
+
+
+def _legacy(schema: Any, items: List[Any]) -> bytes:
+    """Approximates FastAPI's response_model path: validate, dump, re-validate, encode."""
+    response_type = ApiResponse[List[schema]]
+    content = response_type(data=items)
+    revalidated = response_type.model_validate(content.model_dump())
+    return json.dumps(jsonable_encoder(revalidated)).encode("utf-8")
+
+
+def _fast(builder: Callable[[Any], dict], items: List[Any]) -> bytes:
+    return json_response([builder(item) for item in items]).body
+
+
+def _time(func: Callable[[], bytes], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the response_model and direct serialization paths.")
+    parser.add_argument("--items", type=int, default=100, help="Objects per simulated page.")
+    parser.add_argument("--rounds", type=int, default=200, help="Timed iterations per path.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    platforms = _build_platforms(args.items)
+    collections = _build_collections(args.items, platforms)
+    cases = [
+        ("platforms", PlatformRead, platform_full, platforms),
+        ("collections", CollectionRead, collection_full, collections),
+    ]
+
+    for name, schema, builder, items in cases:
+        legacy_body = _legacy(schema, items)
+        fast_body = _fast(builder, items)
+        if json.loads(legacy_body) != json.loads(fast_body):
+            raise SystemExit(f"{name}: serializers disagree with {schema.__name__}")
+
+        legacy_ms = _time(lambda: _legacy(schema, items), args.rounds)
+        fast_ms = _time(lambda: _fast(builder, items), args.rounds)
+        logger.info(
+            "%s x%d: response_model %.2f ms, direct %.2f ms (%.1fx)",
+            name,
+            args.items,
+            legacy_ms,
+            fast_ms,
+            legacy_ms / fast_ms if fast_ms else float("inf"),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import argparse
+import logging
+
+from app.core.config import get_settings
+from app.services.similarity import rebuild_similar_platforms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute the precomputed similar platforms table.")
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=get_settings().similar_platforms_top_k,
+        help="Neighbours stored per platform.",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    rebuild_similar_platforms(max(args.top_k, 1))
+
+
+if __name__ == "__main__":
+    main()
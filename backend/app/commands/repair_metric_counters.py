@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+import logging
+
+from app.db.session import SessionLocal
+from app.services.analytics import repair_metric_counters
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute lifetime view/click counters.")
+    parser.add_argument(
+        "--source",
+        choices=["monthly", "daily"],
+        default="monthly",
+        help="Metrics table to rebuild from (daily is only complete without retention).",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    session = SessionLocal()
+    try:
+        repaired = repair_metric_counters(session, source=args.source)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    for table, count in repaired.items():
+        logger.info("Repaired %d rows in %s", count, table)
+
+
+if __name__ == "__main__":
+    main()
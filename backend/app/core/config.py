@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, alias="DEBUG")
 
     database_url: str = Field(alias="DATABASE_URL")
+    db_raiseload: bool = Field(default=False, alias="DB_RAISELOAD")
     redis_url: str = Field(alias="REDIS_URL")
 
     api_prefix: str = Field(default="/api")
@@ -23,6 +24,8 @@ class Settings(BaseSettings):
     admin_password: str = Field(default="changeme", alias="ADMIN_PASSWORD")
     admin_jwt_secret: str = Field(default="super-secret", alias="ADMIN_JWT_SECRET")
     admin_jwt_expiration_minutes: int = Field(default=60, alias="ADMIN_JWT_EXPIRATION_MINUTES")
+    # Read-only bearer tokens that partner crawlers use for the catalog exports.
+    partner_api_tokens: List[str] = Field(default_factory=list, alias="PARTNER_API_TOKENS")
 
     submission_upload_bucket: Optional[str] = Field(default=None, alias="SUBMISSION_UPLOAD_BUCKET")
     submission_upload_prefix: str = Field(default="submissions", alias="SUBMISSION_UPLOAD_PREFIX")
@@ -47,6 +50,43 @@ class Settings(BaseSettings):
     smtp_password: Optional[str] = Field(default=None, alias="SMTP_PASSWORD")
     smtp_use_tls: bool = Field(default=True, alias="SMTP_USE_TLS")
 
+    catalog_cache_control: str = Field(default="public, no-cache", alias="CATALOG_CACHE_CONTROL")
+    response_cache_enabled: bool = Field(default=True, alias="RESPONSE_CACHE_ENABLED")
+    response_cache_ttl_seconds: int = Field(default=300, alias="RESPONSE_CACHE_TTL_SECONDS")
+    autocomplete_check_seconds: float = Field(default=2.0, alias="AUTOCOMPLETE_CHECK_SECONDS")
+    similar_platforms_top_k: int = Field(default=10, alias="SIMILAR_PLATFORMS_TOP_K")
+    similar_platforms_cron: str = Field(default="0 4 * * *", alias="SIMILAR_PLATFORMS_CRON")
+
+    scheduler_lease_seconds: int = Field(default=30, alias="SCHEDULER_LEASE_SECONDS")
+    scheduler_poll_seconds: float = Field(default=1.0, alias="SCHEDULER_POLL_SECONDS")
+
+    analytics_run_in_api: bool = Field(default=True, alias="ANALYTICS_RUN_IN_API")
+    analytics_worker_concurrency: int = Field(default=2, alias="ANALYTICS_WORKER_CONCURRENCY")
+    analytics_worker_scheduler: bool = Field(default=True, alias="ANALYTICS_WORKER_SCHEDULER")
+    analytics_drain_timeout_seconds: float = Field(default=15.0, alias="ANALYTICS_DRAIN_TIMEOUT_SECONDS")
+    analytics_batch_size: int = Field(default=500, alias="ANALYTICS_BATCH_SIZE")
+    analytics_flush_interval_ms: int = Field(default=1000, alias="ANALYTICS_FLUSH_INTERVAL_MS")
+    analytics_batch_max_events: int = Field(default=500, alias="ANALYTICS_BATCH_MAX_EVENTS")
+    analytics_trending_interval_seconds: int = Field(default=3600, alias="ANALYTICS_TRENDING_INTERVAL_SECONDS")
+    analytics_daily_retention_days: int = Field(default=400, alias="ANALYTICS_DAILY_RETENTION_DAYS")
+    analytics_max_clock_skew_seconds: int = Field(default=300, alias="ANALYTICS_MAX_CLOCK_SKEW_SECONDS")
+    analytics_compaction_cron: str = Field(default="30 3 * * *", alias="ANALYTICS_COMPACTION_CRON")
+    analytics_trending_source: Literal["database", "redis"] = Field(
+        default="database", alias="ANALYTICS_TRENDING_SOURCE"
+    )
+    analytics_trending_metric: Literal["views", "unique_visitors"] = Field(
+        default="views", alias="ANALYTICS_TRENDING_METRIC"
+    )
+    analytics_trending_half_life_seconds: int = Field(default=86_400, alias="ANALYTICS_TRENDING_HALF_LIFE_SECONDS")
+    analytics_trending_sync_seconds: int = Field(default=300, alias="ANALYTICS_TRENDING_SYNC_SECONDS")
+    analytics_queue_backend: Literal["list", "stream"] = Field(default="list", alias="ANALYTICS_QUEUE_BACKEND")
+    analytics_stream_key: str = Field(default="analytics:stream", alias="ANALYTICS_STREAM_KEY")
+    # Off by default: acknowledged entries are trimmed anyway, and a cap drops unread events.
+    analytics_stream_maxlen: Optional[int] = Field(default=None, alias="ANALYTICS_STREAM_MAXLEN")
+    analytics_consumer_group: str = Field(default="analytics-workers", alias="ANALYTICS_CONSUMER_GROUP")
+    analytics_consumer_name: Optional[str] = Field(default=None, alias="ANALYTICS_CONSUMER_NAME")
+    analytics_claim_idle_ms: int = Field(default=60_000, alias="ANALYTICS_CLAIM_IDLE_MS")
+
 
 @lru_cache
 def get_settings() -> Settings:
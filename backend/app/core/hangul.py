@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import unicodedata
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_JUNG_COUNT = 21
+_JONG_COUNT = 28
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# Compound jamo are typed as two keys, so they are matched as their parts.
+_COMPOUNDS = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+_CONSONANTS = frozenset(CHOSUNG) | frozenset("".join(JONGSUNG))
+_VOWELS = frozenset(JUNGSUNG)
+
+
+def normalize(text: str) -> str:
+    """NFC, lower-cased and without whitespace, so spacing never affects a match."""
+    return "".join(unicodedata.normalize("NFC", text).lower().split())
+
+
+def split_syllable(char: str) -> tuple[str, str, str] | None:
+    """Initial, medial and final jamo of a precomposed syllable, or None."""
+    code = ord(char)
+    if not _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+        return None
+    index = code - _SYLLABLE_BASE
+    return (
+        CHOSUNG[index // (_JUNG_COUNT * _JONG_COUNT)],
+        JUNGSUNG[index % (_JUNG_COUNT * _JONG_COUNT) // _JONG_COUNT],
+        JONGSUNG[index % _JONG_COUNT],
+    )
+
+
+def decompose(text: str) -> str:
+    """Spell ``text`` as the keystroke jamo sequence; other characters pass through.
+
+    A half-typed query such as "캌" (on the way to "카카") becomes a prefix of
+    the full name's sequence.
+    """
+    parts = []
+    for char in normalize(text):
+        syllable = split_syllable(char)
+        if syllable is None:
+            parts.append(_COMPOUNDS.get(char, char))
+        else:
+            parts.extend(_COMPOUNDS.get(jamo, jamo) for jamo in syllable)
+    return "".join(parts)
+
+
+def initials(text: str) -> str:
+    """Replace every syllable by its initial consonant: "카카오" -> "ㅋㅋㅇ"."""
+    parts = []
+    for char in normalize(text):
+        syllable = split_syllable(char)
+        parts.append(char if syllable is None else syllable[0])
+    return "".join(parts)
+
+
+def is_initials_query(text: str) -> bool:
+    """True when the Hangul in ``text`` is only bare consonants, e.g. "ㅋㅋㅇ"."""
+    hangul = [
+        char for char in normalize(text) if char in _CONSONANTS or char in _VOWELS or split_syllable(char)
+    ]
+    return bool(hangul) and all(char in _CONSONANTS for char in hangul)
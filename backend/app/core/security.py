@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hmac
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -38,3 +39,10 @@ def decode_admin_token(token: str) -> str:
             detail="Invalid admin session",
         )
     return subject
+
+
+def is_partner_token(token: str) -> bool:
+    settings = get_settings()
+    # Compare against every token so the response time does not reveal which one matched.
+    matches = [hmac.compare_digest(token.encode(), partner.encode()) for partner in settings.partner_api_tokens]
+    return any(matches)
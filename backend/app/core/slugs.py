@@ -3,11 +3,75 @@ from __future__ import annotations
 import re
 import unicodedata
 
+from app.core.hangul import CHOSUNG, JONGSUNG, JUNGSUNG, split_syllable
 
-def slugify(value: str) -> str:
-    """Create a URL-friendly slug from a string."""
-    normalized = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+MAX_SLUG_LENGTH = 200
+
+# Revised Romanization, applied syllable by syllable.
+# Blank entries (ㅇ as an initial, no final) are written as two adjacent spaces.
+_INITIALS = dict(zip(CHOSUNG, "g kk n d tt r m b pp s ss  j jj ch k t p h".split(" ")))
+_MEDIALS = dict(zip(JUNGSUNG, "a ae ya yae eo e yeo ye o wa wae oe yo u wo we wi yu eu ui i".split(" ")))
+_FINALS = dict(zip(JONGSUNG, " k k k n n n t l k m l l l p l m p p t t ng t t k t p t".split(" ")))
+# A single final followed by a silent ㅇ carries over as the next initial: 한국어 -> hangugeo.
+_CARRIED_FINALS = {final: _INITIALS[final] for final in "ㄱㄲㄴㄷㄹㅁㅂㅅㅆㅈㅊㅋㅌㅍ"}
+# Consonant assimilation across a syllable boundary, keyed by (final sound, next initial)
+# and giving the (final, initial) that are written instead: nasalization (국물 -> gungmul,
+# 국립 -> gungnip, 종로 -> jongno) and liquidization (신라 -> silla, 설날 -> seollal).
+_ASSIMILATED = {
+    ("k", "ㄴ"): ("ng", "n"),
+    ("k", "ㅁ"): ("ng", "m"),
+    ("k", "ㄹ"): ("ng", "n"),
+    ("t", "ㄴ"): ("n", "n"),
+    ("t", "ㅁ"): ("n", "m"),
+    ("t", "ㄹ"): ("n", "n"),
+    ("p", "ㄴ"): ("m", "n"),
+    ("p", "ㅁ"): ("m", "m"),
+    ("p", "ㄹ"): ("m", "n"),
+    ("m", "ㄹ"): ("m", "n"),
+    ("ng", "ㄹ"): ("ng", "n"),
+    ("n", "ㄹ"): ("l", "l"),
+    ("l", "ㄴ"): ("l", "l"),
+    ("l", "ㄹ"): ("l", "l"),
+}
+
+
+def transliterate(value: str) -> str:
+    """Romanize Hangul syllables and leave every other character untouched.
+
+    Final consonants carry over into a following silent ㅇ and assimilate to
+    the next initial as listed in ``_ASSIMILATED``. Changes that depend on the
+    word rather than the spelling are non-goals: aspiration with ㅎ (좋고 is
+    written jotgo, not joko), palatalization (같이 is gati, not gachi), the
+    lexical ㄴ+ㄹ exceptions (의견란 is uigyeollan, not uigyeonnan) and
+    consonant clusters before a silent ㅇ (닭이 is daki, not dalgi).
+    """
+    value = unicodedata.normalize("NFC", value)
+    parts = []
+    assimilated_head = None
+    for index, char in enumerate(value):
+        syllable = split_syllable(char)
+        if syllable is None:
+            parts.append(char)
+            assimilated_head = None
+            continue
+        initial, medial, final = syllable
+        following = split_syllable(value[index + 1]) if index + 1 < len(value) else None
+        head = assimilated_head or _INITIALS[initial]
+        assimilated_head = None
+        if following is not None and following[0] == "ㅇ" and final in _CARRIED_FINALS:
+            tail = _CARRIED_FINALS[final]
+        else:
+            tail = _FINALS[final]
+            if following is not None and (tail, following[0]) in _ASSIMILATED:
+                tail, assimilated_head = _ASSIMILATED[(tail, following[0])]
+        parts.append(head + _MEDIALS[medial] + tail)
+    return "".join(parts)
+
+
+def slugify(value: str, fallback: str = "platform") -> str:
+    """Create a URL-friendly slug from a string; Hangul is romanized first."""
+    normalized = unicodedata.normalize("NFKD", transliterate(value)).encode("ascii", "ignore").decode("ascii")
     normalized = normalized.lower()
     normalized = re.sub(r"[^a-z0-9\s-]", "", normalized)
     normalized = re.sub(r"[\s_-]+", "-", normalized).strip("-")
-    return normalized or "platform"
+    return normalized[:MAX_SLUG_LENGTH].strip("-") or fallback
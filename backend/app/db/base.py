@@ -1,5 +1,11 @@
 from sqlalchemy.orm import DeclarativeBase
 
+from app.core.config import get_settings
+
+# Relationships never load eagerly; queries choose a profile from app.db.loaders.
+# With DB_RAISELOAD enabled (e.g. in tests) an implicit lazy load raises instead.
+RELATIONSHIP_LAZY = "raise" if get_settings().db_raiseload else "select"
+
 
 class Base(DeclarativeBase):
     pass
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import List, Literal
+
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.db.models import Collection, Platform
+
+LoaderProfile = Literal["card", "detail", "admin"]
+
+
+def _platform_summary(attribute) -> LoaderOption:
+    # Related platforms are only rendered as id/slug/name, so never walk further.
+    return selectinload(attribute).load_only(Platform.id, Platform.slug, Platform.name)
+
+
+def platform_options(profile: LoaderProfile) -> List[LoaderOption]:
+    """Loader options for each way a platform is rendered.
+
+    ``card`` feeds ``PlatformCard``, ``detail`` feeds ``PlatformRead`` and ``admin``
+    also loads the full related platforms so write paths can reassign them.
+    """
+    options: List[LoaderOption] = [selectinload(Platform.categories), selectinload(Platform.tags)]
+    if profile == "card":
+        return options
+    options.append(_platform_summary(Platform.related_to))
+    if profile == "admin":
+        options.append(selectinload(Platform.related_platforms))
+    else:
+        options.append(_platform_summary(Platform.related_platforms))
+    return options
+
+
+def collection_options(profile: LoaderProfile) -> List[LoaderOption]:
+    """Loader options for collections; ``admin`` adds the link rows that writes replace."""
+    options: List[LoaderOption] = [_platform_summary(Collection.platforms)]
+    if profile == "admin":
+        options.append(selectinload(Collection.platform_links))
+    return options
@@ -1,12 +1,17 @@
+from app.db.models.catalog import CatalogState
 from app.db.models.collection import (
     Collection,
     CollectionPlatform,
     MetricEntityType,
     MetricsDaily,
+    MetricsLifetime,
+    MetricsMonthly,
+    MetricsWeekly,
 )
 from app.db.models.platform import (
     Category,
     Platform,
+    PlatformSimilarity,
     Tag,
     platform_categories,
     platform_related_platforms,
@@ -15,11 +20,16 @@ from app.db.models.platform import (
 from app.db.models.submission import Submission, SubmissionStatus
 
 __all__ = [
+    "CatalogState",
     "Collection",
     "CollectionPlatform",
     "MetricEntityType",
     "MetricsDaily",
+    "MetricsLifetime",
+    "MetricsMonthly",
+    "MetricsWeekly",
     "Platform",
+    "PlatformSimilarity",
     "Category",
     "Tag",
     "platform_categories",
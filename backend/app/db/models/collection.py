@@ -4,11 +4,11 @@ from datetime import date, datetime
 from enum import Enum
 from typing import List
 
-from sqlalchemy import Boolean, Date, DateTime, Enum as SqlEnum, Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, Date, DateTime, Enum as SqlEnum, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from app.db.base import Base
+from app.db.base import RELATIONSHIP_LAZY, Base
 
 
 class Collection(Base):
@@ -24,6 +24,8 @@ class Collection(Base):
     is_featured: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     display_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     trending_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    view_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    click_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
@@ -36,14 +38,14 @@ class Collection(Base):
         "CollectionPlatform",
         order_by="CollectionPlatform.position.asc()",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
     platforms: Mapped[List["Platform"]] = relationship(
         "Platform",
         secondary="collection_platforms",
         order_by="CollectionPlatform.position.asc()",
         viewonly=True,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
 
@@ -61,8 +63,10 @@ class CollectionPlatform(Base):
     )
     position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
-    collection: Mapped[Collection] = relationship("Collection", back_populates="platform_links")
-    platform: Mapped["Platform"] = relationship("Platform")
+    collection: Mapped[Collection] = relationship(
+        "Collection", back_populates="platform_links", lazy=RELATIONSHIP_LAZY
+    )
+    platform: Mapped["Platform"] = relationship("Platform", lazy=RELATIONSHIP_LAZY)
 
 
 class MetricEntityType(str, Enum):
@@ -74,6 +78,7 @@ class MetricsDaily(Base):
     __tablename__ = "metrics_daily"
     __table_args__ = (
         UniqueConstraint("entity_type", "entity_id", "date", name="uq_metric_daily_entity_date"),
+        Index("ix_metrics_daily_type_date", "entity_type", "date"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -84,9 +89,64 @@ class MetricsDaily(Base):
     date: Mapped[date] = mapped_column(Date, nullable=False)
     views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     clicks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unique_visitors: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
+
+
+class MetricsWeekly(Base):
+    __tablename__ = "metrics_weekly"
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", "week_start", name="uq_metric_weekly_entity_week"),
+        Index("ix_metrics_weekly_type_week", "entity_type", "week_start"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    entity_type: Mapped[MetricEntityType] = mapped_column(
+        SqlEnum(MetricEntityType, name="metric_entity_type"), nullable=False
+    )
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    week_start: Mapped[date] = mapped_column(Date, nullable=False)
+    views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    clicks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+class MetricsMonthly(Base):
+    __tablename__ = "metrics_monthly"
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", "month_start", name="uq_metric_monthly_entity_month"),
+        Index("ix_metrics_monthly_type_month", "entity_type", "month_start"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    entity_type: Mapped[MetricEntityType] = mapped_column(
+        SqlEnum(MetricEntityType, name="metric_entity_type"), nullable=False
+    )
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    month_start: Mapped[date] = mapped_column(Date, nullable=False)
+    views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    clicks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+class MetricsLifetime(Base):
+    __tablename__ = "metrics_lifetime"
+
+    entity_type: Mapped[MetricEntityType] = mapped_column(
+        SqlEnum(MetricEntityType, name="metric_entity_type"), primary_key=True
+    )
+    entity_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    clicks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
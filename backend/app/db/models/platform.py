@@ -2,10 +2,24 @@ from __future__ import annotations
 
 from typing import Dict, List
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Table, Text, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    DDL,
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    event,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, backref, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import RELATIONSHIP_LAZY, Base
 
 
 platform_categories = Table(
@@ -40,8 +54,39 @@ platform_related_platforms = Table(
 )
 
 
+# Weighted search document; the "simple" configuration keeps Korean tokens intact.
+# It is maintained by a trigger instead of a generated column: adding a generated
+# column rewrites the table, and the trigger only fires when the name or
+# description changes, so counter updates skip the tsvector work.
+PLATFORM_SEARCH_TRIGGER = DDL(
+    """
+CREATE OR REPLACE FUNCTION platforms_search_vector_update() RETURNS trigger AS $$
+BEGIN
+  NEW.search_vector :=
+    setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER platforms_search_vector_update
+BEFORE INSERT OR UPDATE OF name, description ON platforms
+FOR EACH ROW EXECUTE FUNCTION platforms_search_vector_update();
+"""
+)
+
+
 class Platform(Base):
     __tablename__ = "platforms"
+    __table_args__ = (
+        Index("ix_platforms_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_platforms_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
@@ -51,26 +96,29 @@ class Platform(Base):
     ios_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     android_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     web_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    view_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    click_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
 
     categories: Mapped[List["Category"]] = relationship(
         "Category",
         secondary=platform_categories,
         back_populates="platforms",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
     tags: Mapped[List["Tag"]] = relationship(
         "Tag",
         secondary=platform_tags,
         back_populates="platforms",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
     related_platforms: Mapped[List["Platform"]] = relationship(
         "Platform",
         secondary=platform_related_platforms,
         primaryjoin=id == platform_related_platforms.c.platform_id,
         secondaryjoin=id == platform_related_platforms.c.related_platform_id,
-        backref="related_to",
-        lazy="selectin",
+        backref=backref("related_to", lazy=RELATIONSHIP_LAZY),
+        lazy=RELATIONSHIP_LAZY,
     )
 
     @property
@@ -90,6 +138,25 @@ class Platform(Base):
         return list(seen.values())
 
 
+event.listen(Platform.__table__, "after_create", PLATFORM_SEARCH_TRIGGER.execute_if(dialect="postgresql"))
+
+
+class PlatformSimilarity(Base):
+    """Precomputed top-K neighbours of a platform, rebuilt by the similarity job."""
+
+    __tablename__ = "platform_similarities"
+    __table_args__ = (Index("ix_platform_similarities_platform_rank", "platform_id", "rank"),)
+
+    platform_id: Mapped[int] = mapped_column(
+        ForeignKey("platforms.id", ondelete="CASCADE"), primary_key=True
+    )
+    similar_platform_id: Mapped[int] = mapped_column(
+        ForeignKey("platforms.id", ondelete="CASCADE"), primary_key=True
+    )
+    rank: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+
+
 class Category(Base):
     __tablename__ = "categories"
 
@@ -100,7 +167,7 @@ class Category(Base):
         "Platform",
         secondary=platform_categories,
         back_populates="categories",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
 
@@ -114,5 +181,5 @@ class Tag(Base):
         "Platform",
         secondary=platform_tags,
         back_populates="tags",
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
@@ -6,7 +6,7 @@ from datetime import datetime
 from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import RELATIONSHIP_LAZY, Base
 
 
 class SubmissionStatus(str, enum.Enum):
@@ -39,7 +39,7 @@ class Submission(Base):
     platform_id: Mapped[int | None] = mapped_column(
         ForeignKey("platforms.id", ondelete="SET NULL"), nullable=True
     )
-    platform = relationship("Platform", lazy="joined")
+    platform = relationship("Platform", lazy=RELATIONSHIP_LAZY)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
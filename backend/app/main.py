@@ -14,7 +14,8 @@ app.add_middleware(ExceptionHandlingMiddleware)
 
 @app.on_event("startup")
 async def startup_event() -> None:
-    await analytics.start()
+    if settings.analytics_run_in_api:
+        await analytics.start()
 
 
 @app.on_event("shutdown")
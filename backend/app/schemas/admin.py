@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -10,3 +12,30 @@ class AdminLoginRequest(BaseModel):
 
 class AdminSession(BaseModel):
     username: str
+
+
+class ScheduledJobStatus(BaseModel):
+    name: str
+    schedule: str
+    running: bool
+    last_status: Optional[str] = None
+    last_started_at: Optional[str] = None
+    last_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+    last_runner: Optional[str] = None
+
+
+class SchedulerStatus(BaseModel):
+    leader: Optional[str] = None
+    instance_id: str
+    is_leader: bool
+    jobs: List[ScheduledJobStatus]
+
+
+class ResponseCacheStats(BaseModel):
+    enabled: bool
+    hits: int
+    misses: int
+    stores: int
+    invalidations: int
+    hit_ratio: float
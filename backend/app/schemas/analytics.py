@@ -1,18 +1,39 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.core.config import get_settings
+
 
 class AnalyticsEvent(BaseModel):
     entity_type: Literal["collection", "platform"]
     entity_id: int = Field(..., ge=1)
     event_type: Literal["view", "click"]
     occurred_at: Optional[datetime] = None
+    visitor_id: Optional[str] = Field(default=None, max_length=128)
     metadata: Dict[str, str] | None = None
 
+    @field_validator("occurred_at")
+    @classmethod
+    def check_occurred_at(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # The timestamp picks the metrics_daily bucket and the trending boost, so
+        # only a small clock skew ahead of the server is tolerated.
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        settings = get_settings()
+        now = datetime.now(timezone.utc)
+        if value > now + timedelta(seconds=settings.analytics_max_clock_skew_seconds):
+            raise ValueError("미래 시각의 이벤트는 받을 수 없습니다.")
+        retention_days = settings.analytics_daily_retention_days
+        if retention_days > 0 and value < now - timedelta(days=retention_days):
+            raise ValueError("보존 기간보다 오래된 이벤트는 받을 수 없습니다.")
+        return value
+
     @field_validator("metadata")
     @classmethod
     def normalize_metadata(cls, value: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
@@ -21,10 +42,21 @@ class AnalyticsEvent(BaseModel):
         return {str(key): str(val) for key, val in value.items()}
 
 
+class AnalyticsEventRejection(BaseModel):
+    index: int
+    message: str
+
+
+class AnalyticsEventBatchResult(BaseModel):
+    accepted: int
+    rejected: List[AnalyticsEventRejection] = Field(default_factory=list)
+
+
 class DailyMetricPoint(BaseModel):
     date: date
     views: int
     clicks: int
+    unique_visitors: Optional[int] = None
 
 
 class TopCollectionMetric(BaseModel):
@@ -34,8 +66,35 @@ class TopCollectionMetric(BaseModel):
     views: int
     clicks: int
     trending_score: float
+    unique_visitors: Optional[int] = None
+
+
+class TrendingEntity(BaseModel):
+    entity_type: Literal["collection", "platform"]
+    entity_id: int
+    score: float
 
 
 class AnalyticsDashboard(BaseModel):
+    granularity: Literal["day", "week", "month"] = "day"
     daily: List[DailyMetricPoint]
     top_collections: List[TopCollectionMetric]
+
+
+class AnalyticsQueueStats(BaseModel):
+    backend: Literal["list", "stream"]
+    length: int
+    lag: int
+    pending: int
+    consumers: int = 0
+
+
+class AnalyticsConsumerStats(BaseModel):
+    batches: int
+    events: int
+    rows_written: int
+    last_batch_events: int
+    last_batch_rows: int
+    last_flush_seconds: float
+    events_per_second: float
+    queue: AnalyticsQueueStats
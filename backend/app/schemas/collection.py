@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.schemas.platform import PlatformSummary
+from app.schemas.serializers import collection_full
 
 
 class CollectionPlatformSummary(PlatformSummary):
@@ -18,6 +19,28 @@ class CollectionMetrics(BaseModel):
     trending_score: float = 0.0
 
 
+CollectionView = Literal["summary", "card", "full"]
+
+
+class CollectionSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    slug: str
+    title: str
+
+
+# Rows are rendered by serializers.collection_card; this model only documents the shape.
+class CollectionCard(CollectionSummary):
+    description: Optional[str]
+    highlight: Optional[str]
+    cover_image_url: Optional[str]
+    is_featured: bool
+    trending_score: float
+    platform_count: int = 0
+    metrics: CollectionMetrics = Field(default_factory=CollectionMetrics)
+
+
 class CollectionBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
@@ -70,28 +93,7 @@ class CollectionRead(BaseModel):
         if isinstance(value, dict):
             return value
 
-        collection = value
-        payload = {
-            "id": collection.id,
-            "slug": collection.slug,
-            "title": collection.title,
-            "description": collection.description,
-            "highlight": collection.highlight,
-            "cover_image_url": collection.cover_image_url,
-            "is_public": collection.is_public,
-            "is_featured": collection.is_featured,
-            "display_order": collection.display_order,
-            "trending_score": collection.trending_score,
-            "published_at": collection.published_at,
-            "created_at": collection.created_at,
-            "updated_at": collection.updated_at,
-            "platforms": [CollectionPlatformSummary.model_validate(p) for p in getattr(collection, "platforms", [])],
-        }
-
-        metrics = getattr(collection, "__metrics__", None)
-        if metrics:
-            payload["metrics"] = metrics
-        return payload
+        return collection_full(value)
 
 
 class CollectionListResponse(BaseModel):
@@ -101,5 +103,6 @@ class CollectionListResponse(BaseModel):
 
 CollectionCreate.model_rebuild()
 CollectionUpdate.model_rebuild()
+CollectionCard.model_rebuild()
 CollectionRead.model_rebuild()
 CollectionListResponse.model_rebuild()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
@@ -58,6 +58,9 @@ class PlatformLinks(BaseModel):
         return value
 
 
+PlatformView = Literal["summary", "card", "full"]
+
+
 class PlatformSummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -66,6 +69,17 @@ class PlatformSummary(BaseModel):
     name: str
 
 
+class PlatformCard(PlatformSummary):
+    description: Optional[str]
+    url: Optional[str]
+    categories: List[CategoryRef]
+    tags: List[TagRef]
+
+
+class SimilarPlatform(PlatformCard):
+    score: float
+
+
 class PlatformRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -101,7 +115,61 @@ class PlatformRead(BaseModel):
         return value
 
 
+ImportName = Annotated[str, Field(min_length=1, max_length=255)]
+
+
+class PlatformImportRow(BaseModel):
+    """One NDJSON object or CSV record; CSV list cells separate names with "|"."""
+
+    name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    url: Optional[str] = Field(default=None, max_length=500)
+    ios_url: Optional[str] = Field(default=None, max_length=500)
+    android_url: Optional[str] = Field(default=None, max_length=500)
+    web_url: Optional[str] = Field(default=None, max_length=500)
+    categories: List[ImportName] = Field(default_factory=list)
+    tags: List[ImportName] = Field(default_factory=list)
+    related: List[ImportName] = Field(default_factory=list, description="Slugs of existing platforms")
+
+    @field_validator("name", mode="before")
+    @classmethod
+    def strip_name(cls, value):
+        return value.strip() if isinstance(value, str) else value
+
+    @field_validator("description", "url", "ios_url", "android_url", "web_url", mode="before")
+    @classmethod
+    def blank_to_none(cls, value):
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
+    @field_validator("categories", "tags", "related", mode="before")
+    @classmethod
+    def split_names(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = value.split("|")
+        if isinstance(value, list):
+            names = [item.strip() if isinstance(item, str) else item for item in value]
+            return list(dict.fromkeys(name for name in names if name != ""))
+        return value
+
+
+class ImportLineError(BaseModel):
+    line: int
+    message: str
+
+
+class ImportReport(BaseModel):
+    imported: int
+    failed: int
+    errors: List[ImportLineError]
+    errors_truncated: bool = False
+
+
 PlatformBase.model_rebuild()
 PlatformCreate.model_rebuild()
 PlatformUpdate.model_rebuild()
+PlatformCard.model_rebuild()
 PlatformRead.model_rebuild()
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class SearchSuggestion(BaseModel):
+    type: Literal["platform", "collection"]
+    id: int
+    slug: str
+    title: str
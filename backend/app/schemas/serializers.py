@@ -0,0 +1,125 @@
+"""Validation-free builders producing the same JSON shapes as the read schemas.
+
+These are used by hot read endpoints whose data comes straight from the ORM, so
+re-validating it through Pydantic would only cost time. Keep them in sync with
+``PlatformRead``/``PlatformCard``/``PlatformSummary`` and the collection schemas.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from app.db.models import Collection, Platform
+
+Payload = Dict[str, Any]
+
+
+def platform_summary(platform: Any) -> Payload:
+    return {"id": platform.id, "slug": platform.slug, "name": platform.name}
+
+
+def platform_card(platform: Platform) -> Payload:
+    return {
+        "id": platform.id,
+        "slug": platform.slug,
+        "name": platform.name,
+        "description": platform.description,
+        "url": platform.url,
+        "categories": [{"id": category.id, "name": category.name} for category in platform.categories],
+        "tags": [{"id": tag.id, "name": tag.name} for tag in platform.tags],
+    }
+
+
+def platform_full(platform: Platform) -> Payload:
+    payload = platform_card(platform)
+    payload["links"] = {"ios": platform.ios_url, "android": platform.android_url, "web": platform.web_url}
+    payload["related_platforms"] = [platform_summary(item) for item in platform.all_related_platforms]
+    return payload
+
+
+PLATFORM_VIEWS = {"summary": platform_summary, "card": platform_card, "full": platform_full}
+
+
+def collection_summary(collection: Any) -> Payload:
+    return {"id": collection.id, "slug": collection.slug, "title": collection.title}
+
+
+def _collection_metrics(collection: Any) -> Payload:
+    return {
+        "views": collection.view_count or 0,
+        "clicks": collection.click_count or 0,
+        "trending_score": collection.trending_score or 0.0,
+    }
+
+
+def collection_card(row: Any) -> Payload:
+    return {
+        "id": row.id,
+        "slug": row.slug,
+        "title": row.title,
+        "description": row.description,
+        "highlight": row.highlight,
+        "cover_image_url": row.cover_image_url,
+        "is_featured": row.is_featured,
+        "trending_score": row.trending_score,
+        "platform_count": row.platform_count or 0,
+        "metrics": _collection_metrics(row),
+    }
+
+
+def collection_full(collection: Collection) -> Payload:
+    return {
+        "id": collection.id,
+        "slug": collection.slug,
+        "title": collection.title,
+        "description": collection.description,
+        "highlight": collection.highlight,
+        "cover_image_url": collection.cover_image_url,
+        "is_public": collection.is_public,
+        "is_featured": collection.is_featured,
+        "display_order": collection.display_order,
+        "trending_score": collection.trending_score,
+        "published_at": collection.published_at,
+        "created_at": collection.created_at,
+        "updated_at": collection.updated_at,
+        "platforms": [platform_summary(platform) for platform in collection.platforms],
+        "metrics": _collection_metrics(collection),
+    }
+
+
+COLLECTION_VIEWS = {"summary": collection_summary, "card": collection_card, "full": collection_full}
+
+
+def platform_export(row: Any, categories: List[Payload], tags: List[Payload], related: List[Payload]) -> Payload:
+    """``platform_full`` for a plain column row whose relationships were loaded in batch."""
+    return {
+        "id": row.id,
+        "slug": row.slug,
+        "name": row.name,
+        "description": row.description,
+        "url": row.url,
+        "categories": categories,
+        "tags": tags,
+        "links": {"ios": row.ios_url, "android": row.android_url, "web": row.web_url},
+        "related_platforms": related,
+    }
+
+
+def collection_export(row: Any, platforms: List[Payload]) -> Payload:
+    """``collection_full`` for a plain column row and its batch-loaded platform summaries."""
+    return {
+        "id": row.id,
+        "slug": row.slug,
+        "title": row.title,
+        "description": row.description,
+        "highlight": row.highlight,
+        "cover_image_url": row.cover_image_url,
+        "is_public": row.is_public,
+        "is_featured": row.is_featured,
+        "display_order": row.display_order,
+        "trending_score": row.trending_score,
+        "published_at": row.published_at,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "platforms": platforms,
+        "metrics": _collection_metrics(row),
+    }
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import List
+
+from pydantic import BaseModel
+
+from app.schemas.platform import CategoryRef, TagRef
+
+
+class Taxonomy(BaseModel):
+    version: int
+    categories: List[CategoryRef]
+    tags: List[TagRef]
@@ -3,19 +3,33 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple
 
 from redis.asyncio import Redis
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import Date, Float, Integer, and_, cast, column, delete, func, literal, null, or_, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.config import get_settings
-from app.db.models import Collection, MetricEntityType, MetricsDaily
+from app.db.models import (
+    Collection,
+    MetricEntityType,
+    MetricsDaily,
+    MetricsLifetime,
+    MetricsMonthly,
+    MetricsWeekly,
+    Platform,
+)
 from app.db.session import SessionLocal
 from app.schemas.analytics import AnalyticsDashboard
-from app.schemas.collection import CollectionMetrics
+from app.services.analytics_queue import EventQueue, QueuedMessage, build_event_queue
+from app.services.scheduler import LeaseScheduler
+from app.services.similarity import rebuild_similar_platforms
+from app.services.trending import TrendingLeaderboard
+from app.services.unique_visitors import UniqueVisitorCounter
 
 logger = logging.getLogger(__name__)
 
@@ -26,36 +40,158 @@ class QueuedEvent:
     entity_id: int
     event_type: str
     occurred_at: datetime
+    visitor_id: Optional[str] = None
+
+
+MetricKey = Tuple[str, int, Optional[date]]
+
+CONSUMER_STATS_KEY = "analytics:consumer:stats"
+Granularity = Literal["day", "week", "month"]
+
+
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_period(day: date, granularity: Granularity) -> date:
+    if granularity == "day":
+        return day + timedelta(days=1)
+    if granularity == "week":
+        return day + timedelta(days=7)
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _align_period(day: date, granularity: Granularity) -> date:
+    if granularity == "week":
+        return week_start(day)
+    if granularity == "month":
+        return month_start(day)
+    return day
+
+
+def _lock_order(item: Tuple[MetricKey, MetricDelta]) -> Tuple[str, int, date]:
+    entity_type, entity_id, day = item[0]
+    return entity_type, entity_id, day or date.min
+
+
+# Entities carrying denormalised lifetime view/click counters.
+COUNTER_MODELS = {
+    MetricEntityType.COLLECTION: Collection,
+    MetricEntityType.PLATFORM: Platform,
+}
+
+
+# Rollup table and period column used for each dashboard granularity.
+ROLLUP_PERIODS = {
+    "day": (MetricsDaily, MetricsDaily.date),
+    "week": (MetricsWeekly, MetricsWeekly.week_start),
+    "month": (MetricsMonthly, MetricsMonthly.month_start),
+}
+
+
+@dataclass(slots=True)
+class MetricDelta:
+    views: int = 0
+    clicks: int = 0
+
+
+@dataclass(slots=True)
+class ConsumerStats:
+    batches: int = 0
+    events: int = 0
+    rows_written: int = 0
+    last_batch_events: int = 0
+    last_batch_rows: int = 0
+    last_flush_seconds: float = 0.0
+    events_per_second: float = 0.0
+
+
+@dataclass(slots=True)
+class PendingBatch:
+    messages: List[QueuedMessage]
+    events: List[QueuedEvent]
+    uniques: Dict[MetricKey, int]
+    repeats: Set[int]
+    started: float
+    attempts: int = 0
 
 
 class AnalyticsService:
     def __init__(self) -> None:
         settings = get_settings()
         self.redis: Redis = Redis.from_url(settings.redis_url, encoding="utf-8", decode_responses=False)
-        self.queue_key = "analytics:events"
-        self._consumer_task: Optional[asyncio.Task[Any]] = None
-        self._scheduler_task: Optional[asyncio.Task[Any]] = None
+        self.settings = settings
+        self.queue = build_event_queue(self.redis, settings)
+        self._consumer_tasks: List[asyncio.Task[Any]] = []
+        self.scheduler = LeaseScheduler(
+            self.redis,
+            lease_seconds=settings.scheduler_lease_seconds,
+            poll_seconds=settings.scheduler_poll_seconds,
+        )
+        self._scheduler_started = False
         self._running = False
+        self.trending = TrendingLeaderboard(
+            self.redis, half_life_seconds=settings.analytics_trending_half_life_seconds
+        )
+        self.trending_source = settings.analytics_trending_source
+        self.trending_metric = settings.analytics_trending_metric
+        self.unique_visitors = UniqueVisitorCounter(self.redis)
         self.trending_window_days = 7
+        if self.trending_source == "redis":
+            self.trending_interval = max(settings.analytics_trending_sync_seconds, 10)
+        else:
+            self.trending_interval = max(settings.analytics_trending_interval_seconds, 60)
+        self.batch_size = max(settings.analytics_batch_size, 1)
+        self.flush_interval = max(settings.analytics_flush_interval_ms, 0) / 1000
+        self.stats = ConsumerStats()
+        self.daily_retention_days = max(settings.analytics_daily_retention_days, 0)
+        self.compaction_chunk_size = 10_000
+        self.flush_attempts = 5
+        self.scheduler.register("trending-refresh", self._refresh_trending, every=self.trending_interval)
+        self.scheduler.register(
+            "metrics-compaction", self._run_compaction, cron=settings.analytics_compaction_cron
+        )
+        self.scheduler.register(
+            "similar-platforms", self._refresh_similar_platforms, cron=settings.similar_platforms_cron
+        )
 
     async def enqueue_event(self, payload: Dict[str, Any]) -> None:
         data = json.dumps(payload, default=str)
-        await self.redis.rpush(self.queue_key, data)
+        await self.queue.enqueue(data)
 
-    async def start(self) -> None:
+    async def enqueue_events(self, payloads: Sequence[Dict[str, Any]]) -> None:
+        """Enqueue several events in a single Redis round trip."""
+        await self.queue.enqueue_many([json.dumps(payload, default=str) for payload in payloads])
+
+    async def start(self, consumers: int = 1, scheduler: bool = True) -> None:
         if self._running:
             return
         self._running = True
         loop = asyncio.get_running_loop()
-        self._consumer_task = loop.create_task(self._consume_loop())
-        self._scheduler_task = loop.create_task(self._scheduler_loop())
-
-    async def shutdown(self) -> None:
+        for index in range(max(consumers, 1)):
+            queue = self.queue if index == 0 else build_event_queue(self.redis, self.settings, f"-{index}")
+            self._consumer_tasks.append(loop.create_task(self._consume_loop(queue)))
+        if scheduler:
+            self.scheduler.start()
+            self._scheduler_started = True
+
+    async def shutdown(self, drain_timeout: float = 0.0) -> None:
+        """Stop background tasks, letting consumers finish their in-flight batch first."""
         self._running = False
-        tasks = [self._consumer_task, self._scheduler_task]
-        for task in tasks:
-            if task is None:
-                continue
+        if self._consumer_tasks and drain_timeout > 0:
+            _, pending = await asyncio.wait(self._consumer_tasks, timeout=drain_timeout)
+            if pending:
+                logger.warning("Analytics consumers did not drain within %.1fs", drain_timeout)
+
+        if self._scheduler_started:
+            await self.scheduler.shutdown()
+            self._scheduler_started = False
+
+        for task in self._consumer_tasks:
             task.cancel()
             try:
                 await task
@@ -63,82 +199,325 @@ class AnalyticsService:
                 pass
             except Exception:  # pragma: no cover - defensive
                 logger.exception("Analytics background task shutdown failed")
-        self._consumer_task = None
-        self._scheduler_task = None
+        self._consumer_tasks = []
         try:
             await self.redis.aclose()
         except Exception:  # pragma: no cover - defensive
             logger.exception("Failed to close redis connection")
 
-    async def _consume_loop(self) -> None:
+    async def _consume_loop(self, queue: EventQueue) -> None:
+        batch: Optional[PendingBatch] = None
         try:
             while self._running:
-                item = await self.redis.blpop(self.queue_key, timeout=1)
-                if not item:
-                    continue
-                _, raw = item
-                try:
-                    payload = json.loads(raw)
-                    event = self._parse_event(payload)
-                except Exception:  # pragma: no cover - defensive
-                    logger.exception("Invalid analytics payload: %s", raw)
-                    continue
-                await asyncio.to_thread(self._apply_event, event)
+                if batch is None:
+                    started = time.perf_counter()
+                    messages = await queue.read_batch(self.batch_size, self.flush_interval)
+                    if not messages:
+                        continue
+                    events = self._decode_events([message.raw for message in messages])
+                    # PFADD is not idempotent: a redelivered event would look like a repeat
+                    # visit, so the classification travels with the batch across retries.
+                    uniques, repeats = await self._track_unique_visitors(events)
+                    batch = PendingBatch(messages, events, uniques, repeats, started)
+                flush_started = time.perf_counter()
+                rows = 0
+                if batch.events:
+                    try:
+                        rows = await asyncio.to_thread(self._apply_batch, batch.events, batch.uniques)
+                    except Exception:
+                        batch.attempts += 1
+                        if batch.attempts < self.flush_attempts:
+                            logger.exception(
+                                "Failed to persist analytics batch of %d events (attempt %d); retrying",
+                                len(batch.events),
+                                batch.attempts,
+                            )
+                        else:
+                            logger.exception(
+                                "Failed to persist analytics batch of %d events; returning it to the queue",
+                                len(batch.events),
+                            )
+                            await queue.requeue(batch.messages)
+                            batch = None
+                        await asyncio.sleep(1)
+                        continue
+                await queue.ack(batch.messages)
+                events = batch.events
+                if self.trending_metric == "unique_visitors" and batch.repeats:
+                    events = [event for index, event in enumerate(events) if index not in batch.repeats]
+                await self._record_trending(events)
+                finished = time.perf_counter()
+                await self._record_batch(len(events), rows, finished - flush_started, finished - batch.started)
+                batch = None
         except asyncio.CancelledError:
             raise
         except Exception:  # pragma: no cover - defensive
             logger.exception("Analytics consumer crashed")
         finally:
+            if batch is not None:
+                try:
+                    await queue.requeue(batch.messages)
+                except Exception:  # pragma: no cover - defensive
+                    logger.exception("Failed to return %d analytics events to the queue", len(batch.messages))
             logger.info("Analytics consumer stopped")
 
-    async def _scheduler_loop(self) -> None:
+    async def _track_unique_visitors(
+        self, events: Sequence[QueuedEvent]
+    ) -> Tuple[Dict[MetricKey, int], Set[int]]:
+        if not events:
+            return {}, set()
         try:
-            # run once on startup
-            await asyncio.to_thread(self._calculate_trending_scores)
-            while self._running:
-                now = datetime.now(timezone.utc)
-                seconds = self._seconds_until_next_run(now)
-                await asyncio.sleep(seconds)
-                await asyncio.to_thread(self._calculate_trending_scores)
-        except asyncio.CancelledError:
-            raise
+            return await self.unique_visitors.track(events)
         except Exception:  # pragma: no cover - defensive
-            logger.exception("Trending scheduler crashed")
-        finally:
-            logger.info("Trending scheduler stopped")
+            logger.exception("Failed to update unique visitor counts")
+            return {}, set()
 
-    def _apply_event(self, event: QueuedEvent) -> None:
-        session = SessionLocal()
+    async def _record_trending(self, events: Sequence[QueuedEvent]) -> None:
+        if not events:
+            return
         try:
-            metrics = session.execute(
-                select(MetricsDaily).where(
-                    and_(
-                        MetricsDaily.entity_type == MetricEntityType(event.entity_type),
-                        MetricsDaily.entity_id == event.entity_id,
-                        MetricsDaily.date == event.occurred_at.date(),
-                    )
-                )
-            ).scalar_one_or_none()
-
-            if metrics is None:
-                metrics = MetricsDaily(
-                    entity_type=MetricEntityType(event.entity_type),
-                    entity_id=event.entity_id,
-                    date=event.occurred_at.date(),
-                    views=0,
-                    clicks=0,
+            await self.trending.record(events)
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Failed to update trending leaderboards")
+
+    def _decode_events(self, raw_items: Sequence[bytes]) -> List[QueuedEvent]:
+        events: List[QueuedEvent] = []
+        for raw in raw_items:
+            try:
+                payload = json.loads(raw)
+                events.append(self._parse_event(payload))
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("Invalid analytics payload: %s", raw)
+        return events
+
+    async def _record_batch(self, event_count: int, rows: int, flush_seconds: float, batch_seconds: float) -> None:
+        stats = self.stats
+        stats.batches += 1
+        stats.events += event_count
+        stats.rows_written += rows
+        stats.last_batch_events = event_count
+        stats.last_batch_rows = rows
+        stats.last_flush_seconds = flush_seconds
+        stats.events_per_second = event_count / batch_seconds if batch_seconds > 0 else 0.0
+        logger.info(
+            "Flushed analytics batch: events=%d rows=%d flush=%.3fs rate=%.1f events/s",
+            event_count,
+            rows,
+            flush_seconds,
+            stats.events_per_second,
+        )
+        # Consumers usually run in the worker, so the API reads the totals from Redis.
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hincrby(CONSUMER_STATS_KEY, "batches", 1)
+                pipe.hincrby(CONSUMER_STATS_KEY, "events", event_count)
+                pipe.hincrby(CONSUMER_STATS_KEY, "rows_written", rows)
+                pipe.hset(
+                    CONSUMER_STATS_KEY,
+                    mapping={
+                        "last_batch_events": event_count,
+                        "last_batch_rows": rows,
+                        "last_flush_seconds": flush_seconds,
+                        "events_per_second": stats.events_per_second,
+                    },
                 )
+                await pipe.execute()
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Failed to publish analytics consumer stats")
+
+    async def get_consumer_stats(self) -> Dict[str, Any]:
+        """Cluster-wide consumer totals; ``last_*`` and the rate describe the most recent batch."""
+        published = await self.redis.hgetall(CONSUMER_STATS_KEY)
+        stats: Dict[str, Any] = {}
+        for name, default in asdict(ConsumerStats()).items():
+            value = published.get(name.encode())
+            stats[name] = type(default)(value.decode()) if value is not None else default
+        stats["queue"] = await self.queue.stats()
+        return stats
+
+    async def _refresh_trending(self) -> None:
+        try:
+            await self.trending.renormalise()
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Failed to renormalise trending leaderboards")
+
+        if self.trending_source == "redis":
+            scores = await self.trending.all_scores(MetricEntityType.COLLECTION.value)
+            await asyncio.to_thread(self._sync_trending_scores, scores)
+        else:
+            await asyncio.to_thread(self._calculate_trending_scores)
+
+    async def _run_compaction(self) -> None:
+        await asyncio.to_thread(self._compact_daily_metrics)
+
+    async def _refresh_similar_platforms(self) -> None:
+        await asyncio.to_thread(rebuild_similar_platforms, self.settings.similar_platforms_top_k)
 
+    async def get_trending(self, entity_type: str, limit: int) -> List[Tuple[int, float]]:
+        return await self.trending.top(entity_type, limit)
+
+    @staticmethod
+    def _aggregate_events(events: Sequence[QueuedEvent]) -> Dict[MetricKey, MetricDelta]:
+        deltas: Dict[MetricKey, MetricDelta] = defaultdict(MetricDelta)
+        for event in events:
+            delta = deltas[(event.entity_type, event.entity_id, event.occurred_at.date())]
             if event.event_type == "view":
-                metrics.views += 1
+                delta.views += 1
             elif event.event_type == "click":
-                metrics.clicks += 1
+                delta.clicks += 1
+        return deltas
+
+    @staticmethod
+    def _rollup(
+        deltas: Dict[MetricKey, MetricDelta], bucket: Callable[[date], Optional[date]]
+    ) -> Dict[MetricKey, MetricDelta]:
+        folded: Dict[MetricKey, MetricDelta] = defaultdict(MetricDelta)
+        for (entity_type, entity_id, day), delta in deltas.items():
+            target = folded[(entity_type, entity_id, bucket(day))]
+            target.views += delta.views
+            target.clicks += delta.clicks
+        return folded
 
-            session.add(metrics)
+    @staticmethod
+    def _upsert_counts(
+        session,
+        model,
+        deltas: Dict[MetricKey, MetricDelta],
+        period: Optional[str],
+        uniques: Optional[Dict[MetricKey, int]] = None,
+        **conflict: Any,
+    ) -> int:
+        # Sorted keys keep row lock order stable across concurrent consumers.
+        rows = []
+        for (entity_type, entity_id, day), delta in sorted(deltas.items(), key=_lock_order):
+            row = {
+                "entity_type": MetricEntityType(entity_type),
+                "entity_id": entity_id,
+                "views": delta.views,
+                "clicks": delta.clicks,
+            }
+            if period is not None:
+                row[period] = day
+            if uniques is not None:
+                row["unique_visitors"] = uniques.get((entity_type, entity_id, day), 0)
+            rows.append(row)
+
+        stmt = pg_insert(model).values(rows)
+        changes: Dict[str, Any] = {
+            "views": model.views + stmt.excluded.views,
+            "clicks": model.clicks + stmt.excluded.clicks,
+            "updated_at": func.now(),
+        }
+        if uniques is not None:
+            # PFCOUNT is an absolute, monotonically growing estimate.
+            changes["unique_visitors"] = func.greatest(model.unique_visitors, stmt.excluded.unique_visitors)
+        stmt = stmt.on_conflict_do_update(**conflict, set_=changes)
+        session.execute(stmt)
+        return len(rows)
+
+    def _apply_batch(
+        self, events: Sequence[QueuedEvent], uniques: Optional[Dict[MetricKey, int]] = None
+    ) -> int:
+        deltas = self._aggregate_events(events)
+        if not deltas:
+            return 0
+
+        session = SessionLocal()
+        try:
+            written = self._upsert_counts(
+                session,
+                MetricsDaily,
+                deltas,
+                "date",
+                uniques=uniques or {},
+                constraint="uq_metric_daily_entity_date",
+            )
+            written += self._upsert_counts(
+                session,
+                MetricsWeekly,
+                self._rollup(deltas, week_start),
+                "week_start",
+                constraint="uq_metric_weekly_entity_week",
+            )
+            written += self._upsert_counts(
+                session,
+                MetricsMonthly,
+                self._rollup(deltas, month_start),
+                "month_start",
+                constraint="uq_metric_monthly_entity_month",
+            )
+            written += self._upsert_counts(
+                session,
+                MetricsLifetime,
+                self._rollup(deltas, lambda day: None),
+                None,
+                index_elements=[MetricsLifetime.entity_type, MetricsLifetime.entity_id],
+            )
+            self._increment_counters(session, deltas)
             session.commit()
+            return written
         except Exception:
             session.rollback()
-            logger.exception("Failed to persist analytics event")
+            raise
+        finally:
+            session.close()
+
+    @staticmethod
+    def _increment_counters(session, deltas: Dict[MetricKey, MetricDelta]) -> None:
+        totals: Dict[str, Dict[int, MetricDelta]] = defaultdict(lambda: defaultdict(MetricDelta))
+        for (entity_type, entity_id, _), delta in deltas.items():
+            target = totals[entity_type][entity_id]
+            target.views += delta.views
+            target.clicks += delta.clicks
+
+        for entity_type, per_entity in totals.items():
+            model = COUNTER_MODELS[MetricEntityType(entity_type)]
+            source = values(
+                column("entity_id", Integer),
+                column("views", Integer),
+                column("clicks", Integer),
+                name="counter_deltas",
+            ).data([(entity_id, delta.views, delta.clicks) for entity_id, delta in sorted(per_entity.items())])
+            changes: Dict[str, Any] = {
+                "view_count": model.view_count + source.c.views,
+                "click_count": model.click_count + source.c.clicks,
+            }
+            if hasattr(model, "updated_at"):
+                # Counters are not content edits; keep updated_at untouched.
+                changes["updated_at"] = model.updated_at
+            session.execute(
+                update(model)
+                .where(model.id == source.c.entity_id)
+                .values(**changes)
+                .execution_options(synchronize_session=False)
+            )
+
+    def _compact_daily_metrics(self) -> None:
+        """Drop daily rows older than the retention window; rollups already hold their totals."""
+        if not self.daily_retention_days:
+            return
+        cutoff = date.today() - timedelta(days=self.daily_retention_days)
+        session = SessionLocal()
+        try:
+            removed = 0
+            while True:
+                expired_ids = (
+                    select(MetricsDaily.id)
+                    .where(MetricsDaily.entity_type.in_(list(MetricEntityType)))
+                    .where(MetricsDaily.date < cutoff)
+                    .limit(self.compaction_chunk_size)
+                    .scalar_subquery()
+                )
+                result = session.execute(delete(MetricsDaily).where(MetricsDaily.id.in_(expired_ids)))
+                session.commit()
+                removed += result.rowcount
+                if result.rowcount < self.compaction_chunk_size:
+                    break
+            if removed:
+                logger.info("Compacted %d daily metric rows older than %s", removed, cutoff)
+        except Exception:
+            session.rollback()
+            raise
         finally:
             session.close()
 
@@ -147,70 +526,126 @@ class AnalyticsService:
         try:
             today = date.today()
             start_date = today - timedelta(days=self.trending_window_days - 1)
-            rows: List[MetricsDaily] = (
-                session.execute(
-                    select(MetricsDaily)
-                    .where(MetricsDaily.entity_type == MetricEntityType.COLLECTION)
-                    .where(MetricsDaily.date >= start_date)
+            age = literal(today, Date) - MetricsDaily.date
+            if self.trending_metric == "unique_visitors":
+                audience = MetricsDaily.unique_visitors
+            else:
+                audience = MetricsDaily.views
+            weighted = cast(audience + MetricsDaily.clicks * 2, Float) / cast(age + 1, Float)
+
+            scores = (
+                select(MetricsDaily.entity_id.label("collection_id"), func.sum(weighted).label("score"))
+                .where(MetricsDaily.entity_type == MetricEntityType.COLLECTION)
+                .where(MetricsDaily.date >= start_date)
+                .group_by(MetricsDaily.entity_id)
+                .subquery()
+            )
+            targets = (
+                select(
+                    Collection.id.label("collection_id"),
+                    func.coalesce(scores.c.score, 0.0).label("score"),
                 )
-                .scalars()
-                .all()
+                .outerjoin(scores, scores.c.collection_id == Collection.id)
+                .subquery()
+            )
+            result = session.execute(
+                update(Collection)
+                .where(Collection.id == targets.c.collection_id)
+                .where(Collection.trending_score.is_distinct_from(targets.c.score))
+                .values(trending_score=targets.c.score)
+                .execution_options(synchronize_session=False)
             )
+            session.commit()
+            logger.info("Updated trending scores for %d collections", result.rowcount)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
 
-            scores: Dict[int, float] = defaultdict(float)
-            for row in rows:
-                age = (today - row.date).days
-                decay = 1 / (age + 1)
-                base_score = row.views + (row.clicks * 2)
-                scores[row.entity_id] += base_score * decay
-
-            session.execute(update(Collection).values(trending_score=0.0))
-            if scores:
-                for collection_id, value in scores.items():
-                    session.execute(
-                        update(Collection)
-                        .where(Collection.id == collection_id)
-                        .values(trending_score=value)
-                    )
+    def _sync_trending_scores(self, scores: Sequence[Tuple[int, float]]) -> None:
+        session = SessionLocal()
+        try:
+            rows = [(collection_id, round(score, 4)) for collection_id, score in scores]
+            if rows:
+                source = values(
+                    column("collection_id", Integer), column("score", Float), name="leaderboard"
+                ).data(rows)
+                session.execute(
+                    update(Collection)
+                    .where(Collection.id == source.c.collection_id)
+                    .where(Collection.trending_score.is_distinct_from(source.c.score))
+                    .values(trending_score=source.c.score)
+                    .execution_options(synchronize_session=False)
+                )
+            reset = update(Collection).where(Collection.trending_score != 0.0)
+            if rows:
+                reset = reset.where(Collection.id.not_in([collection_id for collection_id, _ in rows]))
+            session.execute(reset.values(trending_score=0.0).execution_options(synchronize_session=False))
             session.commit()
         except Exception:
             session.rollback()
-            logger.exception("Failed to calculate trending scores")
+            raise
         finally:
             session.close()
 
     async def get_dashboard(self, days: int = 14, top_limit: int = 5) -> AnalyticsDashboard:
         return await asyncio.to_thread(self._build_dashboard, days, top_limit)
 
+    def _dashboard_granularity(self, days: int) -> Granularity:
+        """Pick the coarsest rollup that still gives a readable series for ``days``."""
+        if days <= 31 and (not self.daily_retention_days or days <= self.daily_retention_days):
+            return "day"
+        if days <= 26 * 7:
+            return "week"
+        return "month"
+
     def _build_dashboard(self, days: int, top_limit: int) -> AnalyticsDashboard:
         session = SessionLocal()
         try:
+            granularity = self._dashboard_granularity(days)
+            model, period = ROLLUP_PERIODS[granularity]
             today = date.today()
-            start_date = today - timedelta(days=days - 1)
+            start_date = _align_period(today - timedelta(days=days - 1), granularity)
+
+            # Unique visitors only exist per day; summed days are not unique, so coarser
+            # rollups leave them out.
+            has_uniques = granularity == "day"
+            sum_uniques = func.coalesce(func.sum(MetricsDaily.unique_visitors), 0) if has_uniques else null()
 
             daily_rows = (
                 session.execute(
-                    select(MetricsDaily.date, func.sum(MetricsDaily.views), func.sum(MetricsDaily.clicks))
-                    .where(MetricsDaily.date >= start_date)
-                    .group_by(MetricsDaily.date)
-                    .order_by(MetricsDaily.date.asc())
+                    select(period, func.sum(model.views), func.sum(model.clicks), sum_uniques)
+                    .where(period >= start_date)
+                    .group_by(period)
+                    .order_by(period.asc())
                 )
                 .all()
             )
-            daily_map: Dict[date, Dict[str, int]] = {row[0]: {"views": int(row[1] or 0), "clicks": int(row[2] or 0)} for row in daily_rows}
+            daily_map: Dict[date, Dict[str, Optional[int]]] = {
+                row[0]: {
+                    "views": int(row[1] or 0),
+                    "clicks": int(row[2] or 0),
+                    "unique_visitors": int(row[3] or 0) if has_uniques else None,
+                }
+                for row in daily_rows
+            }
 
             daily_points = []
-            for index in range(days):
-                current = start_date + timedelta(days=index)
-                values = daily_map.get(current, {"views": 0, "clicks": 0})
+            current = start_date
+            empty_point = {"views": 0, "clicks": 0, "unique_visitors": 0 if has_uniques else None}
+            while current <= today:
+                values = daily_map.get(current, empty_point)
                 daily_points.append({
                     "date": current,
                     "views": values["views"],
                     "clicks": values["clicks"],
+                    "unique_visitors": values["unique_visitors"],
                 })
+                current = _next_period(current, granularity)
 
-            sum_views = func.coalesce(func.sum(MetricsDaily.views), 0)
-            sum_clicks = func.coalesce(func.sum(MetricsDaily.clicks), 0)
+            sum_views = func.coalesce(func.sum(model.views), 0)
+            sum_clicks = func.coalesce(func.sum(model.clicks), 0)
             top_rows = (
                 session.execute(
                     select(
@@ -220,13 +655,14 @@ class AnalyticsService:
                         sum_views.label("views"),
                         sum_clicks.label("clicks"),
                         Collection.trending_score,
+                        sum_uniques.label("unique_visitors"),
                     )
                     .outerjoin(
-                        MetricsDaily,
+                        model,
                         and_(
-                            MetricsDaily.entity_type == MetricEntityType.COLLECTION,
-                            MetricsDaily.entity_id == Collection.id,
-                            MetricsDaily.date >= start_date,
+                            model.entity_type == MetricEntityType.COLLECTION,
+                            model.entity_id == Collection.id,
+                            period >= start_date,
                         ),
                     )
                     .group_by(Collection.id)
@@ -244,25 +680,24 @@ class AnalyticsService:
                     "views": int(row[3] or 0),
                     "clicks": int(row[4] or 0),
                     "trending_score": float(row[5] or 0.0),
+                    "unique_visitors": int(row[6] or 0) if has_uniques else None,
                 }
                 for row in top_rows
             ]
 
-            return AnalyticsDashboard(daily=daily_points, top_collections=top_collections)
+            return AnalyticsDashboard(
+                granularity=granularity, daily=daily_points, top_collections=top_collections
+            )
         finally:
             session.close()
 
-    @staticmethod
-    def _seconds_until_next_run(now: datetime) -> float:
-        tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        return max((tomorrow - now).total_seconds(), 60.0)
-
     @staticmethod
     def _parse_event(payload: Dict[str, Any]) -> QueuedEvent:
         entity_type = str(payload.get("entity_type", "")).lower()
         event_type = str(payload.get("event_type", "")).lower()
         entity_id = int(payload.get("entity_id", 0))
         occurred_at_raw = payload.get("occurred_at")
+        visitor_raw = payload.get("visitor_id")
 
         if entity_type not in {"collection", "platform"}:
             raise ValueError("invalid entity type")
@@ -271,43 +706,90 @@ class AnalyticsService:
         if entity_id <= 0:
             raise ValueError("invalid entity id")
 
+        now = datetime.now(timezone.utc)
         if occurred_at_raw:
             occurred_at = datetime.fromisoformat(str(occurred_at_raw))
             if occurred_at.tzinfo is None:
                 occurred_at = occurred_at.replace(tzinfo=timezone.utc)
             else:
                 occurred_at = occurred_at.astimezone(timezone.utc)
+            # Never credit a future day or boost: the API allows a little clock skew.
+            occurred_at = min(occurred_at, now)
         else:
-            occurred_at = datetime.now(timezone.utc)
+            occurred_at = now
 
         return QueuedEvent(
             entity_type=entity_type,
             entity_id=entity_id,
             event_type=event_type,
             occurred_at=occurred_at,
+            visitor_id=str(visitor_raw)[:128] if visitor_raw else None,
         )
 
 
 analytics = AnalyticsService()
 
 
-def fetch_collection_metrics(session, collection_ids: List[int]) -> Dict[int, CollectionMetrics]:
-    if not collection_ids:
-        return {}
-    rows = (
-        session.execute(
+def repair_metric_counters(session, source: Literal["monthly", "daily"] = "monthly") -> Dict[str, int]:
+    """Recompute lifetime counters from stored metrics.
+
+    ``monthly`` covers the full history; ``daily`` is only complete while daily
+    retention is disabled. Only rows whose counters differ are updated.
+    """
+    model = MetricsMonthly if source == "monthly" else MetricsDaily
+    totals = (
+        select(
+            model.entity_type.label("entity_type"),
+            model.entity_id.label("entity_id"),
+            func.sum(model.views).label("views"),
+            func.sum(model.clicks).label("clicks"),
+        )
+        .group_by(model.entity_type, model.entity_id)
+        .subquery()
+    )
+
+    repaired: Dict[str, int] = {}
+    lifetime = pg_insert(MetricsLifetime).from_select(
+        ["entity_type", "entity_id", "views", "clicks"],
+        select(totals.c.entity_type, totals.c.entity_id, totals.c.views, totals.c.clicks),
+    )
+    lifetime = lifetime.on_conflict_do_update(
+        index_elements=[MetricsLifetime.entity_type, MetricsLifetime.entity_id],
+        set_={"views": lifetime.excluded.views, "clicks": lifetime.excluded.clicks, "updated_at": func.now()},
+        where=or_(
+            MetricsLifetime.views != lifetime.excluded.views,
+            MetricsLifetime.clicks != lifetime.excluded.clicks,
+        ),
+    )
+    repaired["metrics_lifetime"] = session.execute(lifetime).rowcount
+
+    for entity_type, entity_model in COUNTER_MODELS.items():
+        targets = (
             select(
-                MetricsDaily.entity_id,
-                func.sum(MetricsDaily.views),
-                func.sum(MetricsDaily.clicks),
+                entity_model.id.label("entity_id"),
+                func.coalesce(totals.c.views, 0).label("views"),
+                func.coalesce(totals.c.clicks, 0).label("clicks"),
             )
-            .where(MetricsDaily.entity_type == MetricEntityType.COLLECTION)
-            .where(MetricsDaily.entity_id.in_(collection_ids))
-            .group_by(MetricsDaily.entity_id)
+            .outerjoin(
+                totals,
+                and_(totals.c.entity_type == entity_type, totals.c.entity_id == entity_model.id),
+            )
+            .subquery()
         )
-        .all()
-    )
-    return {
-        row[0]: CollectionMetrics(views=int(row[1] or 0), clicks=int(row[2] or 0))
-        for row in rows
-    }
+        changes: Dict[str, Any] = {"view_count": targets.c.views, "click_count": targets.c.clicks}
+        if hasattr(entity_model, "updated_at"):
+            changes["updated_at"] = entity_model.updated_at
+        result = session.execute(
+            update(entity_model)
+            .where(entity_model.id == targets.c.entity_id)
+            .where(
+                or_(
+                    entity_model.view_count != targets.c.views,
+                    entity_model.click_count != targets.c.clicks,
+                )
+            )
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
+        repaired[entity_model.__tablename__] = result.rowcount
+    return repaired
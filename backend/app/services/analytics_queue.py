@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class QueuedMessage:
+    message_id: Optional[bytes]
+    raw: bytes
+
+
+class ListEventQueue:
+    """Plain Redis list queue (``RPUSH`` / ``BLPOP``); popped events are lost if a worker dies."""
+
+    backend = "list"
+
+    def __init__(self, redis: Redis, key: str) -> None:
+        self.redis = redis
+        self.key = key
+
+    async def setup(self) -> None:
+        return None
+
+    async def enqueue(self, data: str) -> None:
+        await self.redis.rpush(self.key, data)
+
+    async def enqueue_many(self, items: List[str]) -> None:
+        if items:
+            await self.redis.rpush(self.key, *items)
+
+    async def read_batch(self, batch_size: int, flush_interval: float) -> List[QueuedMessage]:
+        item = await self.redis.blpop(self.key, timeout=1)
+        if not item:
+            return []
+
+        batch: List[bytes] = [item[1]]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + flush_interval
+        while len(batch) < batch_size:
+            chunk = await self.redis.lpop(self.key, batch_size - len(batch))
+            if chunk:
+                batch.extend(chunk)
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            item = await self.redis.blpop(self.key, timeout=remaining)
+            if not item:
+                break
+            batch.append(item[1])
+        return [QueuedMessage(message_id=None, raw=raw) for raw in batch]
+
+    async def ack(self, messages: List[QueuedMessage]) -> None:
+        return None
+
+    async def requeue(self, messages: List[QueuedMessage]) -> None:
+        """Put a batch that failed to flush back at the head of the list, in its original order."""
+        if messages:
+            await self.redis.lpush(self.key, *(message.raw for message in reversed(messages)))
+
+    async def stats(self) -> Dict[str, Any]:
+        length = int(await self.redis.llen(self.key))
+        return {"backend": self.backend, "length": length, "lag": length, "pending": 0}
+
+
+class StreamEventQueue:
+    """Redis Streams queue with a consumer group, giving at-least-once delivery.
+
+    Entries stay in the group's pending list until they are acknowledged after a
+    successful flush. Entries left pending by a dead worker for longer than
+    ``claim_idle_ms`` are taken over with ``XAUTOCLAIM``.
+
+    Acknowledged entries are trimmed with ``XTRIM MINID`` up to the oldest
+    pending (or last delivered) id, so unread and pending entries are never
+    dropped. ``maxlen`` is an opt-in hard cap that does drop unread entries once
+    consumers fall that far behind; reaching it is logged.
+    """
+
+    backend = "stream"
+    payload_field = b"payload"
+    trim_interval = 5.0
+
+    def __init__(
+        self,
+        redis: Redis,
+        key: str,
+        group: str,
+        consumer: str,
+        *,
+        claim_idle_ms: int,
+        maxlen: Optional[int],
+    ) -> None:
+        self.redis = redis
+        self.key = key
+        self.group = group
+        self.consumer = consumer
+        self.claim_idle_ms = claim_idle_ms
+        self.maxlen = maxlen
+        self._next_claim_at = 0.0
+        self._next_trim_at = 0.0
+        self._ready = False
+
+    async def setup(self) -> None:
+        if self._ready:
+            return
+        try:
+            await self.redis.xgroup_create(self.key, self.group, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._ready = True
+
+    async def enqueue(self, data: str) -> None:
+        await self.redis.xadd(self.key, {self.payload_field: data}, maxlen=self.maxlen, approximate=True)
+
+    async def enqueue_many(self, items: List[str]) -> None:
+        if not items:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for data in items:
+                pipe.xadd(self.key, {self.payload_field: data}, maxlen=self.maxlen, approximate=True)
+            await pipe.execute()
+
+    async def read_batch(self, batch_size: int, flush_interval: float) -> List[QueuedMessage]:
+        await self.setup()
+        loop = asyncio.get_running_loop()
+
+        batch = await self._claim_stale(batch_size) if loop.time() >= self._next_claim_at else []
+        if len(batch) >= batch_size:
+            return batch
+
+        block_ms = 1000
+        deadline: Optional[float] = None
+        while len(batch) < batch_size:
+            try:
+                response = await self.redis.xreadgroup(
+                    self.group,
+                    self.consumer,
+                    {self.key: ">"},
+                    count=batch_size - len(batch),
+                    block=block_ms,
+                )
+            except ResponseError as exc:
+                if "NOGROUP" not in str(exc):
+                    raise
+                # The stream or group was removed underneath us; recreate on the next read.
+                self._ready = False
+                break
+            entries = response[0][1] if response else []
+            if not entries:
+                break
+            batch.extend(self._to_messages(entries))
+            if deadline is None:
+                deadline = loop.time() + flush_interval
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            block_ms = max(int(remaining * 1000), 1)
+        return batch
+
+    async def ack(self, messages: List[QueuedMessage]) -> None:
+        ids = [message.message_id for message in messages if message.message_id is not None]
+        if ids:
+            await self.redis.xack(self.key, self.group, *ids)
+            await self._trim_acknowledged()
+
+    async def requeue(self, messages: List[QueuedMessage]) -> None:
+        # Unacknowledged entries stay pending and are reclaimed once they go stale.
+        return None
+
+    async def stats(self) -> Dict[str, Any]:
+        await self.setup()
+        length = int(await self.redis.xlen(self.key))
+        groups = await self.redis.xinfo_groups(self.key)
+        info = next((item for item in groups if _as_str(item.get("name")) == self.group), {})
+        pending = int(info.get("pending") or 0)
+        lag = info.get("lag")
+        return {
+            "backend": self.backend,
+            "length": length,
+            # ``lag`` is only reported by Redis >= 7; fall back to the stream length.
+            "lag": int(lag) if lag is not None else length,
+            "pending": pending,
+            "consumers": int(info.get("consumers") or 0),
+        }
+
+    async def _trim_acknowledged(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._next_trim_at:
+            return
+        self._next_trim_at = loop.time() + self.trim_interval
+
+        groups = await self.redis.xinfo_groups(self.key)
+        info = next((item for item in groups if _as_str(item.get("name")) == self.group), None)
+        if info is None:
+            return
+        lag = info.get("lag")
+        if self.maxlen is not None and lag is not None and int(lag) >= self.maxlen:
+            logger.warning(
+                "Analytics stream lag %d reached ANALYTICS_STREAM_MAXLEN (%d); unread events are being trimmed",
+                int(lag),
+                self.maxlen,
+            )
+        pending = await self.redis.xpending(self.key, self.group)
+        # Everything before the oldest pending entry (or, with none pending, the
+        # last delivered one) has been read and acknowledged.
+        boundary = pending.get("min") or info.get("last-delivered-id")
+        if boundary is not None and _as_str(boundary) != "0-0":
+            await self.redis.xtrim(self.key, minid=boundary, approximate=True)
+
+    async def _claim_stale(self, batch_size: int) -> List[QueuedMessage]:
+        loop = asyncio.get_running_loop()
+        self._next_claim_at = loop.time() + self.claim_idle_ms / 1000
+        response = await self.redis.xautoclaim(
+            self.key,
+            self.group,
+            self.consumer,
+            min_idle_time=self.claim_idle_ms,
+            start_id="0-0",
+            count=batch_size,
+        )
+        messages = self._to_messages(response[1])
+        if messages:
+            logger.warning("Reclaimed %d stale analytics events", len(messages))
+        return messages
+
+    def _to_messages(self, entries: List[Any]) -> List[QueuedMessage]:
+        messages: List[QueuedMessage] = []
+        for message_id, fields in entries:
+            if message_id is None or fields is None:
+                continue
+            messages.append(QueuedMessage(message_id=message_id, raw=fields.get(self.payload_field, b"")))
+        return messages
+
+
+def _as_str(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def default_consumer_name() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+EventQueue = Union[ListEventQueue, StreamEventQueue]
+
+
+def build_event_queue(redis: Redis, settings: Settings, consumer_suffix: str = "") -> EventQueue:
+    if settings.analytics_queue_backend == "stream":
+        consumer = settings.analytics_consumer_name or default_consumer_name()
+        return StreamEventQueue(
+            redis,
+            settings.analytics_stream_key,
+            settings.analytics_consumer_group,
+            f"{consumer}{consumer_suffix}",
+            claim_idle_ms=settings.analytics_claim_idle_ms,
+            maxlen=settings.analytics_stream_maxlen,
+        )
+    return ListEventQueue(redis, "analytics:events")
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.hangul import decompose
+from app.db.models import Platform
+from app.services.catalog import get_catalog_version
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over platform names and slugs.
+
+    Keys are the keystroke jamo spelling of each name and slug (see
+    ``app.core.hangul``), so a lookup is a ``bisect`` plus a short forward scan
+    and half-typed syllables still match. Reads only consult the catalog version
+    once per ``check_interval`` seconds; writes made by this process patch the
+    arrays and advance the version immediately.
+    """
+
+    def __init__(self, check_interval: float) -> None:
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._keys: List[str] = []
+        self._ids: List[int] = []
+        self._platforms: Dict[int, Tuple[str, str]] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    def ensure_fresh(self, db: Session) -> None:
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.check_interval:
+            return
+        version = get_catalog_version(db)
+        if version != self._version:
+            self.rebuild(db, version)
+        self._checked_at = now
+
+    def rebuild(self, db: Session, version: int) -> None:
+        rows = db.execute(select(Platform.id, Platform.slug, Platform.name))
+        platforms = {row.id: (row.slug, row.name) for row in rows}
+        entries = sorted(
+            (key, platform_id)
+            for platform_id, (slug, name) in platforms.items()
+            for key in self._entry_keys(slug, name)
+        )
+        with self._lock:
+            self._keys = [key for key, _ in entries]
+            self._ids = [platform_id for _, platform_id in entries]
+            self._platforms = platforms
+            self._version = version
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version = None
+
+    def lookup(self, query: str, limit: int = 10) -> List[Dict[str, object]]:
+        prefix = decompose(query)
+        if not prefix:
+            return []
+        results: List[Dict[str, object]] = []
+        seen = set()
+        with self._lock:
+            index = bisect.bisect_left(self._keys, prefix)
+            while index < len(self._keys) and len(results) < limit:
+                if not self._keys[index].startswith(prefix):
+                    break
+                platform_id = self._ids[index]
+                if platform_id not in seen:
+                    seen.add(platform_id)
+                    slug, name = self._platforms[platform_id]
+                    results.append({"id": platform_id, "slug": slug, "name": name})
+                index += 1
+        return results
+
+    def upsert(self, platform_id: int, slug: str, name: str, version: int) -> None:
+        with self._lock:
+            if not self._advance_locked(version):
+                return
+            self._discard(platform_id)
+            self._platforms[platform_id] = (slug, name)
+            for key in self._entry_keys(slug, name):
+                position = bisect.bisect_left(self._keys, key)
+                self._keys.insert(position, key)
+                self._ids.insert(position, platform_id)
+
+    def remove(self, platform_id: int, version: int) -> None:
+        with self._lock:
+            if self._advance_locked(version):
+                self._discard(platform_id)
+
+    def advance(self, version: int) -> bool:
+        """Move to ``version`` after a write that did not touch platform names."""
+        with self._lock:
+            return self._advance_locked(version)
+
+    def _advance_locked(self, version: int) -> bool:
+        if self._version != version - 1:
+            self._version = None
+            return False
+        self._version = version
+        return True
+
+    def _discard(self, platform_id: int) -> None:
+        current = self._platforms.pop(platform_id, None)
+        if current is None:
+            return
+        for key in self._entry_keys(*current):
+            position = bisect.bisect_left(self._keys, key)
+            while self._ids[position] != platform_id:
+                position += 1
+            del self._keys[position]
+            del self._ids[position]
+
+    @staticmethod
+    def _entry_keys(slug: str, name: str) -> set[str]:
+        return {decompose(name), decompose(slug)}
+
+
+autocomplete_index = PrefixIndex(get_settings().autocomplete_check_seconds)
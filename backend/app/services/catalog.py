@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.db.models import CatalogState, Category, Tag
+from app.schemas.platform import CategoryRef, TagRef
+from app.schemas.taxonomy import Taxonomy
+
+CATALOG_STATE_ID = 1
+
+
+def get_catalog_version(db: Session) -> int:
+    version = db.execute(
+        select(CatalogState.version).where(CatalogState.id == CATALOG_STATE_ID)
+    ).scalar_one_or_none()
+    return version or 0
+
+
+def get_catalog_state(db: Session) -> Tuple[int, Optional[datetime]]:
+    """Current catalog version and when it last changed."""
+    row = db.execute(
+        select(CatalogState.version, CatalogState.updated_at).where(CatalogState.id == CATALOG_STATE_ID)
+    ).first()
+    if row is None:
+        return 0, None
+    return row.version, row.updated_at
+
+
+def bump_catalog_version(db: Session) -> int:
+    """Increment the catalog version inside the caller's transaction and return it."""
+    stmt = (
+        pg_insert(CatalogState)
+        .values(id=CATALOG_STATE_ID, version=1)
+        .on_conflict_do_update(
+            index_elements=[CatalogState.id],
+            set_={"version": CatalogState.version + 1, "updated_at": func.now()},
+        )
+        .returning(CatalogState.version)
+    )
+    return db.execute(stmt).scalar_one()
+
+
+class TaxonomyCache:
+    """Categories and tags, reloaded only when the catalog version moves."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._taxonomy: Optional[Taxonomy] = None
+
+    @staticmethod
+    def etag(version: int) -> str:
+        return f'W/"taxonomy-{version}"'
+
+    def get(self, db: Session, version: Optional[int] = None) -> Taxonomy:
+        if version is None:
+            version = get_catalog_version(db)
+        cached = self._taxonomy
+        if cached is not None and cached.version == version:
+            return cached
+
+        # Plain column selects so the platforms relationships are never loaded.
+        categories = db.execute(select(Category.id, Category.name).order_by(Category.name.asc())).all()
+        tags = db.execute(select(Tag.id, Tag.name).order_by(Tag.name.asc())).all()
+        taxonomy = Taxonomy(
+            version=version,
+            categories=[CategoryRef(id=row.id, name=row.name) for row in categories],
+            tags=[TagRef(id=row.id, name=row.name) for row in tags],
+        )
+        with self._lock:
+            if self._taxonomy is None or self._taxonomy.version <= version:
+                self._taxonomy = taxonomy
+        return taxonomy
+
+
+taxonomy_cache = TaxonomyCache()
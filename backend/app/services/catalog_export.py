@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+from pydantic_core import to_json
+from sqlalchemy import Select, select, union_all
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    Category,
+    Collection,
+    CollectionPlatform,
+    Platform,
+    Tag,
+    platform_categories,
+    platform_related_platforms,
+    platform_tags,
+)
+from app.db.session import SessionLocal
+from app.schemas.serializers import Payload, collection_export, platform_export
+
+EXPORT_BATCH_SIZE = 1000
+
+Grouped = Dict[int, List[Payload]]
+
+
+def _grouped(db: Session, stmt: Select, keys: Tuple[str, ...]) -> Grouped:
+    """Run a keyed batch query whose first column is the owning id."""
+    grouped: Grouped = defaultdict(list)
+    for owner_id, *values in db.execute(stmt):
+        grouped[owner_id].append(dict(zip(keys, values)))
+    return grouped
+
+
+def _platform_relations(db: Session, ids: Sequence[int]) -> Tuple[Grouped, Grouped, Grouped]:
+    categories = _grouped(
+        db,
+        select(platform_categories.c.platform_id, Category.id, Category.name)
+        .join(Category, Category.id == platform_categories.c.category_id)
+        .where(platform_categories.c.platform_id.in_(ids))
+        .order_by(platform_categories.c.platform_id, Category.name),
+        ("id", "name"),
+    )
+    tags = _grouped(
+        db,
+        select(platform_tags.c.platform_id, Tag.id, Tag.name)
+        .join(Tag, Tag.id == platform_tags.c.tag_id)
+        .where(platform_tags.c.platform_id.in_(ids))
+        .order_by(platform_tags.c.platform_id, Tag.name),
+        ("id", "name"),
+    )
+    # Both directions of the link, like Platform.all_related_platforms.
+    edges = union_all(
+        select(
+            platform_related_platforms.c.platform_id.label("owner_id"),
+            platform_related_platforms.c.related_platform_id.label("other_id"),
+        ).where(platform_related_platforms.c.platform_id.in_(ids)),
+        select(
+            platform_related_platforms.c.related_platform_id,
+            platform_related_platforms.c.platform_id,
+        ).where(platform_related_platforms.c.related_platform_id.in_(ids)),
+    ).subquery()
+    related = _grouped(
+        db,
+        select(edges.c.owner_id, Platform.id, Platform.slug, Platform.name)
+        .distinct()
+        .join(Platform, Platform.id == edges.c.other_id)
+        .order_by(edges.c.owner_id, Platform.id),
+        ("id", "slug", "name"),
+    )
+    return categories, tags, related
+
+
+def _platform_batches(db: Session, after_id: int) -> Iterator[List[Payload]]:
+    stmt = (
+        select(
+            Platform.id,
+            Platform.slug,
+            Platform.name,
+            Platform.description,
+            Platform.url,
+            Platform.ios_url,
+            Platform.android_url,
+            Platform.web_url,
+        )
+        .where(Platform.id > after_id)
+        .order_by(Platform.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    for rows in db.execute(stmt).partitions():
+        categories, tags, related = _platform_relations(db, [row.id for row in rows])
+        yield [
+            platform_export(row, categories.get(row.id, []), tags.get(row.id, []), related.get(row.id, []))
+            for row in rows
+        ]
+
+
+def _collection_batches(db: Session, after_id: int, only_public: bool = True) -> Iterator[List[Payload]]:
+    stmt = (
+        select(Collection.__table__)
+        .where(Collection.id > after_id)
+        .order_by(Collection.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if only_public:
+        stmt = stmt.where(Collection.is_public.is_(True))
+    for rows in db.execute(stmt).partitions():
+        platforms = _grouped(
+            db,
+            select(CollectionPlatform.collection_id, Platform.id, Platform.slug, Platform.name)
+            .join(Platform, Platform.id == CollectionPlatform.platform_id)
+            .where(CollectionPlatform.collection_id.in_([row.id for row in rows]))
+            .order_by(CollectionPlatform.collection_id, CollectionPlatform.position),
+            ("id", "slug", "name"),
+        )
+        yield [collection_export(row, platforms.get(row.id, [])) for row in rows]
+
+
+def _stream(batches: Callable[..., Iterator[List[Payload]]], *args: object) -> Iterator[bytes]:
+    # The request session is closed before a streaming body is sent, so the
+    # export holds its own session, and with it the server-side cursor.
+    db = SessionLocal()
+    try:
+        for payloads in batches(db, *args):
+            yield b"".join(to_json(payload) + b"\n" for payload in payloads)
+    finally:
+        db.close()
+
+
+def export_platforms(after_id: int = 0) -> Iterator[bytes]:
+    """NDJSON chunks of every platform with an id above ``after_id``, in id order.
+
+    Rows come from a server-side cursor ``EXPORT_BATCH_SIZE`` at a time and each
+    batch loads its categories, tags and related platforms with one keyed query
+    apiece, so memory stays flat however large the catalog is. A client resumes
+    an interrupted export by passing the last id it received.
+    """
+    return _stream(_platform_batches, after_id)
+
+
+def export_collections(after_id: int = 0, only_public: bool = True) -> Iterator[bytes]:
+    """Same as ``export_platforms`` for collections and their ordered platform summaries."""
+    return _stream(_collection_batches, after_id, only_public)
+
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models import Platform, platform_categories, platform_tags
+
+
+def bits_to_ids(bits: int) -> List[int]:
+    """Expand a bitset into the ascending list of ids it contains."""
+    if not bits:
+        return []
+    return [index for index, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+
+
+def ids_to_bits(ids: Iterable[int]) -> int:
+    bits = 0
+    for value in ids:
+        bits |= 1 << value
+    return bits
+
+
+class FacetIndex:
+    """In-process category/tag -> platform-id bitsets.
+
+    Bitsets are plain Python ints (bit ``n`` set means platform ``n`` matches), so
+    intersections and counts are single big-int operations. The index is tagged
+    with the catalog version it reflects; a write made by this process patches it
+    in place, and any other version change triggers a rebuild.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._all = 0
+        self._categories: Dict[int, int] = {}
+        self._tags: Dict[int, int] = {}
+        self._version: Optional[int] = None
+
+    def ensure(self, db: Session, version: int) -> None:
+        if self._version != version:
+            self.rebuild(db, version)
+
+    def rebuild(self, db: Session, version: int) -> None:
+        all_bits = ids_to_bits(db.execute(select(Platform.id)).scalars())
+        categories: Dict[int, int] = {}
+        for platform_id, category_id in db.execute(
+            select(platform_categories.c.platform_id, platform_categories.c.category_id)
+        ):
+            categories[category_id] = categories.get(category_id, 0) | (1 << platform_id)
+        tags: Dict[int, int] = {}
+        for platform_id, tag_id in db.execute(select(platform_tags.c.platform_id, platform_tags.c.tag_id)):
+            tags[tag_id] = tags.get(tag_id, 0) | (1 << platform_id)
+
+        with self._lock:
+            self._all, self._categories, self._tags = all_bits, categories, tags
+            self._version = version
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version = None
+
+    def match(self, category_ids: Iterable[int] = (), tag_ids: Iterable[int] = ()) -> int:
+        """Platforms carrying every given category and every given tag."""
+        with self._lock:
+            bits = self._all
+            for category_id in set(category_ids):
+                bits &= self._categories.get(category_id, 0)
+            for tag_id in set(tag_ids):
+                bits &= self._tags.get(tag_id, 0)
+        return bits
+
+    def counts(self, selection: int) -> Dict[str, Dict[int, int]]:
+        """How many platforms of ``selection`` each category and tag would keep."""
+        with self._lock:
+            return {
+                "categories": {key: (bits & selection).bit_count() for key, bits in self._categories.items()},
+                "tags": {key: (bits & selection).bit_count() for key, bits in self._tags.items()},
+            }
+
+    def upsert(
+        self, platform_id: int, category_ids: Iterable[int], tag_ids: Iterable[int], version: int
+    ) -> None:
+        with self._lock:
+            if not self._advance_locked(version):
+                return
+            self._discard(platform_id)
+            flag = 1 << platform_id
+            self._all |= flag
+            for category_id in category_ids:
+                self._categories[category_id] = self._categories.get(category_id, 0) | flag
+            for tag_id in tag_ids:
+                self._tags[tag_id] = self._tags.get(tag_id, 0) | flag
+
+    def remove(self, platform_id: int, version: int) -> None:
+        with self._lock:
+            if self._advance_locked(version):
+                self._discard(platform_id)
+
+    def advance(self, version: int) -> bool:
+        """Move to ``version`` after a write that did not touch platform facets.
+
+        Patching is only safe when no other write landed since the index was built,
+        so any gap drops the index and the next read rebuilds it.
+        """
+        with self._lock:
+            return self._advance_locked(version)
+
+    def _advance_locked(self, version: int) -> bool:
+        if self._version != version - 1:
+            self._version = None
+            return False
+        self._version = version
+        return True
+
+    def _discard(self, platform_id: int) -> None:
+        mask = ~(1 << platform_id)
+        self._all &= mask
+        for facets in (self._categories, self._tags):
+            for key in [key for key, bits in facets.items() if bits & ~mask]:
+                facets[key] &= mask
+
+
+facet_index = FacetIndex()
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, Optional, Set, Tuple, Type, Union
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    Category,
+    Platform,
+    Tag,
+    platform_categories,
+    platform_related_platforms,
+    platform_tags,
+)
+from app.schemas.platform import ImportLineError, ImportReport, PlatformImportRow
+from app.services.catalog import bump_catalog_version
+from app.services.slugs import SLUG_ATTEMPTS, allocate_slugs, is_slug_conflict
+
+ImportFormat = Literal["ndjson", "csv"]
+Record = Union[Dict[str, Any], str]
+Chunk = List[Tuple[int, PlatformImportRow]]
+
+IMPORT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Decode a byte stream into numbered lines without holding more than one line."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    # Only the incoming chunk is split; the unterminated tail is kept as parts
+    # and joined once its newline arrives, so long lines stay linear.
+    tail: List[str] = []
+    number = 0
+    async for chunk in stream:
+        *lines, rest = decoder.decode(chunk).split("\n")
+        if lines:
+            lines[0] = "".join(tail) + lines[0]
+            tail = []
+        for line in lines:
+            number += 1
+            yield number, line.rstrip("\r")
+        if rest:
+            tail.append(rest)
+    tail.append(decoder.decode(b"", final=True))
+    last = "".join(tail)
+    if last:
+        yield number + 1, last.rstrip("\r")
+
+
+async def iter_records(
+    stream: AsyncIterator[bytes], content: ImportFormat
+) -> AsyncIterator[Tuple[int, Record]]:
+    """Yield ``(line, mapping)`` per record, or ``(line, message)`` when it cannot be parsed."""
+    if content == "ndjson":
+        async for number, line in iter_lines(stream):
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+            except ValueError as exc:
+                yield number, f"Invalid JSON: {exc}"
+                continue
+            yield number, value if isinstance(value, dict) else "Expected a JSON object"
+        return
+
+    header: Optional[List[str]] = None
+    pending: List[str] = []
+    quotes = 0
+    start = 0
+    async for number, line in iter_lines(stream):
+        if not pending:
+            start = number
+        pending.append(line)
+        quotes += line.count('"')
+        # Quotes are doubled when escaped, so an odd count means a quoted newline.
+        if quotes % 2:
+            continue
+        record = "\n".join(pending)
+        pending = []
+        quotes = 0
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [value.strip().lower() for value in values]
+        elif len(values) != len(header):
+            yield start, f"Expected {len(header)} columns, got {len(values)}"
+        else:
+            yield start, dict(zip(header, values))
+    if pending:
+        yield start, "Unterminated quoted field"
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}" for error in exc.errors()
+    )
+
+
+class PlatformImporter:
+    """Validates records and writes them in chunks with multi-row INSERTs.
+
+    Each chunk is committed on its own under a new catalog version. Category
+    and tag names are resolved (and created) inside the chunk's savepoint, so
+    a rejected chunk leaves no orphaned names behind. Related platforms are
+    referenced by the slug of an existing platform, and every rejected record
+    is reported with its line number. Nothing but the current chunk and the
+    name caches is kept in memory.
+    """
+
+    def __init__(self, db: Session, chunk_size: int = IMPORT_CHUNK_SIZE) -> None:
+        self.db = db
+        self.chunk_size = chunk_size
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[ImportLineError] = []
+        self.category_ids: Set[int] = set()
+        self.tag_ids: Set[int] = set()
+        self.related_ids: Set[int] = set()
+        self.created_taxonomy = False
+        self.version: Optional[int] = None
+        self._pending: Chunk = []
+        self._category_cache: Dict[str, int] = {}
+        self._tag_cache: Dict[str, int] = {}
+
+    def add(self, line: int, record: Record) -> bool:
+        """Queue a record; returns True once a chunk is ready for ``flush``."""
+        if isinstance(record, str):
+            self._reject(line, record)
+            return False
+        try:
+            self._pending.append((line, PlatformImportRow.model_validate(record)))
+        except ValidationError as exc:
+            self._reject(line, _describe(exc))
+        return len(self._pending) >= self.chunk_size
+
+    def flush(self) -> None:
+        rows, self._pending = self._pending, []
+        accepted, related = self._screen(rows)
+        if not accepted:
+            return
+
+        for attempt in range(SLUG_ATTEMPTS):
+            slugs = allocate_slugs(self.db, Platform, [row.name for _, row in accepted])
+            try:
+                with self.db.begin_nested():
+                    categories, new_categories = self._resolve(
+                        Category, self._category_cache, [row.categories for _, row in accepted]
+                    )
+                    tags, new_tags = self._resolve(Tag, self._tag_cache, [row.tags for _, row in accepted])
+                    self._insert(accepted, slugs, categories, tags, related)
+                break
+            except IntegrityError as exc:
+                if is_slug_conflict(exc) and attempt < SLUG_ATTEMPTS - 1:
+                    continue
+                message = str(exc.orig).splitlines()[0] if exc.orig else str(exc)
+                for line, _ in accepted:
+                    self._reject(line, f"Rejected by the database: {message}")
+                return
+
+        self.version = bump_catalog_version(self.db)
+        self.db.commit()
+
+        self._category_cache.update(categories)
+        self._tag_cache.update(tags)
+        self.created_taxonomy = self.created_taxonomy or new_categories or new_tags
+        self.imported += len(accepted)
+        for _, row in accepted:
+            self.category_ids.update(categories[name] for name in row.categories)
+            self.tag_ids.update(tags[name] for name in row.tags)
+            self.related_ids.update(related[slug] for slug in row.related)
+
+    def finish(self) -> Optional[int]:
+        """Flush the tail; returns the latest catalog version if anything was imported."""
+        if self._pending:
+            self.flush()
+        return self.version
+
+    def report(self) -> ImportReport:
+        return ImportReport(
+            imported=self.imported,
+            failed=self.failed,
+            errors=self.errors,
+            errors_truncated=self.failed > len(self.errors),
+        )
+
+    def _reject(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ImportLineError(line=line, message=message))
+
+    def _screen(self, rows: Chunk) -> Tuple[Chunk, Dict[str, int]]:
+        """Reject names that already exist (stored or earlier in the chunk) and unknown related slugs."""
+        names = {row.name for _, row in rows}
+        taken = set(self.db.execute(select(Platform.name).where(Platform.name.in_(names))).scalars())
+        slugs = {slug for _, row in rows for slug in row.related}
+        related: Dict[str, int] = {}
+        if slugs:
+            related = dict(
+                self.db.execute(select(Platform.slug, Platform.id).where(Platform.slug.in_(slugs))).tuples().all()
+            )
+
+        accepted: Chunk = []
+        for line, row in rows:
+            missing = [slug for slug in row.related if slug not in related]
+            if row.name in taken:
+                self._reject(line, f"Platform '{row.name}' already exists")
+            elif missing:
+                self._reject(line, f"Unknown related platforms: {', '.join(missing)}")
+            else:
+                taken.add(row.name)
+                accepted.append((line, row))
+        return accepted, related
+
+    def _resolve(
+        self, model: Type[Union[Category, Tag]], cache: Dict[str, int], groups: Iterable[List[str]]
+    ) -> Tuple[Dict[str, int], bool]:
+        """Map the chunk's names to ids, creating the ones that do not exist yet.
+
+        Returns the mapping and whether any name was created. ``cache`` only
+        holds committed names; ``flush`` extends it once the chunk is committed.
+        """
+        names = {name for group in groups for name in group}
+        resolved = {name: cache[name] for name in names if name in cache}
+        missing = names - resolved.keys()
+        created = False
+        if missing:
+            inserted = self.db.execute(
+                pg_insert(model)
+                .values([{"name": name} for name in sorted(missing)])
+                .on_conflict_do_nothing(index_elements=[model.name])
+                .returning(model.name, model.id)
+            ).tuples().all()
+            created = bool(inserted)
+            resolved.update(inserted)
+            existing = missing - resolved.keys()
+            if existing:
+                stored = self.db.execute(select(model.name, model.id).where(model.name.in_(existing)))
+                resolved.update(stored.tuples().all())
+        return resolved, created
+
+    def _insert(
+        self,
+        rows: Chunk,
+        slugs: List[str],
+        categories: Dict[str, int],
+        tags: Dict[str, int],
+        related: Dict[str, int],
+    ) -> None:
+        values = [
+            {
+                "name": row.name,
+                "slug": slug,
+                "description": row.description,
+                "url": row.url,
+                "ios_url": row.ios_url,
+                "android_url": row.android_url,
+                "web_url": row.web_url,
+            }
+            for (_, row), slug in zip(rows, slugs)
+        ]
+        ids = self.db.execute(
+            insert(Platform).returning(Platform.id, sort_by_parameter_order=True), values
+        ).scalars().all()
+
+        category_links = []
+        tag_links = []
+        related_links = []
+        for platform_id, (_, row) in zip(ids, rows):
+            category_links.extend(
+                {"platform_id": platform_id, "category_id": categories[name]} for name in row.categories
+            )
+            tag_links.extend({"platform_id": platform_id, "tag_id": tags[name]} for name in row.tags)
+            related_links.extend(
+                {"platform_id": platform_id, "related_platform_id": related[slug]} for slug in row.related
+            )
+        for table, links in (
+            (platform_categories, category_links),
+            (platform_tags, tag_links),
+            (platform_related_platforms, related_links),
+        ):
+            if links:
+                self.db.execute(insert(table), links)
@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-from typing import Optional
+import re
+from typing import Tuple
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, Float, cast, func, or_
 
-from app.core.slugs import slugify
 from app.db.models import Platform
 
 
-def generate_unique_slug(db: Session, name: str, current_id: Optional[int] = None) -> str:
-    base_slug = slugify(name)
-    slug_candidate = base_slug
-    index = 1
-
-    while True:
-        stmt = select(Platform.id).where(Platform.slug == slug_candidate)
-        if current_id is not None:
-            stmt = stmt.where(Platform.id != current_id)
-        exists = db.execute(stmt).scalar_one_or_none()
-        if exists is None:
-            return slug_candidate
-        index += 1
-        slug_candidate = f"{base_slug}-{index}"
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+def build_search_filter(search: str) -> Tuple[ColumnElement[bool], ColumnElement[float]]:
+    """Return the WHERE clause and relevance expression for a platform search.
+
+    Every word is matched as a prefix against the weighted ``search_vector``; the
+    trigram index on ``name`` additionally covers substring and near-miss matches.
+    """
+    term = search.strip()
+    name_match = Platform.name.ilike(f"%{term}%")
+    similarity = func.similarity(Platform.name, term)
+
+    tokens = _SEARCH_TOKEN.findall(term.lower())
+    if not tokens:
+        return name_match, similarity
+
+    ts_query = func.to_tsquery("simple", " & ".join(f"{token}:*" for token in tokens))
+    condition = or_(Platform.search_vector.op("@@")(ts_query), name_match)
+    rank = cast(func.ts_rank_cd(Platform.search_vector, ts_query), Float) + similarity
+    return condition, rank
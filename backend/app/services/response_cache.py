@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_GET_SCRIPT = """
+local body = redis.call('GET', KEYS[1])
+if body then
+  redis.call('HINCRBY', KEYS[2], 'hits', 1)
+else
+  redis.call('HINCRBY', KEYS[2], 'misses', 1)
+end
+return body
+"""
+
+# KEYS: entry, stats, tag sets..., tag versions... ; ARGV: version, ttl, body
+_STORE_SCRIPT = """
+local n = (#KEYS - 2) / 2
+local version = tonumber(ARGV[1])
+for i = 1, n do
+  if tonumber(redis.call('GET', KEYS[2 + n + i]) or '0') > version then
+    return 0
+  end
+end
+redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[2])
+for i = 1, n do
+  redis.call('SADD', KEYS[2 + i], KEYS[1])
+  redis.call('EXPIRE', KEYS[2 + i], ARGV[2])
+end
+redis.call('HINCRBY', KEYS[2], 'stores', 1)
+return 1
+"""
+
+# KEYS: stats, tag sets..., tag versions... ; ARGV: version, ttl
+_INVALIDATE_SCRIPT = """
+local n = (#KEYS - 1) / 2
+local removed = 0
+for i = 1, n do
+  for _, key in ipairs(redis.call('SMEMBERS', KEYS[1 + i])) do
+    removed = removed + redis.call('DEL', key)
+  end
+  redis.call('DEL', KEYS[1 + i])
+  if tonumber(ARGV[1]) > tonumber(redis.call('GET', KEYS[1 + n + i]) or '0') then
+    redis.call('SET', KEYS[1 + n + i], ARGV[1], 'EX', ARGV[2])
+  end
+end
+redis.call('HINCRBY', KEYS[1], 'invalidations', removed)
+return removed
+"""
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A stored body with the catalog state it was rendered from, used for its validators."""
+
+    body: bytes
+    version: int
+    last_modified: Optional[datetime] = None
+
+
+def _pack(entry: CachedResponse) -> bytes:
+    stamp = entry.last_modified.timestamp() if entry.last_modified is not None else ""
+    return f"{entry.version} {stamp}\n".encode() + entry.body
+
+
+def _unpack(raw: bytes) -> Optional[CachedResponse]:
+    header, separator, body = raw.partition(b"\n")
+    try:
+        version, stamp = header.decode().split(" ")
+        last_modified = datetime.fromtimestamp(float(stamp), tz=timezone.utc) if stamp else None
+        return CachedResponse(body=body, version=int(version), last_modified=last_modified)
+    except ValueError:
+        # Entries written before validators were stored; treat them as misses.
+        return None
+
+
+class ResponseCache:
+    """Redis-backed cache of serialized responses with tag-based invalidation.
+
+    Every entry is registered under the tags it depends on. Invalidating a tag
+    deletes its entries and records the catalog version of the write, so a
+    request that read the catalog before that write cannot store a stale body.
+    """
+
+    key_prefix = "cache"
+
+    def __init__(self, redis: Redis, *, ttl_seconds: int, enabled: bool = True) -> None:
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._get = redis.register_script(_GET_SCRIPT)
+        self._store = redis.register_script(_STORE_SCRIPT)
+        self._invalidate = redis.register_script(_INVALIDATE_SCRIPT)
+
+    @property
+    def stats_key(self) -> str:
+        return f"{self.key_prefix}:stats"
+
+    def key(self, namespace: str, params: Mapping[str, Any]) -> str:
+        normalized = json.dumps(params, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:resp:{namespace}:{digest}"
+
+    def _tag_keys(self, tags: Iterable[str]) -> List[str]:
+        unique = sorted(set(tags))
+        return [f"{self.key_prefix}:tag:{tag}" for tag in unique] + [
+            f"{self.key_prefix}:tagver:{tag}" for tag in unique
+        ]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        if not self.enabled:
+            return None
+        try:
+            raw = self._get(keys=[key, self.stats_key])
+        except RedisError as exc:
+            logger.warning("Response cache read failed: %s", exc)
+            return None
+        return _unpack(raw) if raw is not None else None
+
+    def set(self, key: str, entry: CachedResponse, *, tags: Iterable[str]) -> None:
+        if not self.enabled:
+            return
+        try:
+            self._store(
+                keys=[key, self.stats_key, *self._tag_keys(tags)],
+                args=[entry.version, self.ttl_seconds, _pack(entry)],
+            )
+        except RedisError as exc:
+            logger.warning("Response cache write failed: %s", exc)
+
+    def invalidate(self, tags: Iterable[str], *, version: int) -> None:
+        if not self.enabled:
+            return
+        try:
+            self._invalidate(
+                keys=[self.stats_key, *self._tag_keys(tags)],
+                # Keep the version marker at least as long as any entry it guards.
+                args=[version, self.ttl_seconds * 2],
+            )
+        except RedisError as exc:
+            logger.warning("Response cache invalidation failed: %s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        raw = self.redis.hgetall(self.stats_key)
+        counters = {key.decode() if isinstance(key, bytes) else key: int(value) for key, value in raw.items()}
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "enabled": self.enabled,
+            "hits": hits,
+            "misses": misses,
+            "stores": counters.get("stores", 0),
+            "invalidations": counters.get("invalidations", 0),
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+        }
+
+
+# Lists that are not narrowed by a facet can change with any platform write.
+UNFILTERED_TAG = "platforms:unfiltered"
+SEARCH_TAG = "platforms:search"
+# Lists that embed category/tag names in meta.filters.
+TAXONOMY_TAG = "taxonomy"
+
+
+def platform_cache_tags(
+    platform_ids: Iterable[int] = (),
+    category_ids: Iterable[int] = (),
+    tag_ids: Iterable[int] = (),
+) -> List[str]:
+    return [
+        *(f"platform:{platform_id}" for platform_id in platform_ids),
+        *(f"category:{category_id}" for category_id in category_ids),
+        *(f"tag:{tag_id}" for tag_id in tag_ids),
+    ]
+
+
+def platform_write_tags(
+    platform_ids: Iterable[int],
+    category_ids: Iterable[int] = (),
+    tag_ids: Iterable[int] = (),
+) -> List[str]:
+    """Tags to invalidate after a platform write; pass both old and new facet ids."""
+    return [*platform_cache_tags(platform_ids, category_ids, tag_ids), UNFILTERED_TAG, SEARCH_TAG]
+
+
+def taxonomy_write_tags() -> List[str]:
+    """Tags to invalidate after categories or tags are created, renamed or removed."""
+    return [TAXONOMY_TAG, UNFILTERED_TAG, SEARCH_TAG]
+
+
+_settings = get_settings()
+response_cache = ResponseCache(
+    Redis.from_url(_settings.redis_url),
+    ttl_seconds=_settings.response_cache_ttl_seconds,
+    enabled=_settings.response_cache_enabled,
+)
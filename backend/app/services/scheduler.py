@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+JobFunc = Callable[[], Awaitable[None]]
+
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class IntervalSchedule:
+    """Fires every ``seconds``, aligned to the Unix epoch so every node agrees on tick boundaries."""
+
+    def __init__(self, seconds: int) -> None:
+        if seconds <= 0:
+            raise ValueError("interval must be positive")
+        self.seconds = seconds
+
+    def first_tick(self, now: float) -> float:
+        return math.floor(now / self.seconds) * self.seconds
+
+    def next_tick(self, after: float) -> float:
+        return self.first_tick(after) + self.seconds
+
+    def describe(self) -> str:
+        return f"every {self.seconds}s"
+
+
+class CronSchedule:
+    """Five-field cron expression (minute hour day-of-month month day-of-week) evaluated in UTC."""
+
+    # Day-of-week accepts both 0 and 7 for Sunday.
+    _BOUNDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"invalid cron expression: {expression!r}")
+        self.expression = expression
+        parsed = [self._parse_field(value, *bounds) for value, bounds in zip(fields, self._BOUNDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {day % 7 for day in weekdays}
+        self._dom_restricted = fields[2] != "*"
+        self._dow_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse_field(value: str, low: int, high: int) -> Set[int]:
+        result: Set[int] = set()
+        for part in value.split(","):
+            step = 1
+            if "/" in part:
+                part, step_raw = part.split("/", 1)
+                step = int(step_raw)
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start_raw, end_raw = part.split("-", 1)
+                start, end = int(start_raw), int(end_raw)
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            if start < low or end > high or start > end or step <= 0:
+                raise ValueError(f"invalid cron field: {value!r}")
+            result.update(range(start, end + 1, step))
+        return result
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._dom_restricted and self._dow_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def _next_match(self, start: datetime) -> float:
+        moment = start.replace(second=0, microsecond=0)
+        # Fields are advanced coarsest first, so even "0 0 29 2 *" takes a few hundred steps.
+        # Eight years covers every leap-day gap in the Gregorian calendar (e.g. 2096 -> 2104).
+        limit = moment + timedelta(days=8 * 366)
+        while moment <= limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            if moment.minute in self.minutes:
+                return moment.timestamp()
+            moment += timedelta(minutes=1)
+        raise ValueError(f"cron expression never fires: {self.expression!r}")
+
+    def first_tick(self, now: float) -> float:
+        return self._next_match(datetime.fromtimestamp(now, tz=timezone.utc))
+
+    def next_tick(self, after: float) -> float:
+        return self._next_match(datetime.fromtimestamp(after, tz=timezone.utc) + timedelta(minutes=1))
+
+    def describe(self) -> str:
+        return f"cron {self.expression}"
+
+
+Schedule = Union[IntervalSchedule, CronSchedule]
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    func: JobFunc
+    schedule: Schedule
+    due_at: Optional[float] = None
+    task: Optional[asyncio.Task[Any]] = field(default=None, repr=False)
+
+
+class LeaseScheduler:
+    """Runs registered periodic jobs on exactly one node of the cluster.
+
+    Nodes compete for a Redis lease; only the holder evaluates schedules. Each
+    tick is additionally claimed with ``SET NX`` so a leadership handover in the
+    middle of a tick cannot run the same job twice.
+    """
+
+    key_prefix = "scheduler"
+
+    def __init__(self, redis: Redis, *, lease_seconds: int = 30, poll_seconds: float = 1.0) -> None:
+        self.redis = redis
+        self.lease_ms = max(lease_seconds, 3) * 1000
+        self.poll_seconds = max(poll_seconds, 0.1)
+        self.instance_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.is_leader = False
+        self._task: Optional[asyncio.Task[Any]] = None
+        self._renew = redis.register_script(_RENEW_SCRIPT)
+        self._release = redis.register_script(_RELEASE_SCRIPT)
+
+    @property
+    def leader_key(self) -> str:
+        return f"{self.key_prefix}:leader"
+
+    def job_key(self, name: str) -> str:
+        return f"{self.key_prefix}:jobs:{name}"
+
+    def tick_key(self, name: str, tick: float) -> str:
+        return f"{self.key_prefix}:ticks:{name}:{int(tick)}"
+
+    def register(self, name: str, func: JobFunc, *, every: Optional[int] = None, cron: Optional[str] = None) -> None:
+        if (every is None) == (cron is None):
+            raise ValueError("exactly one of 'every' or 'cron' is required")
+        schedule: Schedule = IntervalSchedule(every) if every is not None else CronSchedule(cron or "")
+        self.jobs[name] = ScheduledJob(name=name, func=func, schedule=schedule)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def shutdown(self) -> None:
+        tasks = [self._task, *(job.task for job in self.jobs.values())]
+        for task in tasks:
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("Scheduler task shutdown failed")
+        self._task = None
+        if self.is_leader:
+            try:
+                await self._release(keys=[self.leader_key], args=[self.instance_id])
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("Failed to release scheduler lease")
+            self.is_leader = False
+
+    async def status(self) -> Dict[str, Any]:
+        leader = await self.redis.get(self.leader_key)
+        jobs: List[Dict[str, Any]] = []
+        for job in self.jobs.values():
+            record = await self.redis.hgetall(self.job_key(job.name))
+            decoded = {_as_str(key): _as_str(value) for key, value in record.items()}
+            jobs.append(
+                {
+                    "name": job.name,
+                    "schedule": job.schedule.describe(),
+                    "running": job.task is not None and not job.task.done(),
+                    "last_status": decoded.get("last_status"),
+                    "last_started_at": decoded.get("last_started_at"),
+                    "last_duration_seconds": float(decoded["last_duration_seconds"])
+                    if "last_duration_seconds" in decoded
+                    else None,
+                    "last_error": decoded.get("last_error") or None,
+                    "last_runner": decoded.get("last_runner"),
+                }
+            )
+        return {
+            "leader": _as_str(leader) if leader else None,
+            "instance_id": self.instance_id,
+            "is_leader": self.is_leader,
+            "jobs": jobs,
+        }
+
+    async def _loop(self) -> None:
+        try:
+            while True:
+                try:
+                    await self._hold_lease()
+                    if self.is_leader:
+                        await self._run_due_jobs()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:  # pragma: no cover - defensive
+                    logger.exception("Scheduler iteration failed")
+                await asyncio.sleep(self.poll_seconds)
+        finally:
+            logger.info("Scheduler stopped")
+
+    async def _hold_lease(self) -> None:
+        if self.is_leader:
+            renewed = await self._renew(keys=[self.leader_key], args=[self.instance_id, self.lease_ms])
+            if not renewed:
+                logger.warning("Scheduler lease lost by %s", self.instance_id)
+                self.is_leader = False
+        if not self.is_leader:
+            acquired = await self.redis.set(self.leader_key, self.instance_id, nx=True, px=self.lease_ms)
+            if acquired:
+                logger.info("Scheduler lease acquired by %s", self.instance_id)
+                self.is_leader = True
+                for job in self.jobs.values():
+                    job.due_at = None
+
+    async def _run_due_jobs(self) -> None:
+        now = time.time()
+        for job in self.jobs.values():
+            if job.due_at is None:
+                job.due_at = job.schedule.first_tick(now)
+            if now < job.due_at or (job.task is not None and not job.task.done()):
+                continue
+
+            tick = job.due_at
+            next_due = job.schedule.next_tick(tick)
+            while next_due <= now:
+                # Missed ticks collapse into the current one instead of replaying.
+                tick, next_due = next_due, job.schedule.next_tick(next_due)
+            job.due_at = next_due
+
+            claimed = await self.redis.set(self.tick_key(job.name, tick), self.instance_id, nx=True, ex=86_400)
+            if claimed:
+                job.task = asyncio.get_running_loop().create_task(self._run_job(job, tick))
+
+    async def _run_job(self, job: ScheduledJob, tick: float) -> None:
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        status, error = "success", ""
+        try:
+            await job.func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            status, error = "failed", repr(exc)
+            logger.exception("Scheduled job %s failed", job.name)
+        duration = time.perf_counter() - started
+        logger.info("Scheduled job %s finished: status=%s duration=%.3fs", job.name, status, duration)
+        await self.redis.hset(
+            self.job_key(job.name),
+            mapping={
+                "last_status": status,
+                "last_started_at": started_at.isoformat(),
+                "last_duration_seconds": f"{duration:.6f}",
+                "last_error": error,
+                "last_runner": self.instance_id,
+                "last_tick": int(tick),
+            },
+        )
+
+
+def _as_str(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
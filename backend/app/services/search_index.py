@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Literal, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.hangul import decompose, initials, is_initials_query
+from app.db.models import Collection, Platform
+from app.services.catalog import get_catalog_version
+
+DocumentKind = Literal["platform", "collection"]
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    kind: DocumentKind
+    id: int
+    slug: str
+    title: str
+    jamo: str
+    initials: str
+
+
+def _grams(text: str) -> Set[str]:
+    # "^"-anchored grams let very short queries skip straight to prefix matches.
+    grams = set(text) | {text[index : index + 2] for index in range(len(text) - 1)}
+    return grams | {f"^{text[:1]}", f"^{text[:2]}"} if text else grams
+
+
+def _query_grams(text: str) -> Set[str]:
+    if len(text) < 2:
+        return set(text)
+    return {text[index : index + 2] for index in range(len(text) - 1)}
+
+
+class SearchIndex:
+    """In-process Hangul-aware suggest index over platform names and public collection titles.
+
+    Titles are indexed twice, as keystroke jamo ("카카오" -> "ㅋㅏㅋㅏㅇㅗ") and as
+    initial consonants ("ㅋㅋㅇ"), with unigram/bigram postings stored as
+    slot bitsets. A query intersects the postings of its bigrams and verifies the
+    few survivors with a substring check. Like ``FacetIndex`` it is tagged with the
+    catalog version, patched by local writes and rebuilt on any other change;
+    like ``PrefixIndex`` reads only consult that version once per
+    ``check_interval`` seconds.
+    """
+
+    def __init__(self, check_interval: float) -> None:
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._documents: List[Optional[SearchDocument]] = []
+        self._slots: Dict[Tuple[str, int], int] = {}
+        self._free: List[int] = []
+        self._jamo_grams: Dict[str, int] = {}
+        self._initial_grams: Dict[str, int] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    def ensure(self, db: Session, version: int) -> None:
+        if self._version != version:
+            self.rebuild(db, version)
+
+    def ensure_fresh(self, db: Session) -> None:
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.check_interval:
+            return
+        self.ensure(db, get_catalog_version(db))
+        self._checked_at = now
+
+    def rebuild(self, db: Session, version: int) -> None:
+        platforms = db.execute(select(Platform.id, Platform.slug, Platform.name)).all()
+        collections = db.execute(
+            select(Collection.id, Collection.slug, Collection.title).where(Collection.is_public.is_(True))
+        ).all()
+        with self._lock:
+            self._documents, self._slots, self._free = [], {}, []
+            self._jamo_grams, self._initial_grams = {}, {}
+            for row in platforms:
+                self._add("platform", row.id, row.slug, row.name)
+            for row in collections:
+                self._add("collection", row.id, row.slug, row.title)
+            self._version = version
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version = None
+
+    def suggest(self, query: str, limit: int = 10) -> List[SearchDocument]:
+        """Prefix matches first, then earlier and shorter matches."""
+        if is_initials_query(query):
+            needle, grams, field = initials(query), self._initial_grams, "initials"
+        else:
+            needle, grams, field = decompose(query), self._jamo_grams, "jamo"
+        if not needle:
+            return []
+
+        with self._lock:
+            bits = grams.get(f"^{needle}", 0) if len(needle) <= 2 else 0
+            if bits.bit_count() < limit:
+                bits = -1
+                for gram in _query_grams(needle):
+                    bits &= grams.get(gram, 0)
+                    if not bits:
+                        return []
+            candidates = []
+            while bits:
+                lowest = bits & -bits
+                bits ^= lowest
+                slot = lowest.bit_length() - 1
+                document = self._documents[slot]
+                position = getattr(document, field).find(needle)
+                if position >= 0:
+                    candidates.append((position, len(document.title), document.title, slot))
+            return [self._documents[item[3]] for item in heapq.nsmallest(limit, candidates)]
+
+    def upsert(self, kind: DocumentKind, item_id: int, slug: str, title: str, version: int) -> None:
+        with self._lock:
+            if not self._advance_locked(version):
+                return
+            self._discard(kind, item_id)
+            self._add(kind, item_id, slug, title)
+
+    def remove(self, kind: DocumentKind, item_id: int, version: int) -> None:
+        with self._lock:
+            if self._advance_locked(version):
+                self._discard(kind, item_id)
+
+    def advance(self, version: int) -> bool:
+        """Move to ``version`` after a write that did not touch indexed titles."""
+        with self._lock:
+            return self._advance_locked(version)
+
+    def _advance_locked(self, version: int) -> bool:
+        if self._version != version - 1:
+            self._version = None
+            return False
+        self._version = version
+        return True
+
+    def _add(self, kind: DocumentKind, item_id: int, slug: str, title: str) -> None:
+        document = SearchDocument(kind, item_id, slug, title, decompose(title), initials(title))
+        if self._free:
+            slot = self._free.pop()
+            self._documents[slot] = document
+        else:
+            slot = len(self._documents)
+            self._documents.append(document)
+        self._slots[(kind, item_id)] = slot
+        self._mark(self._jamo_grams, _grams(document.jamo), 1 << slot)
+        self._mark(self._initial_grams, _grams(document.initials), 1 << slot)
+
+    def _discard(self, kind: DocumentKind, item_id: int) -> None:
+        slot = self._slots.pop((kind, item_id), None)
+        if slot is None:
+            return
+        document = self._documents[slot]
+        self._documents[slot] = None
+        self._free.append(slot)
+        mask = ~(1 << slot)
+        for grams, text in ((self._jamo_grams, document.jamo), (self._initial_grams, document.initials)):
+            for gram in _grams(text):
+                remaining = grams.get(gram, 0) & mask
+                if remaining:
+                    grams[gram] = remaining
+                else:
+                    grams.pop(gram, None)
+
+    @staticmethod
+    def _mark(grams: Dict[str, int], keys: Iterable[str], flag: int) -> None:
+        for key in keys:
+            grams[key] = grams.get(key, 0) | flag
+
+
+search_index = SearchIndex(get_settings().autocomplete_check_seconds)
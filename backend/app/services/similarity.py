@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from operator import itemgetter
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.models import Platform, PlatformSimilarity, platform_categories, platform_tags
+from app.db.session import SessionLocal
+from app.services.autocomplete import autocomplete_index
+from app.services.catalog import bump_catalog_version
+from app.services.facets import facet_index
+from app.services.search_index import search_index
+
+logger = logging.getLogger(__name__)
+
+FACET_WEIGHT = 0.6
+TEXT_WEIGHT = 0.4
+# Terms in more than this share of descriptions behave like stop words.
+MAX_DOCUMENT_FREQUENCY = 0.3
+# Only the strongest terms of each description take part in the cosine.
+MAX_TERMS_PER_DOCUMENT = 16
+INSERT_CHUNK_SIZE = 5_000
+
+_TOKEN_PATTERN = re.compile(r"\w{2,}")
+
+Neighbours = Dict[int, List[Tuple[int, float]]]
+
+
+def tokenize(text: str | None) -> Counter:
+    return Counter(_TOKEN_PATTERN.findall((text or "").lower()))
+
+
+def _term_vectors(documents: Mapping[int, Counter]) -> Dict[int, Dict[str, float]]:
+    """Sparse unit-length TF-IDF vectors.
+
+    Terms that cannot link two platforms are dropped and each vector keeps its
+    ``MAX_TERMS_PER_DOCUMENT`` heaviest terms, which bounds the pairwise work.
+    """
+    total = len(documents)
+    frequency: Counter = Counter()
+    for counts in documents.values():
+        frequency.update(counts.keys())
+    ceiling = max(2, int(total * MAX_DOCUMENT_FREQUENCY))
+
+    vectors: Dict[int, Dict[str, float]] = {}
+    for platform_id, counts in documents.items():
+        vector = {
+            term: (1 + math.log(count)) * math.log(total / frequency[term])
+            for term, count in counts.items()
+            if 1 < frequency[term] <= ceiling
+        }
+        if len(vector) > MAX_TERMS_PER_DOCUMENT:
+            vector = dict(heapq.nlargest(MAX_TERMS_PER_DOCUMENT, vector.items(), key=itemgetter(1)))
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if norm:
+            vectors[platform_id] = {term: weight / norm for term, weight in vector.items()}
+    return vectors
+
+
+def rank_similar(
+    features: Mapping[int, Set[str]],
+    documents: Mapping[int, Counter],
+    top_k: int,
+) -> Neighbours:
+    """Top-K neighbours by weighted facet Jaccard plus description cosine similarity.
+
+    Both measures are computed as sparse products over inverted postings, so a
+    platform is only compared with platforms sharing at least one facet or term.
+    """
+    facet_postings: Dict[str, List[int]] = defaultdict(list)
+    for platform_id, facets in features.items():
+        for facet in facets:
+            facet_postings[facet].append(platform_id)
+
+    vectors = _term_vectors(documents)
+    term_postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+    for platform_id, vector in vectors.items():
+        for term, weight in vector.items():
+            term_postings[term].append((platform_id, weight))
+
+    sizes = {platform_id: len(facets) for platform_id, facets in features.items()}
+    neighbours: Neighbours = {}
+    for platform_id in features.keys() | documents.keys():
+        # Text first: the query vector is pre-scaled so the sums are already weighted.
+        scores: Dict[int, float] = defaultdict(float)
+        for term, weight in vectors.get(platform_id, {}).items():
+            weight *= TEXT_WEIGHT
+            for other_id, other_weight in term_postings[term]:
+                scores[other_id] += weight * other_weight
+
+        overlap: Counter = Counter()
+        for facet in features.get(platform_id, ()):
+            overlap.update(facet_postings[facet])
+        size = sizes.get(platform_id, 0)
+        for other_id, shared in overlap.items():
+            scores[other_id] += FACET_WEIGHT * shared / (size + sizes[other_id] - shared)
+
+        scores.pop(platform_id, None)
+        top = heapq.nlargest(top_k, scores.items(), key=itemgetter(1))
+        if top:
+            neighbours[platform_id] = top
+    return neighbours
+
+
+def load_platform_features(db: Session) -> Tuple[Dict[int, Set[str]], Dict[int, Counter]]:
+    documents = {
+        platform_id: tokenize(description)
+        for platform_id, description in db.execute(select(Platform.id, Platform.description))
+    }
+    features: Dict[int, Set[str]] = {platform_id: set() for platform_id in documents}
+    for platform_id, category_id in db.execute(
+        select(platform_categories.c.platform_id, platform_categories.c.category_id)
+    ):
+        features[platform_id].add(f"c{category_id}")
+    for platform_id, tag_id in db.execute(select(platform_tags.c.platform_id, platform_tags.c.tag_id)):
+        features[platform_id].add(f"t{tag_id}")
+    return features, documents
+
+
+def _rows(neighbours: Neighbours) -> Iterable[dict]:
+    for platform_id, items in neighbours.items():
+        for rank, (similar_id, score) in enumerate(items, start=1):
+            yield {
+                "platform_id": platform_id,
+                "similar_platform_id": similar_id,
+                "rank": rank,
+                "score": score,
+            }
+
+
+def refresh_similar_platforms(db: Session, *, top_k: int) -> int:
+    """Replace every stored neighbour list; the caller owns the transaction."""
+    features, documents = load_platform_features(db)
+    neighbours = rank_similar(features, documents, top_k)
+
+    db.execute(delete(PlatformSimilarity))
+    rows = list(_rows(neighbours))
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        db.execute(insert(PlatformSimilarity), rows[start : start + INSERT_CHUNK_SIZE])
+    return len(rows)
+
+
+def rebuild_similar_platforms(top_k: int) -> int:
+    """Recompute neighbours in a fresh session and publish them as a catalog change."""
+    started = time.perf_counter()
+    session = SessionLocal()
+    try:
+        written = refresh_similar_platforms(session, top_k=top_k)
+        version = bump_catalog_version(session)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+    facet_index.advance(version)
+    search_index.advance(version)
+    autocomplete_index.advance(version)
+    logger.info("Stored %d similar platform rows in %.2fs", written, time.perf_counter() - started)
+    return written
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from sqlalchemy import Numeric, cast, func, null, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.slugs import slugify
+from app.db.models import Collection, Platform
+
+SluggedModel = Union[Type[Platform], Type[Collection]]
+
+SLUG_ATTEMPTS = 5
+_LOOKUP_CHUNK_SIZE = 500
+
+
+def _fallback(model: SluggedModel) -> str:
+    return "collection" if model is Collection else "platform"
+
+
+def _slug_usage(
+    db: Session, model: SluggedModel, bases: Iterable[str], current_id: Optional[int] = None
+) -> Tuple[Set[str], Dict[str, int]]:
+    """The bases stored as slugs themselves, and the highest stored ``base-<n>`` per base.
+
+    Only ``^base-[0-9]+$`` counts as a suffix, so slugs that merely start with
+    the base (``base-station``) are neither matched nor fetched, and the
+    database returns a single aggregated row per base.
+    """
+    unique = sorted(set(bases))
+    taken: Set[str] = set()
+    highest: Dict[str, int] = {}
+    for start in range(0, len(unique), _LOOKUP_CHUNK_SIZE):
+        chunk = unique[start : start + _LOOKUP_CHUNK_SIZE]
+        pattern = f"^(?:{'|'.join(re.escape(base) for base in chunk)})-[0-9]+$"
+        exact = select(model.slug, cast(null(), Numeric).label("suffix")).where(model.slug.in_(chunk))
+        numbered = select(
+            func.regexp_replace(model.slug, "-[0-9]+$", "").label("base"),
+            cast(func.substring(model.slug, "[0-9]+$"), Numeric).label("suffix"),
+        ).where(model.slug.op("~")(pattern))
+        if current_id is not None:
+            exact = exact.where(model.id != current_id)
+            numbered = numbered.where(model.id != current_id)
+        numbered = numbered.subquery()
+        stmt = union_all(
+            exact,
+            select(numbered.c.base, func.max(numbered.c.suffix)).group_by(numbered.c.base),
+        )
+        for base, suffix in db.execute(stmt):
+            if suffix is None:
+                taken.add(base)
+            else:
+                highest[base] = int(suffix)
+    return taken, highest
+
+
+_NUMBERED = re.compile(r"(.+)-(\d+)")
+
+
+def _next_free(base: str, taken: Set[str], highest: Dict[str, int]) -> str:
+    """The base itself or ``base-<max + 1>``; records the result in ``taken``/``highest``."""
+    if base in taken:
+        suffix = max(highest.get(base, 1), 1) + 1
+        slug = f"{base}-{suffix}"
+    else:
+        slug = base
+    taken.add(slug)
+    if match := _NUMBERED.fullmatch(slug):
+        stem, suffix = match.group(1), int(match.group(2))
+        highest[stem] = max(highest.get(stem, 0), suffix)
+    return slug
+
+
+def allocate_slug(db: Session, model: SluggedModel, name: str, current_id: Optional[int] = None) -> str:
+    """Next free slug for ``name`` in a single query: the base itself or ``base-<max + 1>``."""
+    base = slugify(name, _fallback(model))
+    taken, highest = _slug_usage(db, model, [base], current_id)
+    return _next_free(base, taken, highest)
+
+
+def allocate_slugs(db: Session, model: SluggedModel, names: Iterable[str]) -> List[str]:
+    """Batch variant for imports; names that share a base get distinct suffixes."""
+    bases = [slugify(name, _fallback(model)) for name in names]
+    taken, highest = _slug_usage(db, model, bases)
+    return [_next_free(base, taken, highest) for base in bases]
+
+
+def is_slug_conflict(exc: IntegrityError) -> bool:
+    constraint = getattr(getattr(exc.orig, "diag", None), "constraint_name", None) or ""
+    return "slug" in constraint
+
+
+def assign_unique_slug(db: Session, instance: Union[Platform, Collection], field: str, value: str) -> None:
+    """Set ``field`` and a slug derived from it, then flush the row inside a savepoint.
+
+    A concurrent request can claim the same slug between allocation and insert;
+    the unique index then rejects the flush and a fresh slug is allocated. New
+    instances must not be added to the session beforehand, and existing rows
+    should get this call before any other change, because rolling back the
+    savepoint discards the instance's pending state.
+    """
+    model = type(instance)
+    for attempt in range(SLUG_ATTEMPTS):
+        with db.no_autoflush:
+            slug = allocate_slug(db, model, value, current_id=instance.id)
+        try:
+            with db.begin_nested():
+                setattr(instance, field, value)
+                instance.slug = slug
+                db.add(instance)
+                db.flush()
+            return
+        except IntegrityError as exc:
+            if not is_slug_conflict(exc) or attempt == SLUG_ATTEMPTS - 1:
+                raise
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+from redis.asyncio import Redis
+
+if TYPE_CHECKING:
+    from app.services.analytics import QueuedEvent
+
+# Scores are stored as weight * exp(rate * (t - epoch)) so an increment never has to
+# touch other members. Both scripts read the epoch inside Redis, which keeps
+# increments and renormalisation atomic with respect to each other. A boost that is
+# not finite (an absurd timestamp) is dropped rather than poisoning the set with inf.
+_INCREMENT_SCRIPT = """
+local epoch = tonumber(redis.call('GET', KEYS[2]))
+if not epoch then
+  epoch = tonumber(ARGV[2])
+  redis.call('SET', KEYS[2], ARGV[2])
+end
+local rate = tonumber(ARGV[1])
+for i = 3, #ARGV, 3 do
+  local boost = tonumber(ARGV[i + 2]) * math.exp(rate * (tonumber(ARGV[i + 1]) - epoch))
+  if boost == boost and boost > -math.huge and boost < math.huge then
+    redis.call('ZINCRBY', KEYS[1], boost, ARGV[i])
+  end
+end
+return epoch
+"""
+
+_RENORMALISE_SCRIPT = """
+local epoch = tonumber(redis.call('GET', KEYS[2]))
+local now = tonumber(ARGV[2])
+if not epoch or now - epoch < tonumber(ARGV[3]) then
+  return 0
+end
+local factor = math.exp(-tonumber(ARGV[1]) * (now - epoch))
+local floor = tonumber(ARGV[4])
+local items = redis.call('ZRANGE', KEYS[1], 0, -1, 'WITHSCORES')
+for i = 1, #items, 2 do
+  local score = tonumber(items[i + 1]) * factor
+  if score < floor then
+    redis.call('ZREM', KEYS[1], items[i])
+  else
+    redis.call('ZADD', KEYS[1], score, items[i])
+  end
+end
+redis.call('SET', KEYS[2], ARGV[2])
+return #items / 2
+"""
+
+ENTITY_TYPES = ("collection", "platform")
+
+
+class TrendingLeaderboard:
+    """Exponentially decayed per-entity scores kept in Redis sorted sets."""
+
+    def __init__(self, redis: Redis, *, half_life_seconds: int, prune_below: float = 0.01) -> None:
+        self.redis = redis
+        self.rate = math.log(2) / max(half_life_seconds, 1)
+        self.half_life_seconds = max(half_life_seconds, 1)
+        self.prune_below = prune_below
+        self._increment = redis.register_script(_INCREMENT_SCRIPT)
+        self._renormalise = redis.register_script(_RENORMALISE_SCRIPT)
+
+    @staticmethod
+    def scores_key(entity_type: str) -> str:
+        return f"trending:{entity_type}"
+
+    @staticmethod
+    def epoch_key(entity_type: str) -> str:
+        return f"trending:{entity_type}:epoch"
+
+    async def record(self, events: Iterable["QueuedEvent"]) -> None:
+        boosts: Dict[str, Dict[int, Tuple[float, float]]] = defaultdict(dict)
+        for event in events:
+            weight = 2.0 if event.event_type == "click" else 1.0
+            timestamp = event.occurred_at.timestamp()
+            previous = boosts[event.entity_type].get(event.entity_id)
+            if previous is None:
+                boosts[event.entity_type][event.entity_id] = (timestamp, weight)
+            else:
+                # Fold into the latest timestamp, decaying the earlier contribution.
+                last_ts, last_weight = previous
+                newest = max(timestamp, last_ts)
+                folded = last_weight * math.exp(self.rate * (last_ts - newest)) + weight * math.exp(
+                    self.rate * (timestamp - newest)
+                )
+                boosts[event.entity_type][event.entity_id] = (newest, folded)
+
+        if not boosts:
+            return
+        now = time.time()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for entity_type, members in boosts.items():
+                args: List[float | int | str] = [self.rate, now]
+                for entity_id, (timestamp, weight) in members.items():
+                    args.extend((entity_id, timestamp, weight))
+                await self._increment(
+                    keys=[self.scores_key(entity_type), self.epoch_key(entity_type)],
+                    args=args,
+                    client=pipe,
+                )
+            await pipe.execute()
+
+    async def top(self, entity_type: str, limit: int) -> List[Tuple[int, float]]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(self.epoch_key(entity_type))
+            pipe.zrevrange(self.scores_key(entity_type), 0, limit - 1, withscores=True)
+            epoch_raw, members = await pipe.execute()
+        return self._decay(epoch_raw, members)
+
+    async def all_scores(self, entity_type: str) -> List[Tuple[int, float]]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(self.epoch_key(entity_type))
+            pipe.zrange(self.scores_key(entity_type), 0, -1, withscores=True)
+            epoch_raw, members = await pipe.execute()
+        return self._decay(epoch_raw, members)
+
+    async def renormalise(self) -> None:
+        """Rebase every set onto the current time once the growth factor gets large."""
+        now = time.time()
+        for entity_type in ENTITY_TYPES:
+            await self._renormalise(
+                keys=[self.scores_key(entity_type), self.epoch_key(entity_type)],
+                args=[self.rate, now, self.half_life_seconds * 10, self.prune_below],
+            )
+
+    def _decay(self, epoch_raw: bytes | None, members: List[Tuple[bytes, float]]) -> List[Tuple[int, float]]:
+        if epoch_raw is None:
+            return []
+        factor = math.exp(-self.rate * (time.time() - float(epoch_raw)))
+        return [(int(member), float(score) * factor) for member, score in members]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Sequence, Set, Tuple
+
+from redis.asyncio import Redis
+
+if TYPE_CHECKING:
+    from app.services.analytics import MetricKey, QueuedEvent
+
+
+class UniqueVisitorCounter:
+    """Approximate per-entity, per-day unique visitors with Redis HyperLogLogs.
+
+    Each ``hll:{entity_type}:{entity_id}:{date}`` key costs at most ~12 KB no
+    matter how many visitors it has seen, and expires once the day can no
+    longer receive late events.
+    """
+
+    def __init__(self, redis: Redis, *, ttl_seconds: int = 3 * 86_400) -> None:
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(entity_type: str, entity_id: int, day: object) -> str:
+        return f"hll:{entity_type}:{entity_id}:{day}"
+
+    async def track(self, events: Sequence["QueuedEvent"]) -> Tuple[Dict["MetricKey", int], Set[int]]:
+        """Feed visitor ids into the day's HyperLogLogs.
+
+        Returns the current ``PFCOUNT`` for every touched entity/day and the
+        indices of view events whose visitor had already been counted that day.
+        """
+        tracked: List[Tuple[int, "MetricKey"]] = []
+        for index, event in enumerate(events):
+            if event.visitor_id:
+                tracked.append((index, (event.entity_type, event.entity_id, event.occurred_at.date())))
+        if not tracked:
+            return {}, set()
+
+        touched = list(dict.fromkeys(metric_key for _, metric_key in tracked))
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for index, metric_key in tracked:
+                pipe.pfadd(self.key(*metric_key), events[index].visitor_id)
+            for metric_key in touched:
+                pipe.expire(self.key(*metric_key), self.ttl_seconds)
+            for metric_key in touched:
+                pipe.pfcount(self.key(*metric_key))
+            results = await pipe.execute()
+
+        added = results[: len(tracked)]
+        counts = results[len(tracked) + len(touched) :]
+        repeats = {
+            index
+            for (index, _), changed in zip(tracked, added)
+            if not changed and events[index].event_type == "view"
+        }
+        return {metric_key: int(count) for metric_key, count in zip(touched, counts)}, repeats
@@ -0,0 +1 @@
+"""Standalone background workers runnable with ``python -m app.workers.<name>``."""
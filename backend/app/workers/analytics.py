@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+
+from app.core.config import get_settings
+from app.services.analytics import analytics
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> None:
+    settings = get_settings()
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    await analytics.start(
+        consumers=settings.analytics_worker_concurrency,
+        scheduler=settings.analytics_worker_scheduler,
+    )
+    logger.info(
+        "Analytics worker started (consumers=%d, scheduler=%s, backend=%s)",
+        settings.analytics_worker_concurrency,
+        settings.analytics_worker_scheduler,
+        settings.analytics_queue_backend,
+    )
+
+    await stop.wait()
+    logger.info("Analytics worker draining")
+    await analytics.shutdown(drain_timeout=settings.analytics_drain_timeout_seconds)
+    logger.info("Analytics worker stopped")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
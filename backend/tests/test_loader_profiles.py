@@ -0,0 +1,181 @@
+"""Query-count regression test for the loader profiles in ``app.db.loaders``.
+
+Runs against the disposable PostgreSQL database named by ``TEST_DATABASE_URL``
+(its schema is dropped and recreated) with ``DB_RAISELOAD=1``, so a profile
+that forgets a relationship fails with an error instead of issuing a lazy
+query, and a profile that loads too much shows up as extra statements or rows.
+"""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+# Settings and the engine are created at import time, so configure them first.
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+os.environ["DB_RAISELOAD"] = "1"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["ANALYTICS_RUN_IN_API"] = "false"
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+
+from app.core.security import create_admin_token  # noqa: E402
+from app.db.base import RELATIONSHIP_LAZY, Base  # noqa: E402
+from app.db.models import (  # noqa: E402
+    Category,
+    Collection,
+    CollectionPlatform,
+    Platform,
+    Submission,
+    Tag,
+)
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.catalog import bump_catalog_version  # noqa: E402
+
+PLATFORM_COUNT = 6
+
+
+@dataclass
+class QueryLog:
+    statements: int = 0
+    rows: int = 0
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryLog]:
+    log = QueryLog()
+
+    def before(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        log.statements += 1
+
+    def after(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        log.rows += max(cursor.rowcount, 0)
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    try:
+        yield log
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+        event.remove(engine, "after_cursor_execute", after)
+
+
+@pytest.fixture(scope="module")
+def catalog() -> Iterator[None]:
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        Base.metadata.drop_all(connection)
+        Base.metadata.create_all(connection)
+
+    with SessionLocal() as db:
+        categories = [Category(name=f"Category {index}") for index in range(3)]
+        tags = [Tag(name=f"Tag {index}") for index in range(3)]
+        platforms = [
+            Platform(
+                name=f"Platform {index}",
+                slug=f"platform-{index}",
+                description=f"Platform number {index}",
+                categories=[categories[index % 3], categories[(index + 1) % 3]],
+                tags=[tags[index % 3]],
+            )
+            for index in range(PLATFORM_COUNT)
+        ]
+        for index, platform in enumerate(platforms):
+            platform.related_platforms = [platforms[(index + 1) % PLATFORM_COUNT]]
+        collections = [
+            Collection(
+                title=f"Collection {index}",
+                slug=f"collection-{index}",
+                is_public=True,
+                platform_links=[
+                    CollectionPlatform(platform=platforms[index * 3 + position], position=position)
+                    for position in range(3)
+                ],
+            )
+            for index in range(2)
+        ]
+        submissions = [
+            Submission(submitter_name="Tester", submitter_email="tester@example.com", platform_name=f"Idea {index}")
+            for index in range(2)
+        ]
+        db.add_all([*platforms, *collections, *submissions])
+        bump_catalog_version(db)
+        db.commit()
+    yield
+
+
+@pytest.fixture(scope="module")
+def client(catalog: None) -> TestClient:
+    # Not used as a context manager, so startup (analytics consumers) never runs.
+    return TestClient(app, headers={"Authorization": f"Bearer {create_admin_token('admin')}"})
+
+
+@dataclass
+class Case:
+    profile: Optional[str]
+    method: str
+    path: str
+    statements: int
+    rows: int
+    json: Any = None
+
+
+# ``profile`` is the loader profile the endpoint uses; None means plain column selects.
+CASES: List[Case] = [
+    Case("card", "GET", "/api/v1/platforms/?view=card&page_size=100", 4, 25),
+    Case("card", "GET", "/api/v1/collections/?view=card", 3, 5),
+    Case("detail", "GET", "/api/v1/platforms/?page_size=100", 6, 37),
+    Case("detail", "GET", "/api/v1/platforms/platform-0", 6, 7),
+    Case("detail", "GET", "/api/v1/collections/", 4, 11),
+    Case("detail", "GET", "/api/v1/collections/collection-0", 4, 6),
+    Case(
+        "admin",
+        "PUT",
+        "/api/v1/platforms/1",
+        14,
+        17,
+        {"description": "Updated", "category_ids": [1, 2], "tag_ids": [1], "related_platform_ids": [2]},
+    ),
+    Case("admin", "PUT", "/api/v1/collections/1", 8, 18, {"description": "Updated", "platform_ids": [1, 2, 3]}),
+    Case(None, "GET", "/api/v1/taxonomy/", 1, 1),
+    Case(None, "GET", "/api/v1/submissions/", 2, 3),
+]
+
+
+def test_relationships_raise_on_implicit_load() -> None:
+    assert RELATIONSHIP_LAZY == "raise"
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: f"{case.profile or 'columns'}-{case.method}-{case.path}")
+def test_query_count(client: TestClient, case: Case) -> None:
+    # The first call warms the in-process facet, taxonomy and search indexes.
+    assert client.request(case.method, case.path, json=case.json).status_code == 200
+
+    with count_queries() as log:
+        response = client.request(case.method, case.path, json=case.json)
+
+    assert response.status_code == 200, response.text
+    assert (log.statements, log.rows) == (case.statements, case.rows)
+
+
+def test_taxonomy_reload_query_count(client: TestClient) -> None:
+    # A new catalog version makes the taxonomy cache reload categories and tags.
+    with SessionLocal() as db:
+        bump_catalog_version(db)
+        db.commit()
+
+    with count_queries() as log:
+        response = client.get("/api/v1/taxonomy/")
+
+    assert response.status_code == 200
+    assert (log.statements, log.rows) == (3, 7)
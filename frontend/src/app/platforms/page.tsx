@@ -4,11 +4,11 @@ import { useEffect, useMemo, useState } from "react";
 import { useQuery } from "@tanstack/react-query";
 import { Loader2Icon } from "lucide-react";
 
-import { PlatformFilters } from "@/components/platform-filters";
+import { PlatformFilters, type FacetOption } from "@/components/platform-filters";
 import { PlatformCard } from "@/components/platform-card";
 import { Button } from "@/components/ui/button";
-import type { CategoryRef, TagRef } from "@/lib/api";
-import { fetchPlatforms } from "@/lib/api";
+import type { CategoryRef, FacetCount } from "@/lib/api";
+import { fetchPlatforms, fetchTaxonomy } from "@/lib/api";
 
 const PAGE_SIZE = 12;
 
@@ -43,11 +43,20 @@ export default function PlatformsPage() {
 
   const { data, isFetching, isError, error } = queryResult;
 
-  const categoriesFromMeta = useMemo<CategoryRef[]>(
-    () => data?.meta?.filters?.categories ?? [],
-    [data?.meta?.filters?.categories]
+  const { data: taxonomy } = useQuery({
+    queryKey: ["taxonomy"],
+    queryFn: fetchTaxonomy,
+    staleTime: 60_000,
+  });
+
+  const categoryOptions = useMemo(
+    () => withCounts(taxonomy?.data?.categories, data?.meta?.filters?.categories),
+    [taxonomy?.data?.categories, data?.meta?.filters?.categories]
+  );
+  const tagOptions = useMemo(
+    () => withCounts(taxonomy?.data?.tags, data?.meta?.filters?.tags),
+    [taxonomy?.data?.tags, data?.meta?.filters?.tags]
   );
-  const tagsFromMeta = useMemo<TagRef[]>(() => data?.meta?.filters?.tags ?? [], [data?.meta?.filters?.tags]);
   const pagination = data?.meta?.pagination;
   const totalPages = pagination?.pages ?? 0;
 
@@ -90,8 +99,8 @@ export default function PlatformsPage() {
   return (
     <div className="space-y-8">
       <PlatformFilters
-        categories={categoriesFromMeta}
-        tags={tagsFromMeta}
+        categories={categoryOptions}
+        tags={tagOptions}
         search={search}
         selectedCategoryIds={categories}
         selectedTagIds={tags}
@@ -107,7 +116,7 @@ export default function PlatformsPage() {
             <h2 className="text-2xl font-semibold">플랫폼 목록</h2>
             {pagination && (
               <p className="text-sm text-muted-foreground">
-                총 {pagination.total}개 플랫폼 · {pagination.page}/{Math.max(totalPages, 1)} 페이지
+                총 {pagination.total ?? 0}개 플랫폼 · {pagination.page}/{Math.max(totalPages, 1)} 페이지
               </p>
             )}
           </div>
@@ -160,6 +169,17 @@ export default function PlatformsPage() {
   );
 }
 
+function withCounts(items: CategoryRef[] | undefined, counts: FacetCount[] | undefined): FacetOption[] {
+  if (!items) {
+    return [];
+  }
+  if (!counts) {
+    return items;
+  }
+  const byId = new Map(counts.map((facet) => [facet.id, facet.count]));
+  return items.map((item) => ({ ...item, count: byId.get(item.id) ?? 0 }));
+}
+
 function EmptyState() {
   return (
     <div className="col-span-full flex flex-col items-center justify-center gap-3 rounded-2xl border border-dashed bg-muted/20 p-10 text-center text-muted-foreground">
@@ -8,12 +8,14 @@ import { Button } from "@/components/ui/button";
 import { Checkbox } from "@/components/ui/checkbox";
 import { Input } from "@/components/ui/input";
 import { Label } from "@/components/ui/label";
-import type { CategoryRef, TagRef } from "@/lib/api";
+import type { CategoryRef } from "@/lib/api";
 import { cn } from "@/lib/utils";
 
+export type FacetOption = CategoryRef & { count?: number };
+
 interface PlatformFiltersProps {
-  categories: CategoryRef[];
-  tags: TagRef[];
+  categories: FacetOption[];
+  tags: FacetOption[];
   search: string;
   selectedCategoryIds: number[];
   selectedTagIds: number[];
@@ -129,7 +131,7 @@ export function PlatformFilters({
 interface FilterGroupProps {
   title: string;
   emptyLabel: string;
-  items: Array<{ id: number; name: string }>;
+  items: FacetOption[];
   selectedIds: number[];
   onToggle: (id: number) => void;
 }
@@ -165,6 +167,9 @@ function FilterGroup({ title, emptyLabel, items, selectedIds, onToggle }: Filter
                 aria-label={`${title} ${item.name}`}
               />
               <span className="text-sm font-medium">{item.name}</span>
+              {item.count !== undefined && (
+                <span className="ml-auto text-xs text-muted-foreground">{item.count}</span>
+              )}
             </label>
           );
         })}
@@ -8,6 +8,7 @@ export interface AnalyticsEventPayload {
   entity_id: number;
   event_type: AnalyticsEventType;
   occurred_at?: string;
+  visitor_id?: string;
   metadata?: Record<string, string>;
 }
 
@@ -15,6 +16,7 @@ export interface DailyMetricPoint {
   date: string;
   views: number;
   clicks: number;
+  unique_visitors: number | null;
 }
 
 export interface TopCollectionMetric {
@@ -24,24 +26,103 @@ export interface TopCollectionMetric {
   views: number;
   clicks: number;
   trending_score: number;
+  unique_visitors: number | null;
 }
 
 export interface AnalyticsDashboardData {
+  granularity: "day" | "week" | "month";
   daily: DailyMetricPoint[];
   top_collections: TopCollectionMetric[];
 }
 
 export interface AnalyticsDashboardResponse extends ApiResponse<AnalyticsDashboardData> {}
 
-export async function logAnalyticsEvent(payload: AnalyticsEventPayload): Promise<void> {
-  await fetch(`${API_BASE_URL}/analytics/events`, {
+const VISITOR_ID_STORAGE_KEY = "platlas:visitor-id";
+const EVENT_BATCH_SIZE = 50;
+const EVENT_FLUSH_DELAY_MS = 2000;
+
+let pendingEvents: AnalyticsEventPayload[] = [];
+let flushTimer: number | null = null;
+let unloadListenerRegistered = false;
+
+let visitorId: string | null = null;
+
+function getVisitorId(): string | undefined {
+  if (visitorId) {
+    return visitorId;
+  }
+  try {
+    visitorId = window.localStorage.getItem(VISITOR_ID_STORAGE_KEY);
+    if (!visitorId) {
+      visitorId = window.crypto.randomUUID();
+      window.localStorage.setItem(VISITOR_ID_STORAGE_KEY, visitorId);
+    }
+    return visitorId;
+  } catch {
+    return undefined;
+  }
+}
+
+function sendEventBatch(events: AnalyticsEventPayload[]): Promise<void> {
+  return fetch(`${API_BASE_URL}/analytics/events:batch`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
-    body: JSON.stringify(payload),
+    body: JSON.stringify(events),
     keepalive: true,
+  }).then(() => undefined);
+}
+
+export async function flushAnalyticsEvents(): Promise<void> {
+  if (flushTimer !== null) {
+    window.clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  if (pendingEvents.length === 0) {
+    return;
+  }
+  const events = pendingEvents;
+  pendingEvents = [];
+  await sendEventBatch(events);
+}
+
+function registerUnloadFlush() {
+  if (unloadListenerRegistered) {
+    return;
+  }
+  unloadListenerRegistered = true;
+  const flushOnHide = () => {
+    void flushAnalyticsEvents();
+  };
+  window.addEventListener("pagehide", flushOnHide);
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") {
+      flushOnHide();
+    }
   });
 }
 
+export async function logAnalyticsEvent(payload: AnalyticsEventPayload): Promise<void> {
+  if (typeof window === "undefined") {
+    return;
+  }
+  registerUnloadFlush();
+  pendingEvents.push({
+    ...payload,
+    occurred_at: payload.occurred_at ?? new Date().toISOString(),
+    visitor_id: payload.visitor_id ?? getVisitorId(),
+  });
+
+  if (pendingEvents.length >= EVENT_BATCH_SIZE) {
+    await flushAnalyticsEvents();
+    return;
+  }
+  if (flushTimer === null) {
+    flushTimer = window.setTimeout(() => {
+      void flushAnalyticsEvents();
+    }, EVENT_FLUSH_DELAY_MS);
+  }
+}
+
 export async function fetchAnalyticsDashboard(
   days = 14,
   topLimit = 5
@@ -37,25 +37,42 @@ export interface Platform {
 export interface PaginationMeta {
   page: number;
   page_size: number;
-  total: number;
-  pages: number;
+  total: number | null;
+  pages: number | null;
+  next_cursor?: string | null;
+}
+
+export interface FacetCount {
+  id: number;
+  count: number;
 }
 
 export interface PlatformsMeta {
   pagination: PaginationMeta;
   filters: {
-    categories: CategoryRef[];
-    tags: TagRef[];
+    categories: FacetCount[];
+    tags: FacetCount[];
   };
 }
 
+export interface Taxonomy {
+  version: number;
+  categories: CategoryRef[];
+  tags: TagRef[];
+}
+
+export interface TaxonomyResponse extends ApiResponse<Taxonomy> {}
+
 export interface PlatformsResponse extends ApiResponse<Platform[]> {
   meta?: PlatformsMeta;
 }
 
 export interface PlatformDetailResponse extends ApiResponse<Platform> {}
 
+export type ListView = "summary" | "card" | "full";
+
 export interface PlatformListQuery {
+  view?: ListView;
   search?: string;
   categoryIds?: number[];
   tagIds?: number[];
@@ -92,6 +109,7 @@ export interface CollectionsResponse extends ApiResponse<Collection[]> {}
 export interface CollectionDetailResponse extends ApiResponse<Collection> {}
 
 export interface CollectionListQuery {
+  view?: ListView;
   onlyPublic?: boolean;
   featured?: boolean;
   limit?: number;
@@ -99,6 +117,9 @@ export interface CollectionListQuery {
 
 export async function fetchPlatforms(query: PlatformListQuery): Promise<PlatformsResponse> {
   const params = new URLSearchParams();
+  if (query.view) {
+    params.set("view", query.view);
+  }
   if (query.search) {
     params.set("search", query.search);
   }
@@ -110,6 +131,8 @@ export async function fetchPlatforms(query: PlatformListQuery): Promise<Platform
   if (query.pageSize) {
     params.set("page_size", query.pageSize.toString());
   }
+  // Category and tag names come from fetchTaxonomy; only facet counts are needed here.
+  params.set("include_taxonomy", "false");
 
   const queryString = params.toString();
   const response = await fetch(
@@ -126,6 +149,17 @@ export async function fetchPlatforms(query: PlatformListQuery): Promise<Platform
   return (await response.json()) as PlatformsResponse;
 }
 
+export async function fetchTaxonomy(): Promise<TaxonomyResponse> {
+  // The endpoint sends an ETag, so the browser revalidates with If-None-Match.
+  const response = await fetch(`${API_BASE_URL}/taxonomy`, { cache: "no-cache" });
+
+  if (!response.ok) {
+    throw new Error("카테고리와 태그를 불러오지 못했습니다.");
+  }
+
+  return (await response.json()) as TaxonomyResponse;
+}
+
 export async function fetchPlatformDetail(slug: string): Promise<PlatformDetailResponse> {
   const response = await fetch(`${API_BASE_URL}/platforms/${slug}`, {
     next: { revalidate: 0 }
@@ -140,6 +174,9 @@ export async function fetchPlatformDetail(slug: string): Promise<PlatformDetailR
 
 export async function fetchCollections(query: CollectionListQuery = {}): Promise<CollectionsResponse> {
   const params = new URLSearchParams();
+  if (query.view) {
+    params.set("view", query.view);
+  }
   if (query.onlyPublic === false) {
     params.set("only_public", "false");
   }